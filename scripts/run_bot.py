@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# ABOUTME: Runs scripted bot routes against the real game loop without a window
+# ABOUTME: e.g. pace Route 1 grass fleeing battles until 100 encounters, then report frames/sec
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Allow running as `python scripts/run_bot.py` from the project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.engine.bot import BotController  # noqa: E402
+
+
+def run_encounters(args):
+    """Pace on grass, fleeing every wild battle, until enough encounters."""
+    bot = BotController(seed=args.seed)
+    bot.start_overworld(args.map, args.x, args.y)
+
+    start = time.perf_counter()
+    encounters = bot.farm_encounters(args.count, axis=args.axis, max_frames=args.max_frames)
+    elapsed = time.perf_counter() - start
+
+    map_name, tile_x, tile_y = bot.player_tile
+    print(f"Encounters: {encounters}/{args.count}")
+    print(f"Frames: {bot.frames} ({bot.frames / max(elapsed, 1e-9):.0f} frames/sec, {elapsed:.2f}s)")
+    print(f"Player: {map_name} ({tile_x}, {tile_y})")
+    for pokemon in bot.party:
+        print(f"  {pokemon['species'].upper()} L{pokemon['level']} {pokemon['hp']}/{pokemon['max_hp']} HP")
+    bot.close()
+    return 0 if encounters >= args.count else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run scripted bot routes headlessly.")
+    subparsers = parser.add_subparsers(dest="scenario", required=True)
+
+    encounters = subparsers.add_parser(
+        "encounters",
+        help="Walk back and forth in grass until N wild encounters."
+    )
+    encounters.add_argument("--map", default="assets/maps/route_1.tmx", help="Map to start on.")
+    encounters.add_argument("--x", type=int, default=-1, help="Start tile X (default: map start).")
+    encounters.add_argument("--y", type=int, default=-1, help="Start tile Y (default: map start).")
+    encounters.add_argument("--count", type=int, default=100, help="Encounters to collect.")
+    encounters.add_argument(
+        "--axis",
+        choices=("horizontal", "vertical"),
+        default="horizontal",
+        help="Pace left/right or up/down."
+    )
+    encounters.add_argument("--max-frames", type=int, default=1_000_000, help="Frame limit.")
+    encounters.add_argument("--seed", type=int, default=None, help="RNG seed.")
+    encounters.set_defaults(handler=run_encounters)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+# ABOUTME: Immutable battle position values for search-based AI
+# ABOUTME: Shares unchanged members between updates and hashes stably with BLAKE2b
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import struct
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.battle.pokemon import Pokemon, PokemonStats
+from src.battle.species import Species
+from src.battle.stat_stages import StatStages
+from src.battle.status_effects import StatusCondition
+
+
+STAGE_NAMES = ("attack", "defense", "speed", "special", "accuracy", "evasion")
+_DIGEST_SIZE = 16
+# level, five stats, current HP, status turns, six stat stages, PP entry count
+_MEMBER_FIELDS = struct.Struct("<B5HHh6bB")
+_PP_ENTRY = struct.Struct("<BB")
+
+
+def _digest(*parts: bytes) -> bytes:
+    return hashlib.blake2b(b"".join(parts), digest_size=_DIGEST_SIZE).digest()
+
+
+def _normalize_status(status: Optional[StatusCondition]) -> Optional[StatusCondition]:
+    return None if status == StatusCondition.NONE else status
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonPosition:
+    """
+    Battle-relevant state of one Pokemon as an immutable value.
+
+    Updates return a new PokemonPosition; species, stats and IVs are shared,
+    not copied. Equality and digest() cover what changes in battle plus the
+    species, level and stats.
+    """
+    species: Species = field(compare=False, repr=False)
+    species_id: str
+    level: int
+    stats: tuple[int, int, int, int, int]  # hp, attack, defense, special, speed
+    current_hp: int
+    status: Optional[StatusCondition] = None
+    status_turns: int = 0
+    stages: tuple[int, ...] = (0, 0, 0, 0, 0, 0)  # in STAGE_NAMES order
+    pp: tuple[tuple[str, int, int], ...] = ()  # (move_id, current, max) in move order
+    ivs: tuple[int, int, int, int, int] = field(default=(0, 0, 0, 0, 0), compare=False, repr=False)
+    _digest: Optional[bytes] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Pokemon) -> "PokemonPosition":
+        """Snapshot a live Pokemon."""
+        stats = pokemon.stats
+        stages = pokemon.stat_stages
+        move_pp = pokemon.move_pp
+        return cls(
+            species=pokemon.species,
+            species_id=pokemon.species.species_id,
+            level=pokemon.level,
+            stats=(stats.hp, stats.attack, stats.defense, stats.special, stats.speed),
+            current_hp=pokemon.current_hp,
+            status=_normalize_status(pokemon.status),
+            status_turns=pokemon.status_turns,
+            stages=(stages.attack, stages.defense, stages.speed,
+                    stages.special, stages.accuracy, stages.evasion),
+            pp=tuple(
+                (move_id, *move_pp[move_id]) if move_id in move_pp else (move_id, 0, 0)
+                for move_id in pokemon.moves
+            ),
+            ivs=(pokemon.iv_attack, pokemon.iv_defense, pokemon.iv_speed,
+                 pokemon.iv_special, pokemon.iv_hp)
+        )
+
+    @property
+    def max_hp(self) -> int:
+        return self.stats[0]
+
+    @property
+    def moves(self) -> tuple[str, ...]:
+        return tuple(move_id for move_id, _, _ in self.pp)
+
+    def is_fainted(self) -> bool:
+        return self.current_hp <= 0
+
+    def stage(self, stat: str) -> int:
+        return self.stages[STAGE_NAMES.index(stat)]
+
+    def replace(self, **changes) -> "PokemonPosition":
+        """Return a copy with fields changed (the digest is recomputed lazily)."""
+        changes.setdefault("_digest", None)
+        return dataclasses.replace(self, **changes)
+
+    def _evolve(self, current_hp: int, status: Optional[StatusCondition], status_turns: int,
+                stages: tuple[int, ...], pp: tuple[tuple[str, int, int], ...]) -> "PokemonPosition":
+        # Positional construction; dataclasses.replace is several times slower in search loops
+        return PokemonPosition(
+            self.species, self.species_id, self.level, self.stats,
+            current_hp, status, status_turns, stages, pp, self.ivs
+        )
+
+    def with_hp(self, current_hp: int) -> "PokemonPosition":
+        """Return a copy with HP clamped to 0..max HP."""
+        current_hp = max(0, min(self.max_hp, current_hp))
+        return self._evolve(current_hp, self.status, self.status_turns, self.stages, self.pp)
+
+    def with_status(self, status: Optional[StatusCondition], turns: int = 0) -> "PokemonPosition":
+        return self._evolve(self.current_hp, _normalize_status(status), turns, self.stages, self.pp)
+
+    def with_stage_change(self, stat: str, change: int) -> "PokemonPosition":
+        """Return a copy with one stat stage moved, clamped to -6..+6."""
+        index = STAGE_NAMES.index(stat)
+        stages = list(self.stages)
+        stages[index] = max(-6, min(6, stages[index] + change))
+        return self._evolve(self.current_hp, self.status, self.status_turns, tuple(stages), self.pp)
+
+    def with_pp_used(self, move_id: str) -> "PokemonPosition":
+        """Return a copy with one PP of a move spent (unchanged if none left)."""
+        pp = tuple(
+            (entry_id, max(0, current - 1), maximum) if entry_id == move_id else (entry_id, current, maximum)
+            for entry_id, current, maximum in self.pp
+        )
+        return self._evolve(self.current_hp, self.status, self.status_turns, self.stages, pp)
+
+    def digest(self) -> bytes:
+        """Stable 16-byte BLAKE2b digest, identical across processes and runs."""
+        if self._digest is None:
+            parts = [
+                self.species_id.encode("utf-8"), b"\0",
+                (self.status.value if self.status else "").encode("utf-8"), b"\0",
+                _MEMBER_FIELDS.pack(
+                    self.level, *self.stats, self.current_hp, self.status_turns, *self.stages, len(self.pp)
+                )
+            ]
+            for move_id, current, maximum in self.pp:
+                parts.append(move_id.encode("utf-8") + b"\0")
+                parts.append(_PP_ENTRY.pack(current, maximum))
+            # Frozen, so the cache is written around the dataclass guard
+            object.__setattr__(self, "_digest", _digest(*parts))
+        return self._digest
+
+    def apply_to(self, pokemon: Pokemon) -> None:
+        """Write HP, status, stages and PP back into a live Pokemon."""
+        pokemon.current_hp = self.current_hp
+        pokemon.status = self.status
+        pokemon.status_turns = self.status_turns
+        pokemon.stat_stages = StatStages(**dict(zip(STAGE_NAMES, self.stages)))
+        pokemon.moves = list(self.moves)
+        pokemon.move_pp = {move_id: (current, maximum) for move_id, current, maximum in self.pp if maximum}
+
+    def to_pokemon(self) -> Pokemon:
+        """Build a new live Pokemon from this position."""
+        attack, defense, speed, special, hp = self.ivs
+        pokemon = Pokemon.from_stored(
+            self.species,
+            self.level,
+            {"attack": attack, "defense": defense, "speed": speed, "special": special, "hp": hp},
+            list(self.moves),
+            {move_id: (current, maximum) for move_id, current, maximum in self.pp if maximum},
+            current_hp=self.current_hp,
+            status=self.status,
+            status_turns=self.status_turns,
+            stat_stages=StatStages(**dict(zip(STAGE_NAMES, self.stages)))
+        )
+        pokemon.stats = PokemonStats(*self.stats)
+        return pokemon
+
+
+@dataclass(frozen=True, slots=True)
+class SidePosition:
+    """One side's team (active member plus bench) as an immutable value."""
+    team: tuple[PokemonPosition, ...]
+    active_index: int = 0
+    _digest: Optional[bytes] = field(default=None, compare=False, repr=False)
+
+    @property
+    def active(self) -> PokemonPosition:
+        return self.team[self.active_index]
+
+    @property
+    def bench(self) -> tuple[PokemonPosition, ...]:
+        return tuple(member for index, member in enumerate(self.team) if index != self.active_index)
+
+    def with_member(self, index: int, member: PokemonPosition) -> "SidePosition":
+        """Return a copy with one member replaced; the others are shared."""
+        team = self.team[:index] + (member,) + self.team[index + 1:]
+        return SidePosition(team, self.active_index)
+
+    def with_active(self, member: PokemonPosition) -> "SidePosition":
+        return self.with_member(self.active_index, member)
+
+    def switched_to(self, index: int) -> "SidePosition":
+        return SidePosition(self.team, index)
+
+    def has_alive(self) -> bool:
+        return any(not member.is_fainted() for member in self.team)
+
+    def digest(self) -> bytes:
+        if self._digest is None:
+            object.__setattr__(self, "_digest", _digest(
+                bytes((self.active_index, len(self.team))),
+                *(member.digest() for member in self.team)
+            ))
+        return self._digest
+
+
+@dataclass(frozen=True, slots=True)
+class BattlePosition:
+    """
+    Both sides of a battle as an immutable, hashable value.
+
+    Updating one Pokemon rebuilds only its PokemonPosition, its side's team
+    tuple and this wrapper, so search can branch thousands of times per
+    decision without deep copies. digest() composes cached member digests,
+    making it a stable transposition-table key; hash() is derived from it.
+    """
+    player: SidePosition
+    enemy: SidePosition
+    _digest: Optional[bytes] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_battle(cls, battle) -> "BattlePosition":
+        """
+        Snapshot a BattleState.
+
+        The player's side is the party (or just the active Pokemon when the
+        battle has no party); the enemy's is the active Pokemon followed by
+        trainer_pokemon_remaining.
+        """
+        player_team = cls._player_team(battle)
+        enemy_team = cls._enemy_team(battle)
+        return cls(
+            SidePosition(
+                tuple(PokemonPosition.from_pokemon(pokemon) for pokemon in player_team),
+                cls._player_active_index(battle, player_team)
+            ),
+            SidePosition(tuple(PokemonPosition.from_pokemon(pokemon) for pokemon in enemy_team), 0)
+        )
+
+    @staticmethod
+    def _player_team(battle) -> list[Pokemon]:
+        party = getattr(battle, "party", None)
+        if party is not None and battle.player_pokemon in party.pokemon:
+            return list(party.pokemon)
+        return [battle.player_pokemon]
+
+    @staticmethod
+    def _player_active_index(battle, player_team: list[Pokemon]) -> int:
+        return next(
+            (index for index, pokemon in enumerate(player_team) if pokemon is battle.player_pokemon),
+            0
+        )
+
+    @staticmethod
+    def _enemy_team(battle) -> list[Pokemon]:
+        return [battle.enemy_pokemon, *getattr(battle, "trainer_pokemon_remaining", [])]
+
+    def apply_to_battle(self, battle) -> None:
+        """
+        Write this position back into the live Pokemon of a BattleState.
+
+        Only Pokemon state is written; which Pokemon is out is not, since
+        switching also has to update the battle's HP bars, sprites and move
+        menu (see BattleState.handle_switch).
+
+        Raises:
+            ValueError: If either side's active Pokemon differs from the battle's
+        """
+        player_team = self._player_team(battle)
+        if self.player.active_index != self._player_active_index(battle, player_team):
+            raise ValueError("Position has a different active player Pokemon than the battle")
+        if self.enemy.active_index != 0:
+            raise ValueError("Position has a different active enemy Pokemon than the battle")
+        for position, pokemon in zip(self.player.team, player_team):
+            position.apply_to(pokemon)
+        for position, pokemon in zip(self.enemy.team, self._enemy_team(battle)):
+            position.apply_to(pokemon)
+
+    def side(self, name: str) -> SidePosition:
+        return self.player if name == "player" else self.enemy
+
+    def with_side(self, name: str, side: SidePosition) -> "BattlePosition":
+        """Return a copy with one side replaced; the other is shared."""
+        if name == "player":
+            return BattlePosition(side, self.enemy)
+        return BattlePosition(self.player, side)
+
+    def with_active(self, name: str, member: PokemonPosition) -> "BattlePosition":
+        """Return a copy with one side's active Pokemon replaced."""
+        return self.with_side(name, self.side(name).with_active(member))
+
+    def digest(self) -> bytes:
+        if self._digest is None:
+            object.__setattr__(self, "_digest", _digest(self.player.digest(), self.enemy.digest()))
+        return self._digest
+
+    def __hash__(self) -> int:
+        return int.from_bytes(self.digest()[:8], "little")
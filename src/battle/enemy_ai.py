@@ -0,0 +1,397 @@
+# ABOUTME: Pluggable enemy move selection for trainer battles
+# ABOUTME: Tiers range from Gen 1 random picks to an expectiminimax search spread across ticks
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Optional
+
+from src.battle.battle_position import BattlePosition, SidePosition
+from src.battle.turn_resolver import DeadlineExceeded, TurnResolver, critical_chance, damage_rolls, hit_chance
+from src.battle.type_chart import get_type_chart
+
+
+DEFAULT_ENEMY_AI_TIER = "first"
+# Work per tick; a cold turn branch or scored outcome takes ~20-30us, so a
+# tick spends about 3ms searching
+DEFAULT_BRANCHES_PER_TICK = 128
+_WIN_SCORE = 1000.0
+
+
+class EnemyAI:
+    """Chooses the enemy's move each turn; subclasses implement a tier."""
+
+    def choose_move(self, battle) -> str:
+        """
+        Pick the enemy's move for this turn.
+
+        Args:
+            battle: BattleState (or anything with the same Pokemon attributes)
+
+        Returns:
+            Move id from the enemy's active Pokemon's moves
+        """
+        raise NotImplementedError
+
+    def think(self, battle) -> None:
+        """
+        Spend one tick working ahead while the player picks a command.
+
+        Args:
+            battle: BattleState whose current position the next move is for
+        """
+
+    def request_move(self, battle) -> Optional[str]:
+        """
+        Ask for the enemy's move, one tick at a time.
+
+        Args:
+            battle: BattleState (or anything with the same Pokemon attributes)
+
+        Returns:
+            Move id once decided, or None if the AI needs more ticks; call
+            again next tick until it answers
+        """
+        return self.choose_move(battle)
+
+
+class FirstMoveAI(EnemyAI):
+    """Always uses the first move (the behavior before tiers existed)."""
+
+    def choose_move(self, battle) -> str:
+        return battle.enemy_pokemon.moves[0]
+
+
+class RandomMoveAI(EnemyAI):
+    """Gen 1 faithful: a uniformly random move with PP left, drawn from the game RNG."""
+
+    def choose_move(self, battle) -> str:
+        pokemon = battle.enemy_pokemon
+        # Same rule as TurnResolver.usable_moves: every known move if none has PP
+        usable = [move_id for move_id in pokemon.moves if pokemon.get_move_pp(move_id)[0] > 0]
+        return random.choice(usable or pokemon.moves)
+
+
+class SearchAI(EnemyAI):
+    """
+    Depth-limited expectiminimax over TurnResolver, spread across ticks.
+
+    Each turn is a max node over enemy moves, a min node over player moves
+    and a chance node over TurnResolver outcomes weighted by their
+    probabilities. Iterative deepening runs depth 1, 2, ... up to max_depth.
+
+    think() and request_move() run the search in slices of about
+    branches_per_tick turn branches (see TurnResolver.resolve_steps; each
+    turn looked up counts as one more), so a deep search never stalls a
+    frame: BattleState thinks while the player picks a command and waits on
+    request_move() for whatever is left. Work is counted in branches rather
+    than time, so a decision takes the same ticks and gives the same answer
+    on every run, which keeps seeded runs, input replays and savestates
+    reproducible.
+
+    Values go in a transposition table keyed by BattlePosition.digest(). A
+    search writes to it only when it finishes, so a savestate taken mid
+    search restarts from the same table and repeats the same work.
+    Resolved turns are cached in the TurnResolver; both carry over between
+    turns.
+
+    budget_ms optionally caps the time spent on one decision, keeping the
+    deepest fully searched answer (or a greedy expected-damage pick) when it
+    runs out. How far a capped search gets varies between runs, so leave it
+    unset when runs must be reproducible.
+    """
+
+    def __init__(
+        self,
+        max_depth: int,
+        roll_buckets: Optional[int] = None,
+        table_limit: int = 50000,
+        branches_per_tick: int = DEFAULT_BRANCHES_PER_TICK,
+        budget_ms: Optional[float] = None
+    ):
+        """
+        Args:
+            max_depth: Deepest search in turns
+            roll_buckets: Non-lethal damage groups per attack (see
+                TurnResolver); None searches every damage roll exactly
+            table_limit: Transposition table (and resolved turn) entries kept
+                before it is cleared
+            branches_per_tick: Work per think()/request_move() call
+            budget_ms: Optional wall-clock cap per decision in milliseconds
+        """
+        self.max_depth = max_depth
+        self.roll_buckets = roll_buckets
+        self.table_limit = table_limit
+        self.branches_per_tick = branches_per_tick
+        self.budget_ms = budget_ms
+        self.table: dict[bytes, tuple[int, float]] = {}
+        self.completed_depth = 0
+        self._resolver: Optional[TurnResolver] = None
+        self._moves: dict = {}
+        # The decision in progress: its root, the search generator, values
+        # it has found so far, work done and allowed, its answer and any
+        # time left under budget_ms
+        self._root: Optional[BattlePosition] = None
+        self._search = None
+        self._found: dict[bytes, tuple[int, float]] = {}
+        self._work = 0
+        self._allowance = 0
+        self._result: Optional[str] = None
+        self._time_left: Optional[float] = None
+        # Load the type chart now rather than inside the first search
+        get_type_chart()
+
+    def __getstate__(self) -> dict:
+        # Generators can't be pickled; a restored search starts over from
+        # the table and catches up to its allowance on the next slice.
+        # Resolved turns are a cache and are rebuilt on demand.
+        state = self.__dict__.copy()
+        state["_resolver"] = None
+        state["_search"] = None
+        state["_found"] = {}
+        state["_work"] = 0
+        return state
+
+    def choose_move(self, battle) -> str:
+        self._prepare(battle)
+        return self._finish()
+
+    def think(self, battle) -> None:
+        self._slice(battle)
+
+    def request_move(self, battle) -> Optional[str]:
+        move_id = self._slice(battle)
+        if move_id is not None:
+            # The next request is for a new turn, even if nothing changed
+            self._root = None
+        return move_id
+
+    def choose_from_position(self, position: BattlePosition, moves: dict) -> str:
+        """
+        Pick the enemy's move for a position, searching to completion.
+
+        Args:
+            position: Current battle position
+            moves: Move definitions for every move on either team
+
+        Returns:
+            Chosen enemy move id
+        """
+        self._start(position, moves)
+        return self._finish()
+
+    def _prepare(self, battle) -> None:
+        """Start a search for the battle's position unless one is already under way."""
+        position = BattlePosition.from_battle(battle)
+        if self._root is not None and self._root.digest() == position.digest():
+            return
+        known = self._moves
+        moves = {}
+        for side in (position.player, position.enemy):
+            for member in side.team:
+                for move_id in member.moves:
+                    if move_id not in moves:
+                        moves[move_id] = known.get(move_id) or battle.move_loader.get_move(move_id)
+        self._start(position, moves)
+
+    def _start(self, position: BattlePosition, moves: dict) -> None:
+        self._moves.update(moves)
+        if self._resolver is not None:
+            self._resolver.moves.update(moves)
+        if len(self.table) > self.table_limit:
+            self.table.clear()
+        self._root = position
+        self._search = None
+        self._found = {}
+        self._work = 0
+        self._allowance = 0
+        self._result = None
+        self._time_left = self.budget_ms / 1000 if self.budget_ms is not None else None
+        self.completed_depth = 0
+
+    def _slice(self, battle) -> Optional[str]:
+        self._prepare(battle)
+        if self._result is None:
+            self._allowance += self.branches_per_tick
+            self._run()
+        return self._result
+
+    def _finish(self) -> str:
+        if self._result is None:
+            self._allowance = float("inf")
+            self._run()
+        move_id, self._root = self._result, None
+        return move_id
+
+    def _run(self) -> None:
+        """Continue the search until it finishes or uses up its allowance."""
+        if self._resolver is None:
+            self._resolver = TurnResolver(dict(self._moves), self.roll_buckets, self.table_limit)
+        if self._search is None:
+            self._found = {}
+            self._work = 0
+            self._search = self._search_root(self._root)
+        started = time.perf_counter()
+        self._resolver.deadline = None if self._time_left is None else started + self._time_left
+        try:
+            next(self._search)
+        except StopIteration as stop:
+            self._result = stop.value
+            self._search = None
+            self.table.update(self._found)
+            self._found = {}
+        if self._time_left is not None:
+            self._time_left -= time.perf_counter() - started
+
+    def _search_root(self, position: BattlePosition):
+        enemy_moves = self._resolver.usable_moves(position.enemy.active)
+        enemy_moves.sort(key=lambda move_id: -self._expected_damage(position, move_id))
+        best_move = enemy_moves[0]
+        if len(enemy_moves) == 1:
+            return best_move
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                scores = yield from self._root_scores(position, enemy_moves, depth)
+            except DeadlineExceeded:
+                break
+            # Search the previous best first next time for earlier cutoffs
+            enemy_moves.sort(key=lambda move_id: -scores[move_id])
+            best_move = enemy_moves[0]
+            self.completed_depth = depth
+        return best_move
+
+    def _expected_damage(self, position: BattlePosition, move_id: str) -> float:
+        move = self._resolver.moves[move_id]
+        attacker, defender = position.enemy.active, position.player.active
+        if not move.power:
+            return 0.0
+        critical = critical_chance(attacker, move)
+        normal, doubled = damage_rolls(attacker, defender, move), damage_rolls(attacker, defender, move, True)
+        average = (
+            (1 - critical) * sum(normal) / len(normal)
+            + critical * sum(doubled) / len(doubled)
+        )
+        return hit_chance(attacker, defender, move) * min(average, defender.current_hp)
+
+    def _root_scores(self, position: BattlePosition, enemy_moves: list[str], depth: int):
+        scores = {}
+        best = float("-inf")
+        for enemy_move in enemy_moves:
+            # Moves cut off early score at most best, so they still sort below it
+            scores[enemy_move] = yield from self._worst_reply(position, enemy_move, depth, best)
+            best = max(best, scores[enemy_move])
+        return scores
+
+    def _worst_reply(self, position: BattlePosition, enemy_move: str, depth: int, floor: float):
+        """Min over player replies; stops once it cannot beat floor."""
+        worst = float("inf")
+        for player_move in self._resolver.usable_moves(position.player.active):
+            deadline = self._resolver.deadline
+            if deadline is not None and time.perf_counter() > deadline:
+                raise DeadlineExceeded()
+            outcomes = yield from self._paced(self._resolver.resolve_steps(position, player_move, enemy_move))
+            expected = 0.0
+            for probability, outcome in outcomes:
+                value = self._known_value(outcome, depth - 1)
+                if value is None:
+                    value = yield from self._value(outcome, depth - 1)
+                else:
+                    # Scoring outcomes counts too; one turn can have hundreds
+                    self._work += 1
+                    while self._work > self._allowance:
+                        yield
+                expected += probability * value
+            worst = min(worst, expected)
+            if worst <= floor:
+                break
+        return worst
+
+    def _paced(self, steps):
+        """Run TurnResolver.resolve_steps, pausing whenever the allowance is used up."""
+        work = 1
+        while True:
+            self._work += work
+            while self._work > self._allowance:
+                yield
+            try:
+                work = next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def _known_value(self, position: BattlePosition, depth: int) -> Optional[float]:
+        """A position's value without searching, or None if it needs a search."""
+        if not position.enemy.has_alive():
+            return -_WIN_SCORE
+        if not position.player.has_alive():
+            return _WIN_SCORE
+        if depth <= 0:
+            return evaluate(position)
+        key = position.digest()
+        cached = self._found.get(key) or self.table.get(key)
+        if cached is not None and cached[0] >= depth:
+            return cached[1]
+        return None
+
+    def _value(self, position: BattlePosition, depth: int):
+        best = float("-inf")
+        for enemy_move in self._resolver.usable_moves(position.enemy.active):
+            best = max(best, (yield from self._worst_reply(position, enemy_move, depth, best)))
+        self._found[position.digest()] = (depth, best)
+        return best
+
+
+def _side_score(side: SidePosition) -> float:
+    score = 0.0
+    for member in side.team:
+        if member.is_fainted():
+            continue
+        score += 1.0 + member.current_hp / member.max_hp
+        if member.status is not None:
+            score -= 0.25
+    # Every stat stage counts the same, so sum them without looking up names
+    return score + 0.05 * sum(side.active.stages)
+
+
+def evaluate(position: BattlePosition) -> float:
+    """Static score from the enemy's point of view (higher is better for the enemy)."""
+    return _side_score(position.enemy) - _side_score(position.player)
+
+
+# greedy and smart group each attack's damage rolls into two buckets to keep
+# their trees small; strong searches every roll exactly, at depth 2 since an
+# exact third turn multiplies the work about tenfold. Cold searches (empty
+# tables) of a three-vs-two trainer battle finish in 1, 8 and 46 ticks
+# (~2, 22 and 130ms of work); later turns reuse the tables.
+ENEMY_AI_TIERS = {
+    "first": FirstMoveAI,
+    "faithful": RandomMoveAI,
+    "greedy": lambda: SearchAI(max_depth=1, roll_buckets=2),
+    "smart": lambda: SearchAI(max_depth=2, roll_buckets=2),
+    "strong": lambda: SearchAI(max_depth=2),
+}
+
+
+def create_enemy_ai(tier: str = DEFAULT_ENEMY_AI_TIER, budget_ms: Optional[float] = None) -> EnemyAI:
+    """
+    Build the enemy AI for a difficulty tier.
+
+    Args:
+        tier: One of ENEMY_AI_TIERS ("first", "faithful", "greedy", "smart", "strong")
+        budget_ms: Wall-clock cap per decision for the search tiers; None
+            keeps them deterministic
+
+    Returns:
+        A fresh EnemyAI
+
+    Raises:
+        ValueError: If the tier is unknown
+    """
+    factory = ENEMY_AI_TIERS.get(tier)
+    if factory is None:
+        raise ValueError(f"Unknown enemy AI tier: {tier}")
+    enemy_ai = factory()
+    if isinstance(enemy_ai, SearchAI):
+        enemy_ai.budget_ms = budget_ms
+    return enemy_ai
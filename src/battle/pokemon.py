@@ -1,15 +1,17 @@
 # ABOUTME: Pokemon instance class for individual Pokemon
-# ABOUTME: Handles stats calculation, moves, and battle state
+# ABOUTME: Handles stats calculation, moves, and battle state in a compact slotted layout
 
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import MutableMapping, MutableSequence
+from dataclasses import dataclass
 from src.battle.species import Species
 from src.battle.status_effects import StatusCondition
 from src.battle.stat_stages import StatStages
-from typing import Optional
+from typing import Iterator, Optional
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonStats:
     """Calculated stats for a Pokemon instance."""
     hp: int
@@ -19,8 +21,147 @@ class PokemonStats:
     speed: int
 
 
+# Pokemon._data layout: five IVs, then (current, max) PP per entry in moves
+_IV_ATTACK, _IV_DEFENSE, _IV_SPEED, _IV_SPECIAL, _IV_HP = range(5)
+_PP_OFFSET = 5
+
+
+def _iv_property(index: int, name: str) -> property:
+    def get(self) -> int:
+        return self._data[index]
+
+    def set(self, value: int) -> None:
+        if not 0 <= value <= 15:
+            raise ValueError(f"{name} IV must be 0-15, got {value}")
+        self._data[index] = value
+
+    return property(get, set, doc=f"{name} IV (0-15)")
+
+
+class MovePP(MutableMapping):
+    """
+    Live move_id -> (current, max) view of a Pokemon's PP.
+
+    PP lives in the Pokemon's array, one slot per entry in moves, so only
+    known moves can be set; a slot with max PP 0 counts as absent.
+    """
+
+    __slots__ = ("_pokemon",)
+
+    def __init__(self, pokemon: "Pokemon"):
+        self._pokemon = pokemon
+
+    def __getitem__(self, move_id: str) -> tuple[int, int]:
+        data = self._pokemon._data
+        index = self._pokemon._pp_index(move_id)
+        if data[index + 1] == 0:
+            raise KeyError(move_id)
+        return (data[index], data[index + 1])
+
+    def __setitem__(self, move_id: str, value: tuple[int, int]) -> None:
+        current, maximum = value
+        if not (0 <= current <= 255 and 0 <= maximum <= 255):
+            raise ValueError(f"PP for {move_id} must be 0-255, got {value}")
+        index = self._pokemon._pp_index(move_id)
+        self._pokemon._data[index:index + 2] = array("B", (current, maximum))
+
+    def __delitem__(self, move_id: str) -> None:
+        self[move_id]  # KeyError if absent
+        index = self._pokemon._pp_index(move_id)
+        self._pokemon._data[index:index + 2] = array("B", (0, 0))
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._pokemon._data
+        for slot, move_id in enumerate(self._pokemon._moves):
+            index = _PP_OFFSET + 2 * slot
+            if index + 1 < len(data) and data[index + 1]:
+                yield move_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"MovePP({dict(self.items())!r})"
+
+
+class MoveList(MutableSequence):
+    """
+    Live list view of a Pokemon's known move IDs.
+
+    Edits go through the Pokemon's moves setter, so every remaining move
+    keeps its PP slot and a newly added move starts without PP. Compares
+    equal to a list of the same move IDs.
+    """
+
+    __slots__ = ("_pokemon",)
+
+    def __init__(self, pokemon: "Pokemon"):
+        self._pokemon = pokemon
+
+    def __getitem__(self, index):
+        return self._pokemon._moves[index]
+
+    def __setitem__(self, index, value) -> None:
+        moves = list(self._pokemon._moves)
+        moves[index] = value
+        self._pokemon.moves = moves
+
+    def __delitem__(self, index) -> None:
+        moves = list(self._pokemon._moves)
+        del moves[index]
+        self._pokemon.moves = moves
+
+    def insert(self, index: int, value: str) -> None:
+        moves = list(self._pokemon._moves)
+        moves.insert(index, value)
+        self._pokemon.moves = moves
+
+    def __len__(self) -> int:
+        return len(self._pokemon._moves)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MoveList):
+            other = other._pokemon._moves
+        if isinstance(other, list):
+            return self._pokemon._moves == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"MoveList({self._pokemon._moves!r})"
+
+
 class Pokemon:
-    """Individual Pokemon instance (not species)."""
+    """
+    Individual Pokemon instance (not species).
+
+    Instances use __slots__ and keep IVs and PP in one small unsigned byte
+    array (see _IV_* and _PP_OFFSET), so large simulations don't pay for a
+    per-instance dict. iv_*, moves and move_pp are views over that state.
+    Stats and stat stages are still separate (slotted) objects, and PP is a
+    tail that grows with the move list rather than fixed slots.
+    """
+
+    __slots__ = (
+        "species",
+        "level",
+        "_data",
+        "stats",
+        "current_hp",
+        "_moves",
+        "status",
+        "status_turns",
+        "stat_stages",
+        "experience",
+        "exp_to_next_level",
+    )
+
+    iv_attack = _iv_property(_IV_ATTACK, "Attack")
+    iv_defense = _iv_property(_IV_DEFENSE, "Defense")
+    iv_speed = _iv_property(_IV_SPEED, "Speed")
+    iv_special = _iv_property(_IV_SPECIAL, "Special")
+    iv_hp = _iv_property(_IV_HP, "HP")
 
     def __init__(self, species: Species, level: int):
         """
@@ -32,6 +173,8 @@ class Pokemon:
         """
         self.species = species
         self.level = level
+        self._data = array("B", bytes(_PP_OFFSET))
+        self._moves: list[str] = []
 
         # Generate random IVs (0-15 in Gen 1)
         self.iv_attack = random.randint(0, 15)
@@ -52,7 +195,6 @@ class Pokemon:
         self.moves = self._determine_moves()
 
         # PP tracking for moves (current PP / max PP)
-        self.move_pp: dict[str, tuple[int, int]] = {}  # move_id -> (current, max)
         self._initialize_move_pp()
 
         # Status condition
@@ -67,6 +209,46 @@ class Pokemon:
         self.exp_to_next_level: int = 0
         self._update_exp_requirements()
 
+    @property
+    def moves(self) -> MoveList:
+        """Live list of known move IDs; edits keep PP aligned with each move."""
+        return MoveList(self)
+
+    @moves.setter
+    def moves(self, move_ids: list[str]) -> None:
+        # Keep each remaining move's PP in the slot that follows it
+        previous = dict(self.move_pp.items())
+        self._moves = list(move_ids)
+        del self._data[_PP_OFFSET:]
+        for move_id in self._moves:
+            self._data.extend(previous.get(move_id, (0, 0)))
+
+    @property
+    def move_pp(self) -> MovePP:
+        """Live move_id -> (current, max) mapping for known moves."""
+        return MovePP(self)
+
+    @move_pp.setter
+    def move_pp(self, pp: dict[str, tuple[int, int]]) -> None:
+        # Entries for moves this Pokemon doesn't know are dropped
+        del self._data[_PP_OFFSET:]
+        self._data.extend(bytes(2 * len(self._moves)))
+        view = MovePP(self)
+        for move_id, value in pp.items():
+            if move_id in self._moves:
+                view[move_id] = value
+
+    def _pp_index(self, move_id: str) -> int:
+        """Index of a known move's current PP in _data (KeyError if unknown)."""
+        try:
+            slot = self._moves.index(move_id)
+        except ValueError:
+            raise KeyError(move_id) from None
+        index = _PP_OFFSET + 2 * slot
+        if index + 1 >= len(self._data):
+            self._data.extend(bytes(index + 2 - len(self._data)))
+        return index
+
     def _calculate_hp_iv(self) -> int:
         """
         Calculate HP IV from other IVs (Gen 1 mechanic).
@@ -124,10 +306,11 @@ class Pokemon:
         from src.battle.move_loader import MoveLoader
         move_loader = MoveLoader()
 
+        move_pp = self.move_pp
         for move_id in self.moves:
             move = move_loader.get_move(move_id)
             max_pp = move.pp
-            self.move_pp[move_id] = (max_pp, max_pp)  # (current, max)
+            move_pp[move_id] = (max_pp, max_pp)  # (current, max)
 
     def use_move_pp(self, move_id: str) -> bool:
         """
@@ -139,10 +322,10 @@ class Pokemon:
         Returns:
             True if PP deducted, False if no PP left
         """
-        if move_id in self.move_pp:
-            current_pp, max_pp = self.move_pp[move_id]
-            if current_pp > 0:
-                self.move_pp[move_id] = (current_pp - 1, max_pp)
+        if move_id in self._moves:
+            index = self._pp_index(move_id)
+            if self._data[index] > 0:
+                self._data[index] -= 1
                 return True
         return False
 
@@ -169,17 +352,18 @@ class Pokemon:
         Returns:
             Amount of PP restored
         """
-        if move_id not in self.move_pp:
+        move_pp = self.move_pp
+        if move_id not in move_pp:
             return 0
 
-        current_pp, max_pp = self.move_pp[move_id]
+        current_pp, max_pp = move_pp[move_id]
         if amount is None:
             restore = max_pp - current_pp
-            self.move_pp[move_id] = (max_pp, max_pp)
+            move_pp[move_id] = (max_pp, max_pp)
             return restore
 
         restore = min(amount, max_pp - current_pp)
-        self.move_pp[move_id] = (current_pp + restore, max_pp)
+        move_pp[move_id] = (current_pp + restore, max_pp)
         return restore
 
     def restore_all_move_pp(self, amount: Optional[int] = None) -> int:
@@ -397,11 +581,9 @@ class Pokemon:
         if new_move_id in self.moves:
             return False
 
-        index = self.moves.index(old_move_id)
-        self.moves[index] = new_move_id
-        if old_move_id in self.move_pp:
-            del self.move_pp[old_move_id]
-
+        # The new move takes over the old move's slot (and PP slot)
+        index = self._moves.index(old_move_id)
+        self._moves[index] = new_move_id
         self._add_move(new_move_id)
         return True
 
@@ -409,8 +591,8 @@ class Pokemon:
         """Add move and initialize PP."""
         from src.battle.move_loader import MoveLoader
 
-        if move_id not in self.moves:
-            self.moves.append(move_id)
+        if move_id not in self._moves:
+            self._moves.append(move_id)
 
         move = MoveLoader().get_move(move_id)
         max_pp = move.pp
@@ -448,51 +630,109 @@ class Pokemon:
             "exp_to_next_level": self.exp_to_next_level
         }
 
+    @classmethod
+    def from_stored(
+        cls,
+        species: Species,
+        level: int,
+        ivs: dict[str, int],
+        moves: list[str],
+        move_pp: dict[str, tuple[int, int]],
+        current_hp: Optional[int] = None,
+        status: Optional[StatusCondition] = None,
+        status_turns: int = 0,
+        stat_stages: Optional[StatStages] = None,
+        experience: Optional[int] = None,
+        exp_to_next_level: Optional[int] = None
+    ) -> "Pokemon":
+        """
+        Rebuild a Pokemon from stored fields.
+
+        Unlike __init__, this makes no RNG calls, builds no loaders, and
+        computes stats once, so loading a save costs little per Pokemon.
+
+        Args:
+            species: Species data
+            level: Pokemon level
+            ivs: attack/defense/speed/special IVs, plus hp (derived if absent)
+            moves: Known move IDs
+            move_pp: move_id -> (current, max)
+            current_hp: Current HP, or full HP if None
+            status: Status condition
+            status_turns: Sleep/toxic counter
+            stat_stages: Stat stage modifiers
+            experience: Total experience, or the level's minimum if None
+            exp_to_next_level: Total experience for the next level, or
+                computed if None
+
+        Returns:
+            Restored Pokemon
+        """
+        pokemon = cls.__new__(cls)
+        pokemon.species = species
+        pokemon.level = level
+        pokemon._data = array("B", bytes(_PP_OFFSET))
+        pokemon._moves = list(moves)
+
+        pokemon.iv_attack = ivs["attack"]
+        pokemon.iv_defense = ivs["defense"]
+        pokemon.iv_speed = ivs["speed"]
+        pokemon.iv_special = ivs["special"]
+        pokemon.iv_hp = ivs["hp"] if "hp" in ivs else pokemon._calculate_hp_iv()
+
+        pokemon.stats = pokemon._calculate_stats()
+        pokemon.current_hp = pokemon.stats.hp if current_hp is None else current_hp
+
+        pokemon.move_pp = move_pp
+
+        pokemon.status = status
+        pokemon.status_turns = status_turns
+        pokemon.stat_stages = stat_stages if stat_stages is not None else StatStages()
+
+        pokemon.experience = 0 if experience is None else experience
+        if experience is None or exp_to_next_level is None:
+            pokemon._update_exp_requirements()
+        if exp_to_next_level is not None:
+            pokemon.exp_to_next_level = exp_to_next_level
+
+        return pokemon
+
     @classmethod
     def from_dict(cls, data: dict, species_loader) -> "Pokemon":
         """Deserialize a Pokemon from dictionary data."""
-        species_id = data.get("species_id", "")
-        level = data.get("level", 1)
-        species = species_loader.get_species(species_id)
-        pokemon = cls(species, level)
-
-        ivs = data.get("ivs", {})
-        pokemon.iv_attack = ivs.get("attack", pokemon.iv_attack)
-        pokemon.iv_defense = ivs.get("defense", pokemon.iv_defense)
-        pokemon.iv_speed = ivs.get("speed", pokemon.iv_speed)
-        pokemon.iv_special = ivs.get("special", pokemon.iv_special)
-        pokemon.iv_hp = ivs.get("hp", pokemon._calculate_hp_iv())
+        species = species_loader.get_species(data.get("species_id", ""))
 
-        pokemon.stats = pokemon._calculate_stats()
-        pokemon.current_hp = data.get("current_hp", pokemon.stats.hp)
+        ivs = dict(data.get("ivs", {}))
+        for key in ("attack", "defense", "speed", "special"):
+            if key not in ivs:
+                # Only incomplete hand-written saves lack IVs; roll like __init__
+                ivs[key] = random.randint(0, 15)
 
-        pokemon.moves = data.get("moves", [])
-        pokemon.move_pp = {}
-        move_pp_data = data.get("move_pp", {})
-        if move_pp_data:
-            for move_id, pp_data in move_pp_data.items():
-                pokemon.move_pp[move_id] = (pp_data.get("current", 0), pp_data.get("max", 0))
+        move_pp = {
+            move_id: (pp_data.get("current", 0), pp_data.get("max", 0))
+            for move_id, pp_data in data.get("move_pp", {}).items()
+        }
 
         status_value = data.get("status")
-        if status_value:
-            pokemon.status = StatusCondition(status_value)
-        else:
-            pokemon.status = None
-        pokemon.status_turns = data.get("status_turns", 0)
-
         stat_data = data.get("stat_stages", {})
-        pokemon.stat_stages = StatStages(
-            attack=stat_data.get("attack", 0),
-            defense=stat_data.get("defense", 0),
-            speed=stat_data.get("speed", 0),
-            special=stat_data.get("special", 0),
-            accuracy=stat_data.get("accuracy", 0),
-            evasion=stat_data.get("evasion", 0)
-        )
 
-        pokemon.experience = data.get("experience", pokemon.experience)
-        pokemon._update_exp_requirements()
-        if "exp_to_next_level" in data:
-            pokemon.exp_to_next_level = data["exp_to_next_level"]
-
-        return pokemon
+        return cls.from_stored(
+            species,
+            data.get("level", 1),
+            ivs,
+            data.get("moves", []),
+            move_pp,
+            current_hp=data.get("current_hp"),
+            status=StatusCondition(status_value) if status_value else None,
+            status_turns=data.get("status_turns", 0),
+            stat_stages=StatStages(
+                attack=stat_data.get("attack", 0),
+                defense=stat_data.get("defense", 0),
+                speed=stat_data.get("speed", 0),
+                special=stat_data.get("special", 0),
+                accuracy=stat_data.get("accuracy", 0),
+                evasion=stat_data.get("evasion", 0)
+            ),
+            experience=data.get("experience"),
+            exp_to_next_level=data.get("exp_to_next_level")
+        )
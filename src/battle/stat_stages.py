@@ -4,7 +4,21 @@
 from dataclasses import dataclass
 
 
-@dataclass
+STAT_NAMES = frozenset(("attack", "defense", "speed", "special", "accuracy", "evasion"))
+
+# Multiplier per stage, indexed by stage + 6 (see get_multiplier)
+_STAGE_MULTIPLIERS = tuple(
+    (2 + stage) / 2 if stage >= 0 else 2 / (2 - stage)
+    for stage in range(-6, 7)
+)
+
+
+def stage_multiplier(stage: int) -> float:
+    """Gen 1 multiplier for a stage in -6..+6 (see StatStages.get_multiplier)."""
+    return _STAGE_MULTIPLIERS[stage + 6]
+
+
+@dataclass(slots=True)
 class StatStages:
     """
     Track stat stage modifiers for a Pokemon in battle.
@@ -32,7 +46,7 @@ class StatStages:
         Returns:
             True if stat was changed, False if already at limit
         """
-        if not hasattr(self, stat):
+        if stat not in STAT_NAMES:
             raise ValueError(f"Invalid stat name: {stat}")
 
         current_stage = getattr(self, stat)
@@ -69,22 +83,11 @@ class StatStages:
         Returns:
             Multiplier to apply to base stat
         """
-        if not hasattr(self, stat):
+        if stat not in STAT_NAMES:
             raise ValueError(f"Invalid stat name: {stat}")
 
-        stage = getattr(self, stat)
-
-        # Gen 1 formula
-        if stage >= 0:
-            # Positive stages: (2 + stage) / 2
-            numerator = 2 + stage
-            denominator = 2
-        else:
-            # Negative stages: 2 / (2 - stage)
-            numerator = 2
-            denominator = 2 - stage
-
-        return numerator / denominator
+        # Positive stages are (2 + stage) / 2, negative ones 2 / (2 - stage)
+        return _STAGE_MULTIPLIERS[getattr(self, stat) + 6]
 
     def reset(self):
         """Reset all stat stages to 0."""
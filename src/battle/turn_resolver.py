@@ -0,0 +1,402 @@
+# ABOUTME: Headless Gen 1 turn resolution over immutable battle positions
+# ABOUTME: Enumerates each turn's outcomes with exact probabilities instead of rolling dice
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from src.battle.battle_position import BattlePosition, PokemonPosition, SidePosition
+from src.battle.move import Move
+from src.battle.stat_stages import stage_multiplier
+from src.battle.status_effects import StatusCondition
+from src.battle.type_chart import get_dual_type_effectiveness
+
+
+DAMAGE_ROLLS = range(217, 256)
+# Multi-hit moves: 2-5 hits at 3/8, 3/8, 1/8, 1/8 (see DamageCalculator.get_hit_count)
+_TWO_TO_FIVE_HITS = ((2, 3 / 8), (3, 3 / 8), (4, 1 / 8), (5, 1 / 8))
+# Sleep lasts 1-7 turns; positions use the mean rather than branching seven ways
+_SLEEP_TURNS = 4
+_AILMENTS = {
+    "paralysis": StatusCondition.PARALYSIS,
+    "burn": StatusCondition.BURN,
+    "freeze": StatusCondition.FREEZE,
+    "poison": StatusCondition.POISON,
+    "sleep": StatusCondition.SLEEP,
+    "badly-poison": StatusCondition.BADLY_POISON
+}
+
+Outcome = tuple[float, BattlePosition]
+
+
+class DeadlineExceeded(Exception):
+    """Raised by TurnResolver.resolve once its deadline has passed."""
+
+
+def _hit_distribution(move: Move) -> tuple[tuple[int, float], ...]:
+    meta = move.meta
+    if not meta or meta.min_hits is None:
+        return ((1, 1.0),)
+    if meta.min_hits == 2 and meta.max_hits == 2:
+        return ((2, 1.0),)
+    if meta.min_hits == 2 and meta.max_hits == 5:
+        return _TWO_TO_FIVE_HITS
+    return ((1, 1.0),)
+
+
+def hit_chance(attacker: PokemonPosition, defender: PokemonPosition, move: Move) -> float:
+    """Probability that DamageCalculator.check_accuracy passes."""
+    if move.accuracy is None:
+        return 1.0
+    threshold = int(
+        move.accuracy * stage_multiplier(attacker.stage("accuracy")) / stage_multiplier(defender.stage("evasion"))
+    )
+    return max(0, min(100, threshold)) / 100
+
+
+def critical_chance(attacker: PokemonPosition, move: Move) -> float:
+    """Probability that DamageCalculator.check_critical_hit passes."""
+    speed = attacker.stats[4]
+    threshold = speed / 64 if move.meta and move.meta.crit_rate > 0 else speed / 512
+    return min(threshold, 0.255)
+
+
+def _damage_factors(attacker: PokemonPosition, defender: PokemonPosition, move: Move) -> tuple[float, float]:
+    """The roll-independent parts of the damage formula: (base damage, STAB x effectiveness)."""
+    if move.is_physical():
+        attack = attacker.stats[1] * stage_multiplier(attacker.stage("attack"))
+        defense = defender.stats[2] * stage_multiplier(defender.stage("defense"))
+    else:
+        attack = attacker.stats[3] * stage_multiplier(attacker.stage("special"))
+        defense = defender.stats[3] * stage_multiplier(defender.stage("special"))
+
+    damage = (((2 * attacker.level / 5) + 2) * move.power * attack / defense) / 50 + 2
+    if attacker.status == StatusCondition.BURN and move.is_physical():
+        damage = damage // 2
+
+    species = attacker.species
+    stab = 1.5 if move.type in (species.type1, species.type2) else 1.0
+    effectiveness = get_dual_type_effectiveness(move.type, defender.species.type1, defender.species.type2)
+    return damage, stab * effectiveness
+
+
+def damage_rolls(
+    attacker: PokemonPosition,
+    defender: PokemonPosition,
+    move: Move,
+    is_critical: bool = False
+) -> list[int]:
+    """
+    DamageCalculator.calculate_damage for every random factor.
+
+    Args:
+        attacker: Attacking Pokemon
+        defender: Defending Pokemon
+        move: Move being used
+        is_critical: Whether the hit is critical
+
+    Returns:
+        One-hit damage for each roll in DAMAGE_ROLLS, in order
+    """
+    if not move.power:
+        return [0] * len(DAMAGE_ROLLS)
+    base, modifier = _damage_factors(attacker, defender, move)
+    if modifier <= 0:
+        return [0] * len(DAMAGE_ROLLS)
+    if is_critical:
+        return [max(1, int(base * modifier * (roll / 255.0) * 2)) for roll in DAMAGE_ROLLS]
+    return [max(1, int(base * modifier * (roll / 255.0))) for roll in DAMAGE_ROLLS]
+
+
+class TurnResolver:
+    """
+    Resolves one battle turn as a probability distribution over positions.
+
+    Mirrors BattleState's turn flow: priority then speed decides order,
+    status can stop a move, accuracy, critical hits, damage rolls and
+    multi-hit counts are chance events, stat changes land on the attacker,
+    only the player's PP is spent, a first-striking flinch skips the other
+    move, and burn/poison tick at the end of the turn. A fainted active
+    Pokemon is replaced by the next healthy member of its team.
+
+    Every chance event keeps its exact probability. Damage outcomes that
+    knock the defender out are merged into one branch, rolls that deal the
+    same damage share a branch, and outcomes that lead to identical
+    positions are merged by digest, so by default every damage roll is
+    searched exactly. Setting roll_buckets trades accuracy for a smaller
+    tree: the non-lethal damage values are grouped into that many
+    contiguous groups, each represented by its probability-weighted mean.
+
+    Resolved turns are cached by position digest and move pair, so a
+    search that revisits a turn (iterative deepening, the next decision)
+    doesn't enumerate it again. Setting deadline (a time.perf_counter()
+    value) makes resolve raise DeadlineExceeded part way through a turn;
+    resolve_steps lets a caller pause part way through one instead.
+    """
+
+    def __init__(self, moves: dict[str, Move], roll_buckets: Optional[int] = None, cache_limit: int = 50000):
+        """
+        Args:
+            moves: Move definitions for every move either side may use
+            roll_buckets: Non-lethal damage groups per attack; None keeps
+                every distinct damage value
+            cache_limit: Cached turns kept before the caches are cleared
+        """
+        self.moves = moves
+        self.roll_buckets = None if roll_buckets is None else max(1, roll_buckets)
+        self.cache_limit = cache_limit
+        self.deadline: Optional[float] = None
+        self._damage_cache: dict[tuple, list[tuple[float, int]]] = {}
+        self._outcome_cache: dict[tuple, list[Outcome]] = {}
+
+    def usable_moves(self, member: PokemonPosition) -> list[str]:
+        """Moves with PP left (all known moves if none have any)."""
+        known = [move_id for move_id in member.moves if move_id in self.moves]
+        usable = [move_id for move_id, current, maximum in member.pp if move_id in self.moves and current > 0]
+        return usable or known
+
+    def resolve(self, position: BattlePosition, player_move: str, enemy_move: str) -> list[Outcome]:
+        """
+        All outcomes of one turn.
+
+        Args:
+            position: Position before the turn
+            player_move: Move id the player's active Pokemon uses
+            enemy_move: Move id the enemy's active Pokemon uses
+
+        Returns:
+            (probability, position) pairs; probabilities sum to 1
+
+        Raises:
+            DeadlineExceeded: If deadline passes before the turn is resolved
+        """
+        steps = self.resolve_steps(position, player_move, enemy_move)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def resolve_steps(self, position: BattlePosition, player_move: str, enemy_move: str):
+        """
+        Generator form of resolve() for callers that spread work across ticks.
+
+        Yields the number of branches enumerated since the last yield, once
+        per outcome of the first attack, and returns resolve()'s result.
+        """
+        key = (position.digest(), player_move, enemy_move)
+        cached = self._outcome_cache.get(key)
+        if cached is not None:
+            return cached
+        if len(self._outcome_cache) > self.cache_limit:
+            self._outcome_cache.clear()
+            self._damage_cache.clear()
+
+        moves = {"player": self.moves[player_move], "enemy": self.moves[enemy_move]}
+        spent = position.player.active.with_pp_used(player_move)
+        position = position.with_active("player", spent)
+
+        outcomes: dict[bytes, list] = {}
+        for order, order_probability in self._turn_orders(position, moves):
+            first, second = order
+            for probability, after_first, flinched in self._attack(position, first, moves[first], True):
+                if self.deadline is not None and time.perf_counter() > self.deadline:
+                    raise DeadlineExceeded()
+                probability *= order_probability
+                if after_first.side(second).active.is_fainted() or flinched:
+                    branches = [(1.0, after_first, False)]
+                else:
+                    branches = self._attack(after_first, second, moves[second], False)
+                for second_probability, after_second, _ in branches:
+                    final = self._end_of_turn(after_second)
+                    entry = outcomes.get(final.digest())
+                    if entry is None:
+                        outcomes[final.digest()] = [probability * second_probability, final]
+                    else:
+                        entry[0] += probability * second_probability
+                yield len(branches)
+        resolved = [(probability, final) for probability, final in outcomes.values()]
+        self._outcome_cache[key] = resolved
+        return resolved
+
+    def _turn_orders(self, position: BattlePosition, moves: dict[str, Move]) -> list[tuple[tuple[str, str], float]]:
+        player_first = (("player", "enemy"), 1.0)
+        enemy_first = (("enemy", "player"), 1.0)
+        if moves["player"].priority != moves["enemy"].priority:
+            return [player_first if moves["player"].priority > moves["enemy"].priority else enemy_first]
+        player, enemy = position.player.active, position.enemy.active
+        player_speed = player.stats[4] * stage_multiplier(player.stage("speed"))
+        enemy_speed = enemy.stats[4] * stage_multiplier(enemy.stage("speed"))
+        if player_speed != enemy_speed:
+            return [player_first if player_speed > enemy_speed else enemy_first]
+        return [(("player", "enemy"), 0.5), (("enemy", "player"), 0.5)]
+
+    def _attack(
+        self,
+        position: BattlePosition,
+        attacker_side: str,
+        move: Move,
+        can_flinch: bool
+    ) -> list[tuple[float, BattlePosition, bool]]:
+        """Outcomes of one attack as (probability, position, flinched) triples."""
+        defender_side = "enemy" if attacker_side == "player" else "player"
+        attacker = position.side(attacker_side).active
+        results = []
+
+        # Status checks before moving (_check_status_before_move)
+        if attacker.status == StatusCondition.FREEZE:
+            return [(1.0, position, False)]
+        if attacker.status == StatusCondition.SLEEP:
+            turns = attacker.status_turns - 1
+            if turns > 0:
+                return [(1.0, position.with_active(attacker_side, attacker.with_status(attacker.status, turns)), False)]
+            attacker = attacker.with_status(None)
+            position = position.with_active(attacker_side, attacker)
+        move_probability = 1.0
+        if attacker.status == StatusCondition.PARALYSIS:
+            results.append((0.25, position, False))
+            move_probability = 0.75
+
+        defender = position.side(defender_side).active
+        accuracy = hit_chance(attacker, defender, move)
+        if accuracy < 1.0:
+            results.append((move_probability * (1.0 - accuracy), position, False))
+        if accuracy <= 0.0:
+            return results
+
+        for damage_probability, damage in self._damage_outcomes(attacker, defender, move):
+            base = move_probability * accuracy * damage_probability
+            hit_attacker = attacker
+            hit_defender = defender.with_hp(defender.current_hp - damage) if damage else defender
+            meta = move.meta
+            if meta and meta.drain > 0 and damage > 0:
+                hit_attacker = hit_attacker.with_hp(hit_attacker.current_hp + int(damage * meta.drain / 100))
+            if meta and meta.healing > 0:
+                hit_attacker = hit_attacker.with_hp(
+                    hit_attacker.current_hp + int(hit_attacker.max_hp * meta.healing / 100)
+                )
+            for change in move.stat_changes:
+                hit_attacker = hit_attacker.with_stage_change(change.stat, change.change)
+
+            hit_position = position
+            if hit_attacker is not attacker:
+                hit_position = hit_position.with_active(attacker_side, hit_attacker)
+            for ailment_probability, ailed in self._ailment_outcomes(hit_defender, move):
+                after = hit_position.with_active(defender_side, ailed) if ailed is not defender else hit_position
+                flinch = (meta.flinch_chance / 100) if (
+                    can_flinch and meta and meta.flinch_chance > 0 and not ailed.is_fainted()
+                ) else 0.0
+                probability = base * ailment_probability
+                if flinch > 0.0:
+                    results.append((probability * flinch, after, True))
+                if flinch < 1.0:
+                    results.append((probability * (1.0 - flinch), after, False))
+        return results
+
+    def _damage_outcomes(
+        self,
+        attacker: PokemonPosition,
+        defender: PokemonPosition,
+        move: Move
+    ) -> list[tuple[float, int]]:
+        """Total damage as (probability, damage) pairs, lethal rolls merged."""
+        if not move.power:
+            return [(1.0, 0)]
+        key = (
+            move.move_id, attacker.species_id, attacker.level, attacker.stats, attacker.stages,
+            attacker.status == StatusCondition.BURN, defender.species_id, defender.stats,
+            defender.stages, defender.current_hp
+        )
+        cached = self._damage_cache.get(key)
+        if cached is None:
+            cached = self._damage_cache[key] = self._bucket_damage(attacker, defender, move)
+        return cached
+
+    def _bucket_damage(
+        self,
+        attacker: PokemonPosition,
+        defender: PokemonPosition,
+        move: Move
+    ) -> list[tuple[float, int]]:
+        critical = critical_chance(attacker, move)
+        hit_counts = _hit_distribution(move)
+        roll_weight = 1.0 / len(DAMAGE_ROLLS)
+        totals: dict[int, float] = {}
+        for is_critical, critical_weight in ((False, 1.0 - critical), (True, critical)):
+            if critical_weight <= 0.0:
+                continue
+            for damage in damage_rolls(attacker, defender, move, is_critical):
+                for hits, hit_weight in hit_counts:
+                    # Multi-hit moves repeat one roll rather than rolling per hit
+                    total = min(defender.current_hp, damage * hits)
+                    totals[total] = totals.get(total, 0.0) + critical_weight * roll_weight * hit_weight
+
+        lethal = totals.pop(defender.current_hp, 0.0) if defender.current_hp > 0 else 0.0
+        outcomes = [(lethal, defender.current_hp)] if lethal > 0.0 else []
+        ordered = sorted(totals.items())
+        if self.roll_buckets is None or len(ordered) <= self.roll_buckets:
+            return outcomes + [(weight, damage) for damage, weight in ordered]
+        remaining = sum(weight for _, weight in ordered)
+        target = remaining / self.roll_buckets
+        bucket_weight = 0.0
+        bucket_damage = 0.0
+        for damage, weight in ordered:
+            bucket_weight += weight
+            bucket_damage += damage * weight
+            if bucket_weight >= target - 1e-12:
+                outcomes.append((bucket_weight, round(bucket_damage / bucket_weight)))
+                bucket_weight = bucket_damage = 0.0
+        if bucket_weight > 0.0:
+            outcomes.append((bucket_weight, round(bucket_damage / bucket_weight)))
+        return outcomes
+
+    @staticmethod
+    def _ailment_outcomes(defender: PokemonPosition, move: Move) -> list[tuple[float, PokemonPosition]]:
+        meta = move.meta
+        condition = _AILMENTS.get(meta.ailment) if meta and meta.ailment else None
+        if condition is None or defender.status is not None:
+            return [(1.0, defender)]
+        turns = _SLEEP_TURNS if condition == StatusCondition.SLEEP else 0
+        ailed = defender.with_status(condition, turns)
+        chance = meta.ailment_chance / 100 if meta.ailment_chance > 0 else 1.0
+        if chance >= 1.0:
+            return [(1.0, ailed)]
+        return [(chance, ailed), (1.0 - chance, defender)]
+
+    @staticmethod
+    def _end_of_turn(position: BattlePosition) -> BattlePosition:
+        """Burn/poison damage, then replace fainted active Pokemon."""
+        for side_name in ("player", "enemy"):
+            side = position.side(side_name)
+            member = side.active
+            if not member.is_fainted():
+                ticked = _status_tick(member)
+                if ticked is not member:
+                    side = side.with_active(ticked)
+            if side.active.is_fainted():
+                replacement = _next_alive(side)
+                if replacement is not None:
+                    side = side.switched_to(replacement)
+            if side is not position.side(side_name):
+                position = position.with_side(side_name, side)
+        return position
+
+
+def _status_tick(member: PokemonPosition) -> PokemonPosition:
+    chunk = member.max_hp // 16
+    if member.status in (StatusCondition.BURN, StatusCondition.POISON):
+        return member.with_hp(member.current_hp - max(1, chunk))
+    if member.status == StatusCondition.BADLY_POISON:
+        turns = member.status_turns + 1
+        return member.with_status(member.status, turns).with_hp(member.current_hp - max(1, chunk * turns))
+    return member
+
+
+def _next_alive(side: SidePosition) -> Optional[int]:
+    count = len(side.team)
+    for offset in range(1, count):
+        index = (side.active_index + offset) % count
+        if not side.team[index].is_fainted():
+            return index
+    return None
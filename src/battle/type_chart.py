@@ -49,16 +49,24 @@ class TypeChart:
         return multiplier
 
 
-# Global instance
-_type_chart = TypeChart()
+# Global instance (loaded on first lookup so importing this module is free)
+_type_chart = None
+
+
+def get_type_chart() -> TypeChart:
+    """Return the shared type chart, loading it on first use."""
+    global _type_chart
+    if _type_chart is None:
+        _type_chart = TypeChart()
+    return _type_chart
 
 
 def get_effectiveness(attacking_type: str, defending_type: str) -> float:
     """Global function to get type effectiveness."""
-    return _type_chart.get_effectiveness(attacking_type, defending_type)
+    return get_type_chart().get_effectiveness(attacking_type, defending_type)
 
 
 def get_dual_type_effectiveness(attacking_type: str,
                                 def_type1: str, def_type2: str = None) -> float:
     """Global function to get dual-type effectiveness."""
-    return _type_chart.get_dual_type_effectiveness(attacking_type, def_type1, def_type2)
+    return get_type_chart().get_dual_type_effectiveness(attacking_type, def_type1, def_type2)
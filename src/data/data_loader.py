@@ -2,6 +2,7 @@
 # ABOUTME: Provides caching and validation for game data files
 
 import json
+import time
 import yaml
 import os
 
@@ -12,6 +13,8 @@ class DataLoader:
     def __init__(self):
         """Initialize the data loader with an empty cache."""
         self.cache = {}
+        # Seconds spent reading and parsing each file from disk (for startup traces)
+        self.load_times = {}
 
     def load_json(self, filepath, use_cache=True):
         """
@@ -36,8 +39,10 @@ class DataLoader:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Data file not found: {filepath}")
 
+        start = time.perf_counter()
         with open(filepath, 'r') as f:
             data = json.load(f)
+        self.load_times[filepath] = self.load_times.get(filepath, 0.0) + time.perf_counter() - start
 
         # Cache if requested
         if use_cache:
@@ -68,8 +73,10 @@ class DataLoader:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Data file not found: {filepath}")
 
+        start = time.perf_counter()
         with open(filepath, 'r') as f:
             data = yaml.safe_load(f)
+        self.load_times[filepath] = self.load_times.get(filepath, 0.0) + time.perf_counter() - start
 
         # Cache if requested
         if use_cache:
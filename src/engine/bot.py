@@ -0,0 +1,309 @@
+# ABOUTME: Scripted bot driver that plays the real game loop headlessly
+# ABOUTME: Steps frames, holds/taps buttons, and queries state, tile, party and battle phase
+
+from src.engine.game import Game
+from src.engine.input_recording import ACTIONS
+from src.engine.savestate import Savestate
+from src.states.battle_state import BattleState
+from src.states.overworld_state import OverworldState
+
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+# Battle menu grid position of RUN (row, col)
+_RUN_CURSOR = (1, 1)
+
+
+class BotInputSource:
+    """Input source whose buttons are held and released by a script."""
+
+    def __init__(self):
+        self.mask = 0
+
+    def press(self, *actions):
+        """Start holding the given actions."""
+        for action in actions:
+            self.mask |= 1 << ACTIONS.index(action)
+
+    def release(self, *actions):
+        """Stop holding the given actions."""
+        for action in actions:
+            self.mask &= ~(1 << ACTIONS.index(action))
+
+    def release_all(self):
+        """Release every button."""
+        self.mask = 0
+
+    def is_held(self, action):
+        return bool(self.mask & (1 << ACTIONS.index(action)))
+
+    def read_mask(self):
+        return self.mask
+
+
+class BotController:
+    """
+    Drives a Game one logic tick at a time from Python.
+
+    By default the game runs on the null renderer with rendering disabled,
+    so a script advances as fast as the simulation allows. Every frame goes
+    through Game.step, so the bot exercises the same input, state and
+    battle code a player does.
+    """
+
+    def __init__(self, game=None, seed=None):
+        """
+        Initialize the controller.
+
+        Args:
+            game: Existing Game to drive (its input is taken over by the bot);
+                defaults to a headless, render-less Game
+            seed: RNG seed for a new Game
+        """
+        if game is None:
+            game = Game(renderer_backend="null", sim_speed=0, render_every=0, seed=seed)
+        self.game = game
+        self.buttons = BotInputSource()
+        self.game.input.source = self.buttons
+        self.game.running = True
+        self.frames = 0
+        # Battles started since the controller was created
+        self.battles_started = 0
+        self._last_battle = None
+
+    def start_overworld(self, map_path="assets/maps/pallet_town.tmx", x=-1, y=-1, **kwargs):
+        """
+        Replace the active state with a fresh overworld, like NEW GAME does.
+
+        Args:
+            map_path: Map to start on
+            x, y: Starting tile (negative uses the map's player_start)
+            **kwargs: Extra OverworldState arguments (party, bag, ...)
+
+        Returns:
+            The new OverworldState
+        """
+        kwargs.setdefault("pokedex_seen", {"pikachu"})
+        kwargs.setdefault("pokedex_caught", {"pikachu"})
+        state = OverworldState(self.game, map_path, player_start_x=x, player_start_y=y, **kwargs)
+        self.game.change_state(state)
+        return state
+
+    def close(self, quit_game=True):
+        """
+        Stop background map loading in every overworld, then quit the game.
+
+        Args:
+            quit_game: Also call Game.quit (pygame.quit); forked workers skip
+                it because SDL state inherited across fork cannot shut down
+        """
+        for state in self.game.state_stack:
+            if isinstance(state, OverworldState) and state.map_streamer is not None:
+                state.map_streamer.shutdown(wait=True)
+                state.warp_prefetcher.shutdown(wait=True)
+        if quit_game:
+            self.game.quit()
+
+    # Frame stepping and buttons
+
+    def step(self, frames=1):
+        """Advance the game by a number of logic ticks."""
+        for _ in range(frames):
+            self.game.step(self.game.fixed_dt)
+            self.frames += 1
+            battle = self.battle
+            if battle is not None and battle is not self._last_battle:
+                self.battles_started += 1
+            self._last_battle = battle
+
+    def press(self, *actions):
+        self.buttons.press(*actions)
+
+    def release(self, *actions):
+        self.buttons.release(*actions)
+
+    def release_all(self):
+        self.buttons.release_all()
+
+    def hold(self, action, frames):
+        """Hold a button for a number of frames, then release it."""
+        self.press(action)
+        self.step(frames)
+        self.release(action)
+
+    def tap(self, action, frames=1):
+        """Press a button for one or more frames, then release it for a frame."""
+        self.hold(action, frames)
+        self.step(1)
+
+    def run_until(self, predicate, max_frames=10000):
+        """
+        Step until predicate(bot) is true.
+
+        Returns:
+            True if the predicate was met within max_frames
+        """
+        for _ in range(max_frames):
+            if predicate(self):
+                return True
+            self.step(1)
+        return predicate(self)
+
+    # Savestates
+
+    def save_state(self):
+        """Snapshot the whole engine, mid-battle included, for load_state()."""
+        return Savestate.capture(self.game)
+
+    def load_state(self, savestate):
+        """
+        Restore a snapshot from save_state() or Savestate.load().
+
+        Held buttons are reset to those held when the snapshot was taken.
+        """
+        savestate.restore(self.game)
+        self.buttons.release_all()
+        held = [action for action, pressed in savestate.input_state["keys_pressed"].items() if pressed]
+        self.buttons.press(*held)
+        self._last_battle = self.battle
+
+    # State queries
+
+    @property
+    def state(self):
+        return self.game.get_current_state()
+
+    @property
+    def state_type(self):
+        """Class name of the active state, or None."""
+        state = self.state
+        return type(state).__name__ if state is not None else None
+
+    @property
+    def overworld(self):
+        """The top-most OverworldState on the stack, or None."""
+        for state in reversed(self.game.state_stack):
+            if isinstance(state, OverworldState):
+                return state
+        return None
+
+    @property
+    def battle(self):
+        """The active BattleState, or None."""
+        state = self.state
+        return state if isinstance(state, BattleState) else None
+
+    @property
+    def battle_phase(self):
+        battle = self.battle
+        return battle.phase if battle is not None else None
+
+    @property
+    def player_tile(self):
+        """(map_name, tile_x, tile_y) of the player, or None outside the overworld."""
+        overworld = self.overworld
+        if overworld is None or overworld.player is None:
+            return None
+        return (overworld.current_map.map_name, overworld.player.tile_x, overworld.player.tile_y)
+
+    @property
+    def party(self):
+        """Summary dicts (species, level, hp, max_hp) for the party."""
+        overworld = self.overworld
+        if overworld is None:
+            return []
+        return [
+            {
+                "species": pokemon.species.species_id,
+                "level": pokemon.level,
+                "hp": pokemon.current_hp,
+                "max_hp": pokemon.stats.hp
+            }
+            for pokemon in overworld.party.pokemon
+        ]
+
+    # Scripted behaviors
+
+    def walk(self, direction, tiles=1, max_frames=600):
+        """
+        Walk a number of tiles, stopping early if another state takes over.
+
+        Args:
+            direction: "up", "down", "left" or "right"
+            tiles: Tiles to walk
+            max_frames: Give up after this many frames
+
+        Returns:
+            Tiles actually walked (fewer when blocked by a wall or NPC)
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction: {direction}")
+        overworld = self.overworld
+        walked = 0
+        idle = 0
+        self.press(direction)
+        try:
+            for _ in range(max_frames):
+                was_moving = overworld.player.is_moving
+                self.step(1)
+                if was_moving and not overworld.player.is_moving:
+                    walked += 1
+                idle = 0 if overworld.player.is_moving else idle + 1
+                if walked >= tiles or self.state is not overworld:
+                    break
+                # Holding past the turn/hold delay without moving means blocked
+                if idle > overworld.player.HOLD_FRAMES_THRESHOLD * 2:
+                    break
+        finally:
+            self.release(direction)
+        return walked
+
+    def flee_battle(self, max_frames=3000):
+        """
+        Leave a wild battle by choosing RUN until it ends.
+
+        Messages are advanced with A; failed escapes just try again.
+
+        Returns:
+            True if the battle ended within max_frames
+        """
+        start = self.frames
+        while self.battle is not None and self.frames - start < max_frames:
+            battle = self.battle
+            menu = battle.battle_menu
+            if battle.phase == "battle_menu" and battle.awaiting_input:
+                if menu.cursor_row != _RUN_CURSOR[0]:
+                    self.tap("down")
+                elif menu.cursor_col != _RUN_CURSOR[1]:
+                    self.tap("right")
+                else:
+                    self.tap("a")
+            else:
+                self.tap("a")
+        return self.battle is None
+
+    def farm_encounters(self, count, axis="horizontal", max_frames=1_000_000):
+        """
+        Pace back and forth one tile at a time, fleeing every wild battle.
+
+        Start the bot on grass with room to step along the axis.
+
+        Args:
+            count: Encounters to collect
+            axis: "horizontal" (left/right) or "vertical" (up/down)
+            max_frames: Give up after this many frames
+
+        Returns:
+            Encounters collected
+        """
+        directions = ("left", "right") if axis == "horizontal" else ("up", "down")
+        start_frames = self.frames
+        start_battles = self.battles_started
+        turn = 0
+        while self.battles_started - start_battles < count and self.frames - start_frames < max_frames:
+            if self.battle is not None:
+                self.flee_battle()
+                continue
+            self.walk(directions[turn % 2], tiles=1)
+            turn += 1
+        return self.battles_started - start_battles
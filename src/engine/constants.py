@@ -10,6 +10,27 @@ SCALE_FACTOR = 1
 WINDOW_WIDTH = GAME_WIDTH * SCALE_FACTOR  # 160
 WINDOW_HEIGHT = GAME_HEIGHT * SCALE_FACTOR  # 144
 
+# Renderer backend: "display" (window), "software" (off-screen) or "null" (no pixels)
+RENDERER_ENV_VAR = "POKEMON_YELLOW_RENDERER"
+
+# Frame profiler: rolling sample window, JSON dump path, overlay toggle key
+PROFILER_WINDOW = 600            # Samples kept per state phase (10s at 60 FPS)
+PROFILE_ENV_VAR = "POKEMON_YELLOW_PROFILE"
+KEY_PROFILER_OVERLAY = pygame.K_F3
+
+# Input recording/replay files and RNG seed for deterministic sessions
+RECORD_ENV_VAR = "POKEMON_YELLOW_RECORD"
+REPLAY_ENV_VAR = "POKEMON_YELLOW_REPLAY"
+SEED_ENV_VAR = "POKEMON_YELLOW_SEED"
+
+# Rolling autosave ring size (unset or 0 disables autosaves)
+AUTOSAVE_ENV_VAR = "POKEMON_YELLOW_AUTOSAVE"
+
+# Trainer battle enemy AI tier (see src/battle/enemy_ai.py ENEMY_AI_TIERS)
+ENEMY_AI_ENV_VAR = "POKEMON_YELLOW_ENEMY_AI"
+# Optional wall-clock cap in milliseconds per search AI decision
+ENEMY_AI_BUDGET_ENV_VAR = "POKEMON_YELLOW_ENEMY_AI_BUDGET_MS"
+
 # UI scaling (1x for menus and dialog)
 UI_SCALE = 1
 
@@ -23,9 +44,22 @@ TILES_HIGH = GAME_HEIGHT // TILE_SIZE   # 18 base tiles
 METATILES_WIDE = GAME_WIDTH // METATILE_SIZE   # 10 metatiles
 METATILES_HIGH = GAME_HEIGHT // METATILE_SIZE  # 9 metatiles
 
+# Map rendering is split into square chunks rendered on demand
+MAP_CHUNK_SIZE = 128             # Chunk edge in pixels (16x16 base tiles)
+MAP_CHUNK_CACHE_LIMIT = 24       # Chunk surfaces kept per layer group (LRU)
+
+# Connected maps stream in as the player nears a shared edge (metatiles)
+MAP_PRELOAD_DISTANCE = METATILES_WIDE      # Start loading a neighbor this close to its edge
+MAP_UNLOAD_DISTANCE = METATILES_WIDE + 4   # Drop it again past this distance (hysteresis)
+WARP_PREFETCH_LIMIT = 4                    # Warp destination maps prepared ahead of time
+
 # Frame rate
 FPS = 60
 
+# Game logic runs on a fixed tick independent of the render rate
+LOGIC_DT = 1.0 / FPS             # Seconds per logic tick (60 Hz)
+MAX_CATCH_UP_TICKS = 5           # Ticks run per frame before dropping backlog
+
 # Game Boy color palette (grayscale for authentic look)
 COLOR_DARKEST = (15, 56, 15)      # Dark green (GB darkest)
 COLOR_DARK = (48, 98, 48)         # Medium-dark green
@@ -0,0 +1,122 @@
+# ABOUTME: Per-frame draw-call and allocation counters for the renderer
+# ABOUTME: Supports frame summaries, budget assertions, and opt-in Surface allocation tracking
+
+import threading
+from contextlib import contextmanager
+
+import pygame
+
+
+COUNTERS = ("blits", "draw_rect", "draw_text", "font_renders", "transforms", "surface_allocs")
+
+# pygame.transform functions that return a newly allocated Surface
+_ALLOCATING_TRANSFORMS = ("scale", "smoothscale", "scale_by", "smoothscale_by", "flip", "rotate", "rotozoom", "scale2x")
+
+
+class FrameStats:
+    """
+    Counts renderer work for the frame in progress and keeps the last finished frame.
+
+    The renderer counts its own blits, rects, text and transforms. Surface
+    allocations made anywhere on the render path (e.g. in sprite or UI code)
+    are only counted inside allocation_scope() while track_allocations is
+    on, because that temporarily wraps pygame.Surface and pygame.transform.
+    Only the thread that opened the scope is counted; other threads (map
+    loaders, the save writer) still get plain Surfaces and uncounted
+    transforms while a frame renders.
+    """
+
+    def __init__(self):
+        self.track_allocations = False
+        self.current = dict.fromkeys(COUNTERS, 0)
+        self.last_frame = dict.fromkeys(COUNTERS, 0)
+        self.frames = 0
+
+    def count(self, counter, amount=1):
+        """Add to a counter for the frame in progress."""
+        self.current[counter] += amount
+
+    def end_frame(self):
+        """Close the frame in progress (called by the renderer on present)."""
+        self.last_frame = self.current
+        self.current = dict.fromkeys(COUNTERS, 0)
+        self.frames += 1
+
+    def summary(self):
+        """Return counters for the last finished frame."""
+        return dict(self.last_frame)
+
+    def over_budget(self, **budget):
+        """
+        Compare the last finished frame against limits.
+
+        Args:
+            **budget: counter=limit pairs, e.g. blits=40, surface_allocs=0
+
+        Returns:
+            {counter: (actual, limit)} for every counter above its limit
+        """
+        unknown = set(budget) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown frame counters: {', '.join(sorted(unknown))}")
+        return {
+            counter: (self.last_frame[counter], limit)
+            for counter, limit in budget.items()
+            if self.last_frame[counter] > limit
+        }
+
+    def assert_within(self, **budget):
+        """Raise AssertionError describing every counter over its limit."""
+        exceeded = self.over_budget(**budget)
+        if exceeded:
+            details = ", ".join(f"{name}={actual} (limit {limit})" for name, (actual, limit) in exceeded.items())
+            raise AssertionError(f"Frame over budget: {details}")
+
+    @contextmanager
+    def allocation_scope(self):
+        """Count Surface allocations and transforms made by this thread inside the block."""
+        if not self.track_allocations:
+            yield
+            return
+
+        stats = self
+        owner = threading.get_ident()
+        original_surface = pygame.Surface
+        original_transforms = {}
+
+        class SurfaceAlias(type(original_surface)):
+            # Keep isinstance/issubclass checks against pygame.Surface working
+            def __instancecheck__(cls, instance):
+                return isinstance(instance, original_surface)
+
+            def __subclasscheck__(cls, subclass):
+                return issubclass(subclass, original_surface)
+
+        class CountingSurface(original_surface, metaclass=SurfaceAlias):
+            def __new__(cls, *args, **kwargs):
+                if threading.get_ident() == owner:
+                    stats.count("surface_allocs")
+                # A plain Surface, so nothing created here outlives the scope as a subclass
+                return original_surface(*args, **kwargs)
+
+        def counting(function):
+            def wrapper(*args, **kwargs):
+                if threading.get_ident() == owner:
+                    stats.count("transforms")
+                    stats.count("surface_allocs")
+                return function(*args, **kwargs)
+            return wrapper
+
+        CountingSurface.__name__ = original_surface.__name__
+        pygame.Surface = CountingSurface
+        for name in _ALLOCATING_TRANSFORMS:
+            function = getattr(pygame.transform, name, None)
+            if function is not None:
+                original_transforms[name] = function
+                setattr(pygame.transform, name, counting(function))
+        try:
+            yield
+        finally:
+            pygame.Surface = original_surface
+            for name, function in original_transforms.items():
+                setattr(pygame.transform, name, function)
@@ -0,0 +1,211 @@
+# ABOUTME: Exports the 160x144 game surface as NumPy views, bytes, or a shared-memory ring
+# ABOUTME: Supports RGB frames and 2-bit Game Boy shade indices for agents and video capture
+
+import struct
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import pygame
+from src.engine import constants
+
+try:
+    import numpy
+except ImportError:
+    # Array views are optional; bytes and the shared-memory ring work without it
+    numpy = None
+
+
+# Shade index 0..3, lightest to darkest, like the Game Boy's BGP register
+SHADE_PALETTE = (
+    constants.COLOR_LIGHTEST,
+    constants.COLOR_LIGHT,
+    constants.COLOR_DARK,
+    constants.COLOR_DARKEST,
+)
+
+MAGIC = b"PYFB"
+# magic, channels, slots, width, height, frames written
+_HEADER = struct.Struct("<4sBBHHQ")
+_FRAMES_WRITTEN = struct.Struct("<Q")
+_FRAMES_WRITTEN_OFFSET = 10
+# Frame data starts on a cache line
+_DATA_OFFSET = 64
+
+
+def _luma(color):
+    red, green, blue = color[:3]
+    return (red * 299 + green * 587 + blue * 114) // 1000
+
+
+def _build_shade_table():
+    """Map every 0-255 gray level to the nearest palette shade index."""
+    shade_lumas = [_luma(color) for color in SHADE_PALETTE]
+    table = bytearray(256)
+    for gray in range(256):
+        table[gray] = min(range(len(shade_lumas)), key=lambda index: abs(shade_lumas[index] - gray))
+    return bytes(table)
+
+
+_SHADE_TABLE = _build_shade_table()
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("NumPy is required for array frame access (pip install numpy)")
+
+
+@contextmanager
+def pixel_view(surface):
+    """
+    Zero-copy (height, width, 3) uint8 NumPy view of a surface's pixels.
+
+    The surface is locked while the view exists, and pygame refuses to blit
+    onto a locked surface, so use the view inside the block and copy
+    anything that must outlive it. Requires NumPy.
+    """
+    _require_numpy()
+    pixels = pygame.surfarray.pixels3d(surface)
+    try:
+        # surfarray is (x, y); transposing is still a view
+        yield pixels.transpose(1, 0, 2)
+    finally:
+        del pixels
+
+
+def rgb_bytes(surface):
+    """Row-major RGB bytes of a surface (one copy)."""
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def shade_bytes(surface):
+    """
+    One byte per pixel holding the 2-bit Game Boy shade index (0 = lightest).
+
+    Each pixel maps to the palette shade nearest its luminance, so the
+    green palette, white and black all land on the expected shade.
+    """
+    gray = pygame.image.tobytes(pygame.transform.grayscale(surface), "RGB")
+    return gray[::3].translate(_SHADE_TABLE)
+
+
+class FrameRing:
+    """
+    Fixed-size ring of frames in multiprocessing shared memory.
+
+    One process (usually the game) creates the ring and writes presented
+    frames; other processes attach by name and read the latest slots
+    without pickling. The frame counter is published after a slot is
+    fully written. A reader that falls more than slots - 1 frames behind
+    can see a slot being overwritten; frame() reports such frames as gone.
+    """
+
+    def __init__(self, name=None, slots=4, shades=False, create=True,
+                 width=constants.GAME_WIDTH, height=constants.GAME_HEIGHT):
+        """
+        Create or attach to a ring.
+
+        Args:
+            name: Shared memory name (generated when creating without one)
+            slots: Frames kept when creating
+            shades: Store 2-bit shade indices (1 byte/pixel) instead of RGB
+            create: Create the block; False attaches to an existing one and
+                reads its geometry from the header
+            width, height: Frame size when creating
+        """
+        if create:
+            channels = 1 if shades else 3
+            frame_size = width * height * channels
+            self.shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_DATA_OFFSET + slots * frame_size
+            )
+            _HEADER.pack_into(self.shm.buf, 0, MAGIC, channels, slots, width, height, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            magic, channels, slots, width, height, _ = _HEADER.unpack_from(self.shm.buf)
+            if magic != MAGIC:
+                self.shm.close()
+                raise ValueError(f"Shared memory '{name}' is not a frame ring")
+
+        self.owner = create
+        self.channels = channels
+        self.slots = slots
+        self.width = width
+        self.height = height
+        self.frame_size = width * height * channels
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def shades(self):
+        return self.channels == 1
+
+    @property
+    def frames_written(self):
+        return _FRAMES_WRITTEN.unpack_from(self.shm.buf, _FRAMES_WRITTEN_OFFSET)[0]
+
+    def _slot_offset(self, frame_number):
+        return _DATA_OFFSET + (frame_number % self.slots) * self.frame_size
+
+    def write(self, surface):
+        """
+        Copy a surface into the next slot and publish it.
+
+        Returns:
+            The frame number written
+        """
+        if surface.get_size() != (self.width, self.height):
+            raise ValueError(
+                f"Frame is {surface.get_size()}, ring holds {(self.width, self.height)}"
+            )
+        frame_number = self.frames_written
+        offset = self._slot_offset(frame_number)
+        # tobytes + one memcpy beats a strided NumPy copy out of pixels3d here
+        data = shade_bytes(surface) if self.shades else rgb_bytes(surface)
+        self.shm.buf[offset:offset + self.frame_size] = data
+        _FRAMES_WRITTEN.pack_into(self.shm.buf, _FRAMES_WRITTEN_OFFSET, frame_number + 1)
+        return frame_number
+
+    def frame(self, frame_number):
+        """
+        Zero-copy memoryview of a frame still in the ring, else None.
+
+        RGB frames are row-major (height, width, 3); shade frames are
+        (height, width), one index per byte.
+        """
+        written = self.frames_written
+        if frame_number < 0 or frame_number >= written or written - frame_number >= self.slots:
+            return None
+        offset = self._slot_offset(frame_number)
+        return self.shm.buf[offset:offset + self.frame_size]
+
+    def latest(self):
+        """(frame_number, memoryview) of the newest frame, or None before the first write."""
+        written = self.frames_written
+        if written == 0:
+            return None
+        return written - 1, self.frame(written - 1)
+
+    def array(self, frame_number=None):
+        """NumPy view of a frame (newest by default), or None. Requires NumPy."""
+        _require_numpy()
+        if frame_number is None:
+            frame_number = self.frames_written - 1
+        view = self.frame(frame_number)
+        if view is None:
+            return None
+        shape = (self.height, self.width) if self.shades else (self.height, self.width, 3)
+        return numpy.frombuffer(view, dtype=numpy.uint8).reshape(shape)
+
+    def close(self):
+        """Detach; the creating side also frees the block. Release frame views first."""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
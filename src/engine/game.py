@@ -1,28 +1,141 @@
 # ABOUTME: Main game engine with game loop and state management
 # ABOUTME: Handles initialization, state transitions, and frame timing
 
+import os
+import random
+import time
+
 import pygame
 from src.engine import constants
-from src.engine.renderer import Renderer
+from src.engine.profiler import FrameProfiler
+from src.engine.renderer import create_renderer, prepare_video_driver, resolve_backend
 from src.engine.input import Input
+from src.engine.input_recording import InputRecording, ReplaySource
+from src.save.autosave import AutosaveRing, slot_autosave_dir
+from src.save.save_writer import SaveWriter
 
 
 class Game:
     """Main game engine that manages the game loop and states."""
 
-    def __init__(self):
-        """Initialize the game engine."""
+    def __init__(
+        self,
+        renderer_backend=None,
+        fixed_dt=None,
+        sim_speed=1.0,
+        render_every=1,
+        interpolate=False,
+        profile_path=None,
+        record_path=None,
+        replay_path=None,
+        seed=None,
+        autosave_slots=None
+    ):
+        """
+        Initialize the game engine.
+
+        Args:
+            renderer_backend: "display", "software" or "null"; defaults to the
+                POKEMON_YELLOW_RENDERER environment variable, then "display"
+            fixed_dt: Logic tick length in seconds (defaults to LOGIC_DT)
+            sim_speed: Simulation speed multiplier; 0 or None runs uncapped,
+                one tick per frame as fast as the CPU allows
+            render_every: Render every Nth frame (0 = never render)
+            interpolate: Blend entity/camera positions between logic ticks
+                when rendering
+            profile_path: Where to write the frame profile JSON on quit;
+                defaults to the POKEMON_YELLOW_PROFILE environment variable
+            record_path: Record per-tick input here on quit (POKEMON_YELLOW_RECORD)
+            replay_path: Feed input from a recording instead of the keyboard
+                and stop when it ends (POKEMON_YELLOW_REPLAY)
+            seed: RNG seed (POKEMON_YELLOW_SEED); replays use the recorded seed
+            autosave_slots: Keep this many rolling autosaves, taken on map
+                changes and after battles (POKEMON_YELLOW_AUTOSAVE); 0 disables
+        """
+        self.fixed_dt = fixed_dt if fixed_dt is not None else constants.LOGIC_DT
+        self.sim_speed = sim_speed or 0
+        self.render_every = render_every
+        self.interpolate = interpolate
+        self.frame_count = 0
+        self.tick_count = 0
+        # Unsimulated wall time, and how far rendering sits between ticks
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+
+        # Phase timings per active state; F3 toggles the overlay
+        self.profiler = FrameProfiler()
+        self.profile_path = profile_path or os.environ.get(constants.PROFILE_ENV_VAR)
+        # Optional framebuffer.FrameRing that receives every presented frame
+        # (never written by the null backend, which draws nothing)
+        self.frame_ring = None
+        # Optional StartupTracer, finished on the first presented frame
+        self.startup_tracer = None
+
+        self.renderer_backend = resolve_backend(renderer_backend)
+        prepare_video_driver(self.renderer_backend)
         pygame.init()
 
         # Core systems
-        self.renderer = Renderer()
+        self.renderer = create_renderer(self.renderer_backend)
         self.input = Input()
         self.clock = pygame.time.Clock()
 
+        # Deterministic sessions: input comes one frame per logic tick and
+        # every random roll goes through the seeded global RNG
+        self.record_path = record_path or os.environ.get(constants.RECORD_ENV_VAR)
+        replay_path = replay_path or os.environ.get(constants.REPLAY_ENV_VAR)
+        if seed is None and os.environ.get(constants.SEED_ENV_VAR):
+            seed = int(os.environ[constants.SEED_ENV_VAR])
+        self.replay = None
+        if replay_path:
+            recording = InputRecording.load(replay_path)
+            self.replay = ReplaySource(recording)
+            self.input.source = self.replay
+            if recording.seed is not None:
+                seed = recording.seed
+        if seed is None and self.record_path:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+        if self.record_path:
+            self.input.recorder = InputRecording(seed)
+        # Capping search AI decisions by time makes them vary between runs,
+        # so seeded, recorded and replayed sessions never get the cap
+        budget_ms = os.environ.get(constants.ENEMY_AI_BUDGET_ENV_VAR)
+        deterministic = seed is not None or self.replay is not None
+        self.enemy_ai_budget_ms = float(budget_ms) if budget_ms and not deterministic else None
+
+        # Saves are written on a worker thread; callbacks run at the start of a tick
+        self.save_writer = SaveWriter()
+        # Slot the SAVE option writes to, and logic time played in seconds
+        self.save_slot = 0
+        self.play_time = 0.0
+        if autosave_slots is None:
+            autosave_slots = int(os.environ.get(constants.AUTOSAVE_ENV_VAR) or 0)
+        self.autosave_slots = autosave_slots
+        # One autosave ring per save slot, opened when that slot first autosaves
+        self._autosave_rings = {}
+
         # State management
         self.state_stack = []
         self.running = False
 
+    @property
+    def autosave(self):
+        """Return the current save slot's autosave ring, or None if autosaves are off."""
+        if not self.autosave_slots:
+            return None
+        ring = self._autosave_rings.get(self.save_slot)
+        if ring is None:
+            ring = AutosaveRing(
+                slot_autosave_dir(self.save_slot),
+                slots=self.autosave_slots,
+                write=self.save_writer.submit_write
+            )
+            self._autosave_rings[self.save_slot] = ring
+        return ring
+
     def push_state(self, state):
         """
         Push a new state onto the stack.
@@ -36,21 +149,23 @@ class Game:
     def pop_state(self):
         """
         Pop the current state from the stack.
-        Returns to the previous state.
+        Returns to the previous state. The popped state is disposed.
         """
         if self.state_stack:
             state = self.state_stack.pop()
             state.exit()
+            state.dispose()
         if self.state_stack:
             self.state_stack[-1].enter()
 
     def change_state(self, state):
         """
-        Replace the current state with a new one.
+        Replace the current state with a new one, disposing the old one.
         """
         if self.state_stack:
-            self.state_stack[-1].exit()
-            self.state_stack.pop()
+            replaced = self.state_stack.pop()
+            replaced.exit()
+            replaced.dispose()
         self.state_stack.append(state)
         state.enter()
 
@@ -63,34 +178,135 @@ class Game:
     def run(self):
         """Start the main game loop."""
         self.running = True
+        # Don't count loading time before the loop as elapsed game time
+        self.clock.tick()
 
         while self.running:
-            # Calculate delta time
-            dt = self.clock.tick(constants.FPS) / 1000.0  # Convert to seconds
+            if not self.sim_speed:
+                # Turbo: don't sleep, just keep the clock's bookkeeping current
+                self.clock.tick()
+                self.step(self.fixed_dt)
+            else:
+                elapsed = self.clock.tick(constants.FPS * self.sim_speed) / 1000.0  # Convert to seconds
+                self.advance(elapsed * self.sim_speed)
+
+        # Clean up
+        self.quit()
 
-            # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
+    def advance(self, frame_time):
+        """
+        Feed elapsed time to the fixed-timestep loop and render once.
+
+        Logic runs in whole LOGIC_DT ticks, so gameplay speed doesn't depend
+        on the frame rate. When frames are slow, several ticks run before a
+        single render (render rate drops first); past MAX_CATCH_UP_TICKS the
+        backlog is dropped so one long stall can't snowball.
 
-            # Update input
-            self.input.update(events)
+        Args:
+            frame_time: Simulated seconds since the previous frame
+
+        Returns:
+            Number of logic ticks run
+        """
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= self.fixed_dt and self.running:
+            if ticks >= constants.MAX_CATCH_UP_TICKS:
+                self.accumulator %= self.fixed_dt
+                break
+            self.tick(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            ticks += 1
 
-            # Get current state
+        self.render_alpha = self.accumulator / self.fixed_dt if self.interpolate else 1.0
+        self._render_frame()
+        return ticks
+
+    def step(self, dt):
+        """
+        Run one logic tick followed by a (possibly decimated) render.
+
+        Args:
+            dt: Logical delta time in seconds
+        """
+        self.tick(dt)
+        self.render_alpha = 1.0
+        self._render_frame()
+
+    def tick(self, dt):
+        """
+        Run one logic tick: events, input, and the active state's update.
+
+        Args:
+            dt: Logical delta time in seconds
+        """
+        # Handle events
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == constants.KEY_PROFILER_OVERLAY:
+                self.profiler.toggle_overlay()
+
+        # Update input
+        self.input.update(events)
+
+        # Report finished background saves before states react to input
+        self.save_writer.poll()
+
+        # Get current state
+        current_state = self.get_current_state()
+        if current_state:
+            state_name = type(current_state).__name__
+            start = time.perf_counter()
+            current_state.handle_input(self.input)
+            after_input = time.perf_counter()
+            # Attribute update to the state that received input, even if it
+            # pushed or popped a state along the way
+            current_state.update(dt)
+            after_update = time.perf_counter()
+            self.profiler.record(state_name, "handle_input", after_input - start)
+            self.profiler.record(state_name, "update", after_update - after_input)
+        self.tick_count += 1
+        self.play_time += dt
+
+        if self.replay is not None and self.replay.finished:
+            self.running = False
+
+    def _render_frame(self):
+        """Render and present the active state, honoring render_every."""
+        # Rendering can be decimated (or skipped) without affecting logic
+        self.frame_count += 1
+        if self.render_every and self.frame_count % self.render_every == 0:
             current_state = self.get_current_state()
+            state_name = type(current_state).__name__ if current_state else "None"
+            start = time.perf_counter()
             if current_state:
-                # Handle input, update, and render
-                current_state.handle_input(self.input)
-                current_state.update(dt)
-                current_state.render(self.renderer)
+                with self.renderer.stats.allocation_scope():
+                    current_state.render(self.renderer)
+            after_render = time.perf_counter()
+            if self.profiler.overlay_enabled:
+                self.profiler.render_overlay(self.renderer, state_name, self.renderer.stats.summary())
 
             # Present the frame
+            before_present = time.perf_counter()
             self.renderer.present()
-
-        # Clean up
-        self.quit()
+            after_present = time.perf_counter()
+            if self.frame_ring is not None and self.renderer.rasterizes:
+                self.frame_ring.write(self.renderer.game_surface)
+            if self.startup_tracer is not None:
+                self.startup_tracer.finish()
+                self.startup_tracer = None
+            self.profiler.record(state_name, "render", after_render - start)
+            self.profiler.record(state_name, "present", after_present - before_present)
 
     def quit(self):
         """Clean up and quit the game."""
+        self.save_writer.shutdown()
+        if self.record_path and self.input.recorder is not None:
+            self.input.recorder.save(self.record_path)
+            print(f"Input recording written to {self.record_path}")
+        if self.profile_path:
+            self.profiler.dump_json(self.profile_path)
+            print(f"Frame profile written to {self.profile_path}")
         pygame.quit()
@@ -3,13 +3,24 @@
 
 import pygame
 from src.engine import constants
+from src.engine.input_recording import decode_actions, encode_actions
 
 
 class Input:
     """Handles keyboard input and maps keys to game actions."""
 
-    def __init__(self):
-        """Initialize input state tracking."""
+    def __init__(self, source=None):
+        """
+        Initialize input state tracking.
+
+        Args:
+            source: Optional object with read_mask() -> action bitmask that
+                replaces the keyboard (e.g. a ReplaySource)
+        """
+        self.source = source
+        # Optional InputRecording that receives every frame's action mask
+        self.recorder = None
+
         # Track which keys are currently pressed
         self.keys_pressed = {
             "up": False,
@@ -40,20 +51,26 @@ class Input:
         for key in self.keys_just_pressed:
             self.keys_just_pressed[key] = False
 
-        # Get current key states
-        keys = pygame.key.get_pressed()
-
         # Update held keys
         old_pressed = self.keys_pressed.copy()
 
-        self.keys_pressed["up"] = keys[constants.KEY_UP]
-        self.keys_pressed["down"] = keys[constants.KEY_DOWN]
-        self.keys_pressed["left"] = keys[constants.KEY_LEFT]
-        self.keys_pressed["right"] = keys[constants.KEY_RIGHT]
-        self.keys_pressed["a"] = keys[constants.KEY_A]
-        self.keys_pressed["b"] = keys[constants.KEY_B]
-        self.keys_pressed["start"] = keys[constants.KEY_START]
-        self.keys_pressed["select"] = keys[constants.KEY_SELECT]
+        if self.source is not None:
+            self.keys_pressed.update(decode_actions(self.source.read_mask()))
+        else:
+            # Get current key states
+            keys = pygame.key.get_pressed()
+
+            self.keys_pressed["up"] = keys[constants.KEY_UP]
+            self.keys_pressed["down"] = keys[constants.KEY_DOWN]
+            self.keys_pressed["left"] = keys[constants.KEY_LEFT]
+            self.keys_pressed["right"] = keys[constants.KEY_RIGHT]
+            self.keys_pressed["a"] = keys[constants.KEY_A]
+            self.keys_pressed["b"] = keys[constants.KEY_B]
+            self.keys_pressed["start"] = keys[constants.KEY_START]
+            self.keys_pressed["select"] = keys[constants.KEY_SELECT]
+
+        if self.recorder is not None:
+            self.recorder.append(encode_actions(self.keys_pressed))
 
         # Detect just pressed (was not pressed before, is pressed now)
         for key in self.keys_pressed:
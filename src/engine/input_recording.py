@@ -0,0 +1,138 @@
+# ABOUTME: Compact run-length-encoded recording and replay of per-tick input
+# ABOUTME: Stores action bitmasks plus the RNG seed so sessions replay frame-exactly
+
+from __future__ import annotations
+
+import os
+import struct
+
+
+# Bit order of actions in a mask (bit 0 = "up")
+ACTIONS = ("up", "down", "left", "right", "a", "b", "start", "select")
+
+MAGIC = b"PYIN"
+VERSION = 1
+# magic, version, has_seed flag, seed
+_HEADER = struct.Struct("<4sBBq")
+
+
+def encode_actions(pressed: dict[str, bool]) -> int:
+    """Pack a keys_pressed dict into an action bitmask."""
+    mask = 0
+    for bit, action in enumerate(ACTIONS):
+        if pressed.get(action):
+            mask |= 1 << bit
+    return mask
+
+
+def decode_actions(mask: int) -> dict[str, bool]:
+    """Unpack an action bitmask into a keys_pressed dict."""
+    return {action: bool(mask & (1 << bit)) for bit, action in enumerate(ACTIONS)}
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated input recording")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+class InputRecording:
+    """An RNG seed plus (mask, frame count) runs, one frame per logic tick."""
+
+    def __init__(self, seed: int | None = None, runs: list[list[int]] | None = None):
+        self.seed = seed
+        self.runs = runs if runs is not None else []
+
+    @property
+    def frame_count(self) -> int:
+        return sum(count for _, count in self.runs)
+
+    def append(self, mask: int) -> None:
+        """Add one frame, extending the last run when the mask repeats."""
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+    def masks(self):
+        """Yield the mask for every frame in order."""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def to_bytes(self) -> bytes:
+        buffer = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed is not None, self.seed or 0))
+        for mask, count in self.runs:
+            buffer.append(mask)
+            _write_varint(buffer, count)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputRecording":
+        if len(data) < _HEADER.size:
+            raise ValueError("Input recording is too short")
+        magic, version, has_seed, seed = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not an input recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported input recording version {version}")
+
+        runs = []
+        offset = _HEADER.size
+        while offset < len(data):
+            mask = data[offset]
+            count, offset = _read_varint(data, offset + 1)
+            runs.append([mask, count])
+        return cls(seed if has_seed else None, runs)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        with open(path, "rb") as handle:
+            return cls.from_bytes(handle.read())
+
+
+class ReplaySource:
+    """Input source that plays back a recording one frame per read."""
+
+    def __init__(self, recording: InputRecording):
+        self.recording = recording
+        self._masks = recording.masks()
+        self.total_frames = recording.frame_count
+        self.finished = self.total_frames == 0
+        self.frame = 0
+
+    def read_mask(self) -> int:
+        """Return the next frame's mask (0 once the recording has ended)."""
+        if self.finished:
+            return 0
+        mask = next(self._masks)
+        self.frame += 1
+        if self.frame >= self.total_frames:
+            self.finished = True
+        return mask
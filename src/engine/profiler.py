@@ -0,0 +1,141 @@
+# ABOUTME: Per-state frame-phase profiler with rolling percentile windows
+# ABOUTME: Times input/update/render/present, draws a debug overlay, and dumps JSON
+
+import json
+import math
+import os
+from collections import deque
+
+from src.engine import constants
+
+
+PHASES = ("handle_input", "update", "render", "present")
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Nearest-rank percentile of already sorted samples.
+
+    Args:
+        sorted_samples: Ascending list of values
+        fraction: Percentile as a fraction (0.95 for p95)
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_samples))
+    return sorted_samples[min(len(sorted_samples), max(1, rank)) - 1]
+
+
+class FrameProfiler:
+    """
+    Records how long each frame phase takes, keyed by the active state class.
+
+    Each (state, phase) pair keeps the most recent PROFILER_WINDOW samples
+    in milliseconds, so percentiles reflect recent behavior rather than the
+    whole session.
+    """
+
+    def __init__(self, window=constants.PROFILER_WINDOW):
+        """
+        Initialize the profiler.
+
+        Args:
+            window: Samples kept per (state, phase)
+        """
+        self.window = window
+        self.samples = {}  # {state_name: {phase: deque[ms]}}
+        self.totals = {}   # {state_name: {phase: sample count since start}}
+        self.overlay_enabled = False
+
+    def record(self, state_name, phase, seconds):
+        """Record one phase duration (in seconds) for a state."""
+        phases = self.samples.get(state_name)
+        if phases is None:
+            phases = self.samples[state_name] = {}
+            self.totals[state_name] = {}
+        window = phases.get(phase)
+        if window is None:
+            window = phases[phase] = deque(maxlen=self.window)
+            self.totals[state_name][phase] = 0
+        window.append(seconds * 1000.0)
+        self.totals[state_name][phase] += 1
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.overlay_enabled = not self.overlay_enabled
+
+    def stats(self, state_name, phase):
+        """
+        Summarize the recent window for a state phase.
+
+        Returns:
+            Dict with p50/p95/p99/max/mean in ms and the sample count, or None
+        """
+        window = self.samples.get(state_name, {}).get(phase)
+        if not window:
+            return None
+        ordered = sorted(window)
+        return {
+            "p50": percentile(ordered, 0.50),
+            "p95": percentile(ordered, 0.95),
+            "p99": percentile(ordered, 0.99),
+            "max": ordered[-1],
+            "mean": sum(ordered) / len(ordered),
+            "samples": self.totals[state_name][phase]
+        }
+
+    def report(self):
+        """Return {state_name: {phase: stats}} for every recorded phase."""
+        return {
+            state_name: {
+                phase: self.stats(state_name, phase)
+                for phase in PHASES
+                if phase in phases
+            }
+            for state_name, phases in self.samples.items()
+        }
+
+    def worst_state(self, phase="render", metric="p95"):
+        """Return (state_name, value) with the highest metric for a phase."""
+        worst = None
+        for state_name, phases in self.report().items():
+            stats = phases.get(phase)
+            if stats and (worst is None or stats[metric] > worst[1]):
+                worst = (state_name, stats[metric])
+        return worst
+
+    def dump_json(self, path):
+        """Write the report to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.report(), handle, indent=2)
+
+    def render_overlay(self, renderer, state_name, frame_stats=None):
+        """
+        Draw p50/p95/p99 per phase for the active state in the top-left corner.
+
+        Args:
+            renderer: Renderer to draw with
+            state_name: Active state class name
+            frame_stats: Optional counters from the last frame (FrameStats.summary())
+        """
+        lines = [state_name]
+        for phase in PHASES:
+            stats = self.stats(state_name, phase)
+            if stats is None:
+                continue
+            lines.append(
+                f"{phase[:6]:<6} {stats['p50']:4.1f} {stats['p95']:4.1f} {stats['p99']:4.1f}"
+            )
+        if frame_stats:
+            lines.append(
+                f"blt {frame_stats['blits']} txt {frame_stats['draw_text']} "
+                f"xf {frame_stats['transforms']} new {frame_stats['surface_allocs']}"
+            )
+
+        line_height = 9
+        renderer.draw_rect(constants.COLOR_BLACK, (0, 0, constants.GAME_WIDTH, line_height * len(lines) + 2))
+        for index, line in enumerate(lines):
+            renderer.draw_text(line, 2, 1 + index * line_height, color=constants.COLOR_WHITE, font_size=12)
@@ -1,24 +1,63 @@
-# ABOUTME: Rendering system for Pokemon Yellow with sprite caching
-# ABOUTME: Handles display initialization, layer-based rendering, and sprite loading
+# ABOUTME: Rendering backends for Pokemon Yellow with sprite caching
+# ABOUTME: Provides display, software (surface-only) and null (call-counting) renderers
 
 import os
 # Force nearest-neighbor scaling (no blur) - MUST be set before pygame import
 os.environ["SDL_HINT_RENDER_SCALE_QUALITY"] = "0"
 
+from collections import Counter
+
 import pygame
 from src.engine import constants
+from src.engine.frame_stats import FrameStats
 
+# Bound at import so FrameStats.allocation_scope() doesn't double count the
+# renderer's own transforms, which it counts explicitly
+_scale = pygame.transform.scale
 
-class Renderer:
-    """Manages rendering with layer system and sprite caching."""
 
-    def __init__(self):
-        """Initialize the renderer and display."""
-        # Render to an internal surface and scale to the window
-        self.screen = pygame.display.set_mode(
-            (constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
+HEADLESS_BACKENDS = ("software", "null")
+
+
+def resolve_backend(backend=None):
+    """
+    Pick a renderer backend name.
+
+    Args:
+        backend: Explicit backend name; falls back to the RENDERER_ENV_VAR
+            environment variable and then to "display"
+
+    Returns:
+        One of "display", "software", "null"
+    """
+    name = (backend or os.environ.get(constants.RENDERER_ENV_VAR) or "display").strip().lower()
+    if name not in RENDERER_BACKENDS:
+        raise ValueError(
+            f"Unknown renderer backend '{name}' (expected one of: {', '.join(RENDERER_BACKENDS)})"
         )
-        pygame.display.set_caption("Pokemon Yellow")
+    return name
+
+
+def prepare_video_driver(backend):
+    """Route SDL to the dummy video driver for headless backends (call before pygame.init)."""
+    if backend in HEADLESS_BACKENDS:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def create_renderer(backend=None):
+    """Instantiate the renderer for a backend name (see resolve_backend)."""
+    return RENDERER_BACKENDS[resolve_backend(backend)]()
+
+
+class SoftwareRenderer:
+    """Renders into an off-screen game surface without opening a window."""
+
+    # game_surface holds real frames (see Game's frame_ring export)
+    rasterizes = True
+
+    def __init__(self):
+        """Initialize the off-screen game surface."""
+        self._ensure_pixel_format()
 
         # Render to internal surface at native resolution
         self.game_surface = pygame.Surface(
@@ -27,6 +66,17 @@ class Renderer:
 
         # Sprite cache {filepath: Surface}
         self.sprite_cache = {}
+        # Scaled sprite cache {(filepath, size, alpha): Surface}
+        self.scaled_sprite_cache = {}
+        self.frames_presented = 0
+        # Per-frame draw/allocation counters, rolled over on present()
+        self.stats = FrameStats()
+
+    def _ensure_pixel_format(self):
+        # convert()/convert_alpha() (sprites, TMX tilesets) need a display
+        # surface, so headless backends keep a hidden 1x1 one
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
 
     def clear(self, color=constants.COLOR_BLACK):
         """Clear the game surface."""
@@ -34,10 +84,12 @@ class Renderer:
 
     def draw_surface(self, surface, position):
         """Draw a surface at the given position on the game surface."""
+        self.stats.count("blits")
         self.game_surface.blit(surface, position)
 
     def draw_rect(self, color, rect, width=0):
         """Draw a rectangle on the game surface."""
+        self.stats.count("draw_rect")
         pygame.draw.rect(self.game_surface, color, rect, width)
 
     def draw_box(self, x: int, y: int, width: int, height: int,
@@ -77,6 +129,9 @@ class Renderer:
 
         font = self._font_cache[font_size]
         text_surface = font.render(text, True, color)
+        self.stats.count("draw_text")
+        self.stats.count("font_renders")
+        self.stats.count("blits")
         self.game_surface.blit(text_surface, (x, y))
         return text_surface.get_width(), text_surface.get_height()
 
@@ -99,15 +154,110 @@ class Renderer:
         """Get a cached sprite. Load it if not already cached."""
         return self.load_sprite(filepath)
 
+    def load_scaled_sprite(self, filepath, size, alpha=None):
+        """
+        Load a sprite scaled to a size (and optional surface alpha), cached.
+
+        Scaling happens once per (filepath, size, alpha), so callers can use
+        this every frame without allocating.
+        """
+        key = (filepath, tuple(size), alpha)
+        scaled = self.scaled_sprite_cache.get(key)
+        if scaled is None:
+            sprite = self.load_sprite(filepath)
+            if sprite.get_size() == tuple(size) and alpha is None:
+                scaled = sprite
+            else:
+                self.stats.count("transforms")
+                scaled = _scale(sprite, size)
+                if alpha is not None:
+                    scaled.set_alpha(alpha)
+            self.scaled_sprite_cache[key] = scaled
+        return scaled
+
     def present(self):
-        """Display the screen."""
-        scaled_surface = pygame.transform.scale(
-            self.game_surface,
-            (constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
-        )
-        self.screen.blit(scaled_surface, (0, 0))
-        pygame.display.flip()
+        """Finish the frame; the game surface holds the result."""
+        self.frames_presented += 1
+        self.stats.end_frame()
 
     def clear_sprite_cache(self):
         """Clear the sprite cache (useful when changing maps)."""
         self.sprite_cache.clear()
+        self.scaled_sprite_cache.clear()
+
+
+class Renderer(SoftwareRenderer):
+    """Display backend: renders off-screen and scales the result to the window."""
+
+    def __init__(self):
+        """Initialize the renderer and display."""
+        # Render to an internal surface and scale to the window
+        self.screen = pygame.display.set_mode(
+            (constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
+        )
+        pygame.display.set_caption("Pokemon Yellow")
+        super().__init__()
+
+    def present(self):
+        """Display the screen."""
+        window_size = (constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
+        if self.game_surface.get_size() == window_size:
+            # No scaling needed (SCALE_FACTOR 1); skip the per-frame copy
+            self.screen.blit(self.game_surface, (0, 0))
+        else:
+            self.stats.count("transforms")
+            self.screen.blit(_scale(self.game_surface, window_size), (0, 0))
+        self.stats.count("blits")
+        pygame.display.flip()
+        self.frames_presented += 1
+        self.stats.end_frame()
+
+
+class NullRenderer(SoftwareRenderer):
+    """
+    Headless backend that counts draw calls and skips all pixel work.
+
+    Sprites are still loaded (callers lay out by their size) and draw_text
+    still reports text metrics, but nothing is rasterized. UI code that
+    blits straight onto game_surface hits a 1x1 surface and is clipped,
+    and Game skips its frame_ring export since there are no frames.
+    """
+
+    rasterizes = False
+
+    def __init__(self):
+        """Initialize counters and a placeholder game surface."""
+        super().__init__()
+        self.game_surface = pygame.Surface((1, 1))
+        self.draw_calls = Counter()
+
+    def clear(self, color=constants.COLOR_BLACK):
+        """Count a clear."""
+        self.draw_calls["clear"] += 1
+
+    def draw_surface(self, surface, position):
+        """Count a surface blit."""
+        self.draw_calls["draw_surface"] += 1
+        self.stats.count("blits")
+
+    def draw_rect(self, color, rect, width=0):
+        """Count a rectangle."""
+        self.draw_calls["draw_rect"] += 1
+        self.stats.count("draw_rect")
+
+    def draw_text(self, text, x, y, color=(0, 0, 0), font_size=16):
+        """Count a text draw and return its measured (width, height)."""
+        self.draw_calls["draw_text"] += 1
+        self.stats.count("draw_text")
+        if not hasattr(self, '_font_cache'):
+            self._font_cache = {}
+        if font_size not in self._font_cache:
+            self._font_cache[font_size] = pygame.font.Font(None, font_size)
+        return self._font_cache[font_size].size(text)
+
+
+RENDERER_BACKENDS = {
+    "display": Renderer,
+    "software": SoftwareRenderer,
+    "null": NullRenderer
+}
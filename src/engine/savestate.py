@@ -0,0 +1,230 @@
+# ABOUTME: Full-engine savestates that capture the whole state stack, mid-battle included
+# ABOUTME: Pickles states with maps and surfaces pulled out, restoring in-memory or from disk
+
+from __future__ import annotations
+
+import io
+import pickle
+import random
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from src.overworld.map import MapManager
+
+
+SAVESTATE_MAGIC = b"PKSS"
+SAVESTATE_VERSION = 2
+# Game attributes that belong to the simulation rather than the session
+_GAME_FIELDS = ("tick_count", "frame_count", "play_time", "save_slot", "accumulator", "render_alpha")
+
+
+class _StatePickler(pickle.Pickler):
+    """
+    Pickles a state stack, replacing shared or unpicklable objects with ids.
+
+    The game becomes a reference to whichever game is restored into, maps
+    are stored by path (their mutable state is pickled separately, see
+    Savestate.capture), and each distinct Surface is stored once as raw
+    pixels.
+    """
+
+    def __init__(self, file, game):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.game = game
+        self.maps: list[MapManager] = []
+        self.surfaces: list[pygame.Surface] = []
+        self._map_ids: dict[int, int] = {}
+        self._surface_ids: dict[int, int] = {}
+
+    def persistent_id(self, obj: Any):
+        if obj is self.game:
+            return ("game",)
+        if isinstance(obj, MapManager):
+            index = self._map_ids.get(id(obj))
+            if index is None:
+                index = self._map_ids[id(obj)] = len(self.maps)
+                self.maps.append(obj)
+            return ("map", index)
+        if isinstance(obj, pygame.Surface):
+            index = self._surface_ids.get(id(obj))
+            if index is None:
+                index = self._surface_ids[id(obj)] = len(self.surfaces)
+                self.surfaces.append(obj)
+            return ("surface", index)
+        return None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """Resolves the ids written by _StatePickler."""
+
+    def __init__(self, file, game, maps: list[MapManager], surfaces: list[pygame.Surface]):
+        super().__init__(file)
+        self.game = game
+        self.maps = maps
+        self.surfaces = surfaces
+
+    def persistent_load(self, pid):
+        kind = pid[0]
+        if kind == "game":
+            return self.game
+        if kind == "map":
+            return self.maps[pid[1]]
+        if kind == "surface":
+            return self.surfaces[pid[1]]
+        raise pickle.UnpicklingError(f"Unknown savestate reference: {pid!r}")
+
+
+def _encode_surface(surface: pygame.Surface) -> tuple:
+    has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    pixel_format = "RGBA" if has_alpha else "RGB"
+    return (
+        surface.get_size(),
+        pixel_format,
+        pygame.image.tobytes(surface, pixel_format),
+        surface.get_colorkey()
+    )
+
+
+def _decode_surface(encoded: tuple) -> pygame.Surface:
+    size, pixel_format, pixels, colorkey = encoded
+    surface = pygame.image.frombytes(pixels, size, pixel_format)
+    if colorkey is not None:
+        surface.set_colorkey(colorkey)
+    return surface
+
+
+class Savestate:
+    """
+    A snapshot of the whole engine: state stack, RNG stream and tick counters.
+
+    Everything the states reference is captured, including BattleState's
+    phase, queued sequence steps and HP bar animations, plus each map's NPCs,
+    item pickups and tile animation frames. Keep a Savestate in
+    memory to restore it any number of times, or write it with save().
+    Background work (map loads in flight, queued save writes) is not part
+    of a savestate; loaders simply start fresh.
+
+    Savestate files are pickles: only load files you wrote yourself.
+    """
+
+    def __init__(
+        self,
+        stack_data: bytes,
+        surfaces: list[tuple],
+        map_paths: list[str],
+        game_fields: dict[str, Any],
+        input_state: dict[str, dict[str, bool]],
+        rng_state: tuple,
+        maps: list[MapManager] | None = None
+    ):
+        self.stack_data = stack_data
+        self.surfaces = surfaces
+        self.map_paths = map_paths
+        self.game_fields = game_fields
+        self.input_state = input_state
+        self.rng_state = rng_state
+        # Maps from capture time, reused (after their state is reset) for
+        # in-memory restores; None after a round trip through disk
+        self._maps = maps
+
+    @classmethod
+    def capture(cls, game) -> "Savestate":
+        """Snapshot a game's state stack and simulation state."""
+        buffer = io.BytesIO()
+        pickler = _StatePickler(buffer, game)
+        pickler.dump(game.state_stack)
+        # Same pickler, so NPCs and pickups shared between a map and the
+        # overworld state stay shared after restoring
+        pickler.dump([map_manager.capture_state() for map_manager in pickler.maps])
+        return cls(
+            stack_data=buffer.getvalue(),
+            surfaces=[_encode_surface(surface) for surface in pickler.surfaces],
+            map_paths=[map_manager.map_filepath for map_manager in pickler.maps],
+            game_fields={name: getattr(game, name) for name in _GAME_FIELDS if hasattr(game, name)},
+            input_state={
+                "keys_pressed": dict(game.input.keys_pressed),
+                "keys_just_pressed": dict(game.input.keys_just_pressed)
+            },
+            rng_state=random.getstate(),
+            maps=pickler.maps
+        )
+
+    def restore(self, game) -> None:
+        """
+        Replace a game's state stack and simulation state with this snapshot.
+
+        The current states are disposed, not exited; restored states resume
+        exactly where they were captured without enter() being called. Maps
+        get their NPCs, pickups and animation frames back from the snapshot,
+        whatever happened to them since it was taken.
+        """
+        maps = self._maps
+        if maps is None:
+            # Distinct paths load once even if several maps shared a path
+            loaded: dict[str, MapManager] = {}
+            maps = []
+            for path in self.map_paths:
+                if path not in loaded:
+                    loaded[path] = MapManager(path)
+                maps.append(loaded[path])
+        surfaces = [_decode_surface(encoded) for encoded in self.surfaces]
+        unpickler = _StateUnpickler(io.BytesIO(self.stack_data), game, maps, surfaces)
+        stack = unpickler.load()
+        for map_manager, map_state in zip(maps, unpickler.load()):
+            map_manager.restore_state(map_state)
+
+        for state in game.state_stack:
+            state.dispose()
+        game.state_stack = stack
+        for name, value in self.game_fields.items():
+            setattr(game, name, value)
+        game.input.keys_pressed.update(self.input_state["keys_pressed"])
+        game.input.keys_just_pressed.update(self.input_state["keys_just_pressed"])
+        random.setstate(self.rng_state)
+
+    def to_bytes(self) -> bytes:
+        """Serialize for writing to disk."""
+        payload = {
+            "version": SAVESTATE_VERSION,
+            "stack": self.stack_data,
+            "surfaces": self.surfaces,
+            "map_paths": self.map_paths,
+            "game": self.game_fields,
+            "input": self.input_state,
+            "rng": self.rng_state
+        }
+        return SAVESTATE_MAGIC + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Savestate":
+        """
+        Deserialize bytes from to_bytes().
+
+        Raises:
+            ValueError: If the data is not a savestate of this version
+        """
+        if data[:len(SAVESTATE_MAGIC)] != SAVESTATE_MAGIC:
+            raise ValueError("Not a savestate file")
+        payload = pickle.loads(data[len(SAVESTATE_MAGIC):])
+        if payload.get("version") != SAVESTATE_VERSION:
+            raise ValueError(f"Unsupported savestate version {payload.get('version')}")
+        return cls(
+            stack_data=payload["stack"],
+            surfaces=payload["surfaces"],
+            map_paths=payload["map_paths"],
+            game_fields=payload["game"],
+            input_state=payload["input"],
+            rng_state=payload["rng"]
+        )
+
+    def save(self, path: Path | str) -> None:
+        """Write the savestate to a file atomically."""
+        from src.save.save_storage import write_bytes_atomic
+        write_bytes_atomic(Path(path), self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Savestate":
+        """Read a savestate file written by save()."""
+        return cls.from_bytes(Path(path).read_bytes())
@@ -0,0 +1,180 @@
+# ABOUTME: Startup tracer timing module imports, data loads, and time to first frame
+# ABOUTME: Installs an import hook early in main and writes a JSON report after the first frame
+
+import importlib.machinery
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+# Kept here rather than in constants.py: constants imports pygame, and pygame's
+# import is one of the things the tracer has to time
+STARTUP_TRACE_ENV_VAR = "POKEMON_YELLOW_STARTUP_TRACE"
+# Time-to-first-frame target, measured from tracer start to the first present
+TIME_TO_FIRST_FRAME_BUDGET_MS = 750.0
+
+
+class _TimedLoader:
+    """Wraps a module loader and times exec_module for the tracer."""
+
+    def __init__(self, loader, tracer):
+        self._loader = loader
+        self._tracer = tracer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._tracer._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._tracer._exit_import(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder:
+    """Meta path finder that defers to the path finder and wraps its loaders."""
+
+    def __init__(self, tracer):
+        self._tracer = tracer
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return None
+        spec.loader = _TimedLoader(spec.loader, self._tracer)
+        return spec
+
+
+class StartupTracer:
+    """
+    Records how startup time is spent.
+
+    While installed, every module executed from disk is timed (inclusive of
+    the modules it imports, plus self time). Named spans and marks cover the
+    rest (creating the game, entering the first state), and the shared data
+    loader reports how long each data file took to parse.
+    """
+
+    def __init__(self, report_path=None, budget_ms=TIME_TO_FIRST_FRAME_BUDGET_MS):
+        """
+        Start the clock.
+
+        Args:
+            report_path: Where finish() writes the JSON report (optional)
+            budget_ms: Time-to-first-frame target
+        """
+        self.start = time.perf_counter()
+        self.report_path = report_path
+        self.budget_ms = budget_ms
+        self.imports = {}  # {module: {"total_ms", "self_ms"}}
+        self.spans = {}    # {name: ms}
+        self.marks = {}    # {name: ms since start}
+        self._finder = None
+        self._stack = []   # [(module, start, child_ms)]
+
+    def _elapsed_ms(self, since=None):
+        return (time.perf_counter() - (self.start if since is None else since)) * 1000.0
+
+    def install(self):
+        """Start timing imports."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def uninstall(self):
+        """Stop timing imports."""
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _enter_import(self, module_name):
+        self._stack.append([module_name, time.perf_counter(), 0.0])
+
+    def _exit_import(self, module_name):
+        _, started, child_ms = self._stack.pop()
+        total_ms = self._elapsed_ms(started)
+        self.imports[module_name] = {"total_ms": total_ms, "self_ms": total_ms - child_ms}
+        if self._stack:
+            self._stack[-1][2] += total_ms
+
+    @contextmanager
+    def span(self, name):
+        """Time a block of startup work."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + self._elapsed_ms(started)
+
+    def mark(self, name):
+        """Record a milestone (ms since the tracer started); the first mark wins."""
+        self.marks.setdefault(name, self._elapsed_ms())
+
+    @property
+    def time_to_first_frame_ms(self):
+        return self.marks.get("first_frame")
+
+    def report(self, top=25):
+        """
+        Summarize startup.
+
+        Args:
+            top: Number of slowest imports (by self time) to list
+
+        Returns:
+            Dict with milestones, spans, data file loads, and slowest imports
+        """
+        from src.data import data_loader
+
+        slowest = sorted(self.imports.items(), key=lambda item: item[1]["self_ms"], reverse=True)
+        first_frame = self.time_to_first_frame_ms
+        return {
+            "time_to_first_frame_ms": first_frame,
+            "budget_ms": self.budget_ms,
+            "within_budget": first_frame is not None and first_frame <= self.budget_ms,
+            "marks": dict(self.marks),
+            "spans": dict(self.spans),
+            "data_loads_ms": {
+                path: seconds * 1000.0 for path, seconds in data_loader._data_loader.load_times.items()
+            },
+            "modules_imported": len(self.imports),
+            "import_ms": sum(entry["self_ms"] for entry in self.imports.values()),
+            "slowest_imports": [
+                {"module": name, **timing} for name, timing in slowest[:top]
+            ]
+        }
+
+    def finish(self):
+        """Mark the first frame, stop timing imports, and write the report."""
+        self.mark("first_frame")
+        self.uninstall()
+        if self.report_path:
+            self.dump_json(self.report_path)
+            status = "within" if self.time_to_first_frame_ms <= self.budget_ms else "OVER"
+            print(
+                f"Startup trace written to {self.report_path}: first frame at "
+                f"{self.time_to_first_frame_ms:.0f} ms ({status} {self.budget_ms:.0f} ms budget)"
+            )
+
+    def dump_json(self, path):
+        """Write the report to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.report(), handle, indent=2)
+
+
+def start_from_environment():
+    """Install a tracer when POKEMON_YELLOW_STARTUP_TRACE names a report path."""
+    path = os.environ.get(STARTUP_TRACE_ENV_VAR)
+    if not path:
+        return None
+    return StartupTracer(report_path=path).install()
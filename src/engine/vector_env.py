@@ -0,0 +1,253 @@
+# ABOUTME: Runs many headless game instances in worker processes behind one batched API
+# ABOUTME: Game data is loaded before forking so workers share it copy-on-write
+
+import gc
+import multiprocessing
+import os
+import traceback
+from contextlib import contextmanager, nullcontext
+
+from src.data import data_loader
+from src.engine.bot import BotController
+from src.engine.input_recording import encode_actions
+
+
+# YAML game data every instance reads; loading it once in the parent lets
+# forked workers share the parsed objects instead of re-parsing per process
+SHARED_DATA_FILES = (
+    "data/pokemon/species.yaml",
+    "data/moves/moves.yaml",
+    "data/items/items.yaml",
+    "data/types/type_chart.yaml",
+    "data/encounters/yellow_encounters.yaml",
+    "data/dialogs/dialogs.yaml",
+)
+
+
+def preload_game_data():
+    """
+    Fill the module-level loaders (data cache, type chart, encounter zones).
+
+    Call before forking workers, then fork inside frozen_heap() so the
+    collector's bookkeeping does not write to (and un-share) the preloaded
+    objects in the children.
+    """
+    for path in SHARED_DATA_FILES:
+        if os.path.exists(path):
+            data_loader.load_yaml(path)
+    # Both build their module-level singletons on first use
+    from src.battle import type_chart
+    from src.overworld import encounter_zones
+    type_chart.get_type_chart()
+    encounter_zones.get_encounter_zone("")
+
+
+@contextmanager
+def frozen_heap():
+    """
+    Freeze the collector while forking, then thaw it again in the parent.
+
+    Forked children inherit the frozen generation and never scan the shared
+    objects; the parent goes back to collecting normally afterwards.
+    """
+    gc.freeze()
+    try:
+        yield
+    finally:
+        gc.unfreeze()
+
+
+def observe(bot):
+    """Summarize one instance for the agent."""
+    return {
+        "state": bot.state_type,
+        "player_tile": bot.player_tile,
+        "battle_phase": bot.battle_phase,
+        "party": bot.party,
+        "frames": bot.frames,
+        "battles_started": bot.battles_started
+    }
+
+
+def _to_mask(action):
+    """Accept an action bitmask, a name, or an iterable of names."""
+    if action is None:
+        return 0
+    if isinstance(action, int):
+        return action
+    if isinstance(action, str):
+        action = (action,)
+    return encode_actions({name: True for name in action})
+
+
+def _worker(conn, map_path, start_x, start_y, seed, frames_per_step):
+    """
+    Own one BotController and serve commands from the parent.
+
+    pygame is never quit here: the process exits instead, and a forked
+    child may have inherited an initialized SDL from the parent.
+    """
+    bot = None
+
+    def reset(new_seed):
+        nonlocal bot
+        if bot is not None:
+            bot.close(quit_game=False)
+        bot = BotController(seed=new_seed)
+        bot.start_overworld(map_path, start_x, start_y)
+        return observe(bot)
+
+    try:
+        while True:
+            command, payload = conn.recv()
+            try:
+                if command == "step":
+                    if bot is None:
+                        reset(seed)
+                    bot.buttons.mask = payload
+                    bot.step(frames_per_step)
+                    conn.send(("ok", observe(bot)))
+                elif command == "reset":
+                    conn.send(("ok", reset(seed if payload is None else payload)))
+                elif command == "close":
+                    conn.send(("ok", None))
+                    break
+                else:
+                    conn.send(("error", f"Unknown command: {command}"))
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if bot is not None:
+            bot.close(quit_game=False)
+        conn.close()
+
+
+class VectorEnv:
+    """
+    N independent game instances stepped together.
+
+    Each instance lives in its own process with its own pygame display and
+    module-level loaders, so instances never share mutable state and
+    stepping scales with cores. Commands are sent to every worker before any
+    reply is read, so workers step concurrently.
+    """
+
+    def __init__(
+        self,
+        num_envs,
+        map_path="assets/maps/pallet_town.tmx",
+        start_x=-1,
+        start_y=-1,
+        seeds=None,
+        frames_per_step=1,
+        start_method=None
+    ):
+        """
+        Start the workers.
+
+        Args:
+            num_envs: Number of game instances
+            map_path: Map every instance starts on
+            start_x, start_y: Starting tile (negative uses the map's player_start)
+            seeds: Per-instance RNG seeds (defaults to 0..num_envs-1)
+            frames_per_step: Logic ticks each step() advances, holding the action
+            start_method: multiprocessing start method; defaults to "fork"
+                where available so preloaded data is shared
+        """
+        if seeds is None:
+            seeds = list(range(num_envs))
+        if len(seeds) != num_envs:
+            raise ValueError("Need one seed per environment")
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "fork" if "fork" in methods else methods[0]
+
+        self.num_envs = num_envs
+        self.closed = False
+        if start_method == "fork":
+            preload_game_data()
+        context = multiprocessing.get_context(start_method)
+
+        self._connections = []
+        self._processes = []
+        with frozen_heap() if start_method == "fork" else nullcontext():
+            for seed in seeds:
+                self._start_worker(context, seed, map_path, start_x, start_y, frames_per_step)
+
+    def _start_worker(self, context, seed, map_path, start_x, start_y, frames_per_step):
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker,
+            args=(child_conn, map_path, start_x, start_y, seed, frames_per_step),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._connections.append(parent_conn)
+        self._processes.append(process)
+
+    def _broadcast(self, command, payloads):
+        for conn, payload in zip(self._connections, payloads):
+            conn.send((command, payload))
+        results = []
+        errors = []
+        for index, conn in enumerate(self._connections):
+            status, value = conn.recv()
+            if status == "error":
+                errors.append(f"env {index}:\n{value}")
+            results.append(value)
+        if errors:
+            raise RuntimeError("Worker failed: " + "\n".join(errors))
+        return results
+
+    def reset(self, seeds=None):
+        """
+        Start every instance over on the starting map.
+
+        Args:
+            seeds: Optional new per-instance seeds
+
+        Returns:
+            List of observations
+        """
+        return self._broadcast("reset", seeds if seeds is not None else [None] * self.num_envs)
+
+    def step(self, actions):
+        """
+        Hold each instance's action for frames_per_step ticks.
+
+        Args:
+            actions: One per instance; a bitmask, an action name, a list of
+                names, or None for no buttons
+
+        Returns:
+            List of observations
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        return self._broadcast("step", [_to_mask(action) for action in actions])
+
+    def close(self):
+        """Stop all workers."""
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self._connections:
+            try:
+                conn.send(("close", None))
+                conn.recv()
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,9 +1,13 @@
 # ABOUTME: Entry point for Pokemon Yellow game
 # ABOUTME: Initializes the game engine and starts in Pallet Town
 
-from src.engine.game import Game
-from src.engine import constants
-from src.states.title_menu_state import TitleMenuState
+# Installed before the other imports so they are timed too
+from src.engine.startup_trace import start_from_environment
+startup_tracer = start_from_environment()
+
+from src.engine.game import Game  # noqa: E402
+from src.engine import constants  # noqa: E402
+from src.states.title_menu_state import TitleMenuState  # noqa: E402
 
 
 def main():
@@ -12,8 +16,14 @@ def main():
     print(f"Window size: {constants.WINDOW_WIDTH}x{constants.WINDOW_HEIGHT}")
     print(f"Game resolution: {constants.GAME_WIDTH}x{constants.GAME_HEIGHT} (scaled {constants.SCALE_FACTOR}x)")
 
+    if startup_tracer is not None:
+        startup_tracer.mark("imports_done")
+
     # Create game and initial state
     game = Game()
+    game.startup_tracer = startup_tracer
+    if startup_tracer is not None:
+        startup_tracer.mark("game_created")
     initial_state = TitleMenuState(game)
     game.push_state(initial_state)
 
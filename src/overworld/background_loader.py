@@ -0,0 +1,89 @@
+# ABOUTME: Worker-thread loading of TMX maps into ready-to-use MapManager objects
+# ABOUTME: Lets the main loop request maps early and pick them up without blocking
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.overworld.map import MapManager
+
+
+class BackgroundMapLoader:
+    """Loads maps on a worker thread, keyed by map path."""
+
+    def __init__(
+        self,
+        load_map: Callable[..., MapManager] = MapManager,
+        max_workers: int = 1
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            load_map: Callable that builds a map from a path (plus any request args)
+            max_workers: Number of worker threads
+        """
+        self.load_map = load_map
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="map-loader")
+        self._futures: dict[str, Future] = {}
+
+    def __getstate__(self):
+        # Savestates keep the configuration; in-flight loads are dropped and
+        # simply requested again after a restore
+        return {"load_map": self.load_map, "max_workers": self.max_workers}
+
+    def __setstate__(self, state):
+        self.__init__(state["load_map"], state["max_workers"])
+
+    def request(self, map_path: str, *args: Any) -> None:
+        """Start loading a map unless it is already loading or loaded."""
+        if map_path not in self._futures:
+            self._futures[map_path] = self._executor.submit(self.load_map, map_path, *args)
+
+    def is_requested(self, map_path: str) -> bool:
+        """Return True if the map is loading or loaded."""
+        return map_path in self._futures
+
+    def is_ready(self, map_path: str) -> bool:
+        """Return True if the map finished loading (successfully or not)."""
+        future = self._futures.get(map_path)
+        return future is not None and future.done()
+
+    def take(self, map_path: str, wait: bool = False) -> MapManager | None:
+        """
+        Hand a loaded map to the caller and forget it.
+
+        Args:
+            map_path: Path previously passed to request()
+            wait: Block until the map is loaded instead of returning None
+
+        Returns:
+            The loaded map, or None if it was never requested or isn't ready.
+            Errors raised by the worker are re-raised here.
+        """
+        future = self._futures.get(map_path)
+        if future is None:
+            return None
+        if not wait and not future.done():
+            return None
+        del self._futures[map_path]
+        return future.result()
+
+    def discard(self, map_path: str) -> None:
+        """Drop a requested map, cancelling it if the worker hasn't started."""
+        future = self._futures.pop(map_path, None)
+        if future is not None:
+            future.cancel()
+
+    def pending_paths(self) -> list[str]:
+        """Return paths that are loading or loaded but not yet taken."""
+        return list(self._futures.keys())
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker thread, dropping queued work (wait=True lets a running load finish)."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=wait)
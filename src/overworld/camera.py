@@ -17,8 +17,13 @@ class Camera:
         """
         self.x = 0
         self.y = 0
+        # Offset at the start of the current logic tick (for interpolation)
+        self.prev_x = 0
+        self.prev_y = 0
         self.map_width = map_width_pixels
         self.map_height = map_height_pixels
+        # Edges that continue into a connected map and may scroll past
+        self.open_edges = set()
 
     def center_on(self, target_x, target_y):
         """
@@ -36,32 +41,47 @@ class Camera:
         self.clamp_to_bounds()
 
     def clamp_to_bounds(self):
-        """Ensure camera doesn't show area outside the map."""
+        """Ensure camera doesn't show area outside the map (except open edges)."""
         # Don't scroll past left edge
-        if self.x < 0:
+        if self.x < 0 and "west" not in self.open_edges:
             self.x = 0
 
         # Don't scroll past top edge
-        if self.y < 0:
+        if self.y < 0 and "north" not in self.open_edges:
             self.y = 0
 
         # Don't scroll past right edge
         max_x = self.map_width - constants.GAME_WIDTH
         if max_x < 0:
             max_x = 0
-        if self.x > max_x:
+        if self.x > max_x and "east" not in self.open_edges:
             self.x = max_x
 
         # Don't scroll past bottom edge
         max_y = self.map_height - constants.GAME_HEIGHT
         if max_y < 0:
             max_y = 0
-        if self.y > max_y:
+        if self.y > max_y and "south" not in self.open_edges:
             self.y = max_y
 
-    def get_offset(self):
-        """Get camera offset for rendering. Returns (x, y) tuple."""
-        return (self.x, self.y)
+    def store_previous_position(self):
+        """Remember the current offset as the start of a logic tick."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_offset(self, alpha=1.0):
+        """
+        Get camera offset for rendering. Returns (x, y) tuple.
+
+        Args:
+            alpha: Blend between the previous tick (0.0) and current tick (1.0)
+        """
+        if alpha >= 1.0:
+            return (self.x, self.y)
+        return (
+            round(self.prev_x + (self.x - self.prev_x) * alpha),
+            round(self.prev_y + (self.y - self.prev_y) * alpha)
+        )
 
     def world_to_screen(self, world_x, world_y):
         """
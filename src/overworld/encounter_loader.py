@@ -1,7 +1,7 @@
 # ABOUTME: Encounter data loader for wild Pokemon encounters
 # ABOUTME: Loads and caches encounter zones from YAML
 
-from src.overworld.encounter_zones import EncounterZone, EncounterSlot
+from src.overworld.encounter_zones import EncounterZone, EncounterSlot, merge_encounter_slots
 from src.data import data_loader
 
 
@@ -39,10 +39,11 @@ class EncounterLoader:
                 encounter_rate = 10
 
                 # Create encounter zone
+                # PokéAPI lists some slots several times; merge them once here
                 zone = EncounterZone(
                     map_name=self._normalize_map_name(location_key),
                     grass_tiles=[],
-                    encounters=encounter_slots,
+                    encounters=merge_encounter_slots(encounter_slots),
                     encounter_rate=encounter_rate
                 )
 
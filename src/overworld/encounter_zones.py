@@ -1,7 +1,7 @@
 # ABOUTME: Wild encounter zone definitions
-# ABOUTME: Defines which Pokemon appear in which map areas
+# ABOUTME: Defines which Pokemon appear in which map areas, sampled through alias tables
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import random
 
 
@@ -14,6 +14,126 @@ class EncounterSlot:
     weight: int  # Relative probability
 
 
+def merge_encounter_slots(slots: list[EncounterSlot]) -> list[EncounterSlot]:
+    """
+    Combine slots for the same species and level range, summing their weights.
+
+    Args:
+        slots: Encounter slots, possibly with duplicates
+
+    Returns:
+        One slot per (species, level range), in first-seen order
+    """
+    merged: dict[tuple[str, int, int], EncounterSlot] = {}
+    for slot in slots:
+        key = (slot.species_id, slot.min_level, slot.max_level)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = replace(slot)
+        else:
+            existing.weight += slot.weight
+    return list(merged.values())
+
+
+class EncounterTable:
+    """
+    Walker alias table over weighted encounter slots.
+
+    Each draw takes one uniform number: its integer part picks a column and
+    its fraction decides between the column's own slot and its alias, so a
+    draw costs the same however many slots the zone has. Columns are built
+    with integer arithmetic (Vose's method), so each slot's probability is
+    exactly its weight over the total.
+    """
+
+    def __init__(self, slots: list[EncounterSlot]):
+        """
+        Args:
+            slots: Encounter slots; slots with no weight are dropped
+        """
+        self.slots = [slot for slot in slots if slot.weight > 0]
+        count = len(self.slots)
+        self.total_weight = sum(slot.weight for slot in self.slots)
+        # Column i keeps its own slot with probability thresholds[i] / total_weight
+        self.thresholds = [slot.weight * count for slot in self.slots]
+        self.aliases = list(range(count))
+
+        small = [index for index, scaled in enumerate(self.thresholds) if scaled < self.total_weight]
+        large = [index for index, scaled in enumerate(self.thresholds) if scaled >= self.total_weight]
+        while small and large:
+            short, tall = small.pop(), large[-1]
+            self.aliases[short] = tall
+            self.thresholds[tall] -= self.total_weight - self.thresholds[short]
+            if self.thresholds[tall] < self.total_weight:
+                small.append(large.pop())
+        # Integer arithmetic leaves any remaining columns exactly full
+        for index in small + large:
+            self.thresholds[index] = self.total_weight
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def probability(self, index: int) -> float:
+        """Probability that a draw lands on slots[index] (weight / total weight)."""
+        count = len(self.slots)
+        own = self.thresholds[index] / self.total_weight
+        aliased = sum(
+            1 - self.thresholds[column] / self.total_weight
+            for column in range(count) if self.aliases[column] == index and column != index
+        )
+        return (own + aliased) / count
+
+    def draw_slot(self, rng=random) -> EncounterSlot:
+        """
+        Pick one slot.
+
+        Args:
+            rng: Anything with random(); defaults to the global random module
+
+        Returns:
+            The chosen EncounterSlot
+
+        Raises:
+            ValueError: If the table has no slots
+        """
+        if not self.slots:
+            raise ValueError("Encounter table has no slots")
+        column, fraction = divmod(rng.random() * len(self.slots), 1.0)
+        column = int(column)
+        if fraction * self.total_weight >= self.thresholds[column]:
+            column = self.aliases[column]
+        return self.slots[column]
+
+    def draw(self, rng=random) -> tuple[str, int]:
+        """
+        Pick one encounter.
+
+        Args:
+            rng: Anything with random() and randint(); defaults to the global random module
+
+        Returns:
+            Tuple of (species_id, level)
+        """
+        slot = self.draw_slot(rng)
+        if slot.min_level == slot.max_level:
+            return (slot.species_id, slot.min_level)
+        return (slot.species_id, rng.randint(slot.min_level, slot.max_level))
+
+    def sample(self, n: int, rng=random) -> list[tuple[str, int]]:
+        """
+        Draw n encounters, e.g. to simulate encounter rates over many steps.
+
+        Args:
+            n: Number of encounters
+            rng: Anything with random() and randint(); defaults to the global random module
+
+        Returns:
+            List of (species_id, level) tuples
+        """
+        draw = self.draw
+        return [draw(rng) for _ in range(n)]
+
+
 class EncounterZone:
     """Defines wild encounters for a map area."""
 
@@ -32,6 +152,7 @@ class EncounterZone:
         self.grass_tiles = set(grass_tiles)
         self.encounters = encounters
         self.encounter_rate = encounter_rate
+        self.table = EncounterTable(encounters)
 
     def is_grass_tile(self, tile_id: int) -> bool:
         """Check if tile ID is grass."""
@@ -48,20 +169,20 @@ class EncounterZone:
         Returns:
             Tuple of (species_id, level)
         """
-        # Weight-based selection
-        total_weight = sum(slot.weight for slot in self.encounters)
-        roll = random.randint(1, total_weight)
-
-        cumulative = 0
-        for slot in self.encounters:
-            cumulative += slot.weight
-            if roll <= cumulative:
-                level = random.randint(slot.min_level, slot.max_level)
-                return (slot.species_id, level)
-
-        # Fallback (shouldn't reach here)
-        slot = self.encounters[0]
-        return (slot.species_id, slot.min_level)
+        return self.table.draw()
+
+    def sample(self, n: int, rng=random) -> list[tuple[str, int]]:
+        """
+        Draw n encounters in one call (see EncounterTable.sample).
+
+        Args:
+            n: Number of encounters
+            rng: Anything with random() and randint(); defaults to the global random module
+
+        Returns:
+            List of (species_id, level) tuples
+        """
+        return self.table.sample(n, rng)
 
 
 # Global encounter loader instance (initialized on first use)
@@ -24,10 +24,13 @@ class SpriteSheet:
         self.original_image = pygame.image.load(filepath).convert_alpha()
         self.image = self.original_image.copy()
         self.frame_size = frame_size
+        # Visible frame, rebuilt only after the image scrolls or flips
+        self._frame = None
 
     def set_orientation(self, direction: int):
         """Reset image and scroll to the correct row for the given direction."""
         self.image = self.original_image.copy()
+        self._frame = None
 
         # Scroll vertically to correct row
         if direction == constants.DIR_DOWN:
@@ -42,16 +45,19 @@ class SpriteSheet:
     def set_walking_frame(self):
         """Scroll horizontally to the walking frame (column 1)."""
         self.image.scroll(-self.frame_size, 0)
+        self._frame = None
 
     def flip_horizontal(self):
         """Flip the image horizontally for foot alternation."""
         self.image = pygame.transform.flip(self.image, True, False)
+        self._frame = None
 
     def get_current_frame(self) -> pygame.Surface:
         """Get the current visible frame (top-left frame_size x frame_size area)."""
-        frame = pygame.Surface((self.frame_size, self.frame_size), pygame.SRCALPHA)
-        frame.blit(self.image, (0, 0), (0, 0, self.frame_size, self.frame_size))
-        return frame
+        if self._frame is None:
+            self._frame = pygame.Surface((self.frame_size, self.frame_size), pygame.SRCALPHA)
+            self._frame.blit(self.image, (0, 0), (0, 0, self.frame_size, self.frame_size))
+        return self._frame
 
 
 class Entity:
@@ -77,6 +83,10 @@ class Entity:
         self.pixel_x = tile_x * constants.METATILE_SIZE
         self.pixel_y = tile_y * constants.METATILE_SIZE
 
+        # Pixel position at the start of the current logic tick (for interpolation)
+        self.prev_pixel_x = self.pixel_x
+        self.prev_pixel_y = self.pixel_y
+
         # Movement state
         self.is_moving = False
         self.move_progress = 0  # 0 to METATILE_SIZE
@@ -185,6 +195,28 @@ class Entity:
         """Get current pixel position. Returns (x, y) tuple."""
         return (self.pixel_x, self.pixel_y)
 
+    def store_previous_position(self):
+        """Remember the current pixel position as the start of a logic tick."""
+        self.prev_pixel_x = self.pixel_x
+        self.prev_pixel_y = self.pixel_y
+
+    def get_render_position(self, alpha=1.0):
+        """
+        Get the pixel position blended between the last two logic ticks.
+
+        Args:
+            alpha: 0.0 = previous tick, 1.0 = current tick
+
+        Returns:
+            (x, y) tuple in world pixels
+        """
+        if alpha >= 1.0:
+            return (self.pixel_x, self.pixel_y)
+        return (
+            round(self.prev_pixel_x + (self.pixel_x - self.prev_pixel_x) * alpha),
+            round(self.prev_pixel_y + (self.pixel_y - self.prev_pixel_y) * alpha)
+        )
+
     def get_tile_position(self):
         """Get current tile position. Returns (x, y) tuple."""
         return (self.tile_x, self.tile_y)
@@ -0,0 +1,192 @@
+# ABOUTME: Sparse span representation for fringe (above-player) map layers
+# ABOUTME: Compiles fringe tiles into culled rect/surface strips instead of a full alpha surface
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable
+
+import pygame
+
+from src.engine import constants
+from src.overworld.map_chunks import ChunkKey, TilePlacement, visible_chunk_keys
+
+
+# Key color for binary-alpha strips; verified per strip so a clash falls back to alpha
+FRINGE_COLORKEY = (255, 0, 255)
+
+Span = tuple[pygame.Rect, pygame.Surface]
+
+
+class FringeSpans:
+    """
+    Fringe layers compiled to sparse (world rect, surface) spans.
+
+    Spans are compiled when the map loads (see compile), up to max_chunks
+    of them nearest the player's start, and kept in an LRU; a chunk evicted
+    on a large map is recompiled the next time it becomes visible. Each
+    chunk is scanned in tile-sized cells; occupied cells are merged
+    into horizontal runs, and runs with identical extents in consecutive
+    rows are merged into rectangles. Strips whose alpha is fully on/off
+    are stored as RLE-accelerated colorkey surfaces, which blit much
+    faster than per-pixel alpha. Drawing cost scales with the number of
+    visible fringe tiles rather than with the viewport area.
+    """
+
+    def __init__(
+        self,
+        tiles_by_chunk: dict[ChunkKey, list[TilePlacement]],
+        width_px: int,
+        height_px: int,
+        get_tile_image: Callable[[int], pygame.Surface | None],
+        chunk_size: int = constants.MAP_CHUNK_SIZE,
+        cell_size: int = constants.TILE_SIZE,
+        max_chunks: int = constants.MAP_CHUNK_CACHE_LIMIT
+    ):
+        """
+        Initialize fringe spans (call compile() to build them up front).
+
+        Args:
+            tiles_by_chunk: Fringe tile placements grouped by chunk
+            width_px, height_px: Map size in pixels
+            get_tile_image: Resolves a tile gid to its image
+            chunk_size: Chunk edge length in pixels
+            cell_size: Granularity used when scanning for occupied pixels
+            max_chunks: Maximum number of compiled chunks kept alive
+        """
+        self.tiles_by_chunk = tiles_by_chunk
+        self.width_px = width_px
+        self.height_px = height_px
+        self.get_tile_image = get_tile_image
+        self.chunk_size = chunk_size
+        self.cell_size = cell_size
+        self.max_chunks = max(1, max_chunks)
+        self.columns = (width_px + chunk_size - 1) // chunk_size
+        self.rows = (height_px + chunk_size - 1) // chunk_size
+        self.compile_count = 0
+        self._spans: OrderedDict[ChunkKey, list[Span]] = OrderedDict()
+
+    def compile(self, focus: tuple[int, int] | None = None) -> None:
+        """
+        Compile chunks with fringe tiles ahead of drawing, up to max_chunks.
+
+        Args:
+            focus: World pixel the player starts near (defaults to the map
+                center); chunks closest to it are compiled first, so a map
+                with more fringe chunks than max_chunks keeps the ones
+                visible on arrival
+        """
+        if focus is None:
+            focus = (self.width_px // 2, self.height_px // 2)
+        half = self.chunk_size // 2
+
+        def distance(key: ChunkKey) -> int:
+            dx = key[0] * self.chunk_size + half - focus[0]
+            dy = key[1] * self.chunk_size + half - focus[1]
+            return dx * dx + dy * dy
+
+        # Farthest first, so the nearest chunks end up most recently used
+        nearest = sorted(self.tiles_by_chunk, key=distance)[:self.max_chunks]
+        for key in reversed(nearest):
+            self.spans_for_chunk(key)
+
+    def spans_for_chunk(self, key: ChunkKey) -> list[Span]:
+        """Return compiled spans for a chunk, compiling it if it isn't cached."""
+        spans = self._spans.get(key)
+        if spans is not None:
+            self._spans.move_to_end(key)
+            return spans
+        if key not in self.tiles_by_chunk:
+            return []
+
+        spans = self._compile_chunk(key)
+        self.compile_count += 1
+        self._spans[key] = spans
+        if len(self._spans) > self.max_chunks:
+            self._spans.popitem(last=False)
+        return spans
+
+    def cached_keys(self) -> list[ChunkKey]:
+        """Return keys of compiled chunks currently held, least recently used first."""
+        return list(self._spans.keys())
+
+    def draw(self, renderer, camera_x: int, camera_y: int) -> None:
+        """Blit spans intersecting the viewport."""
+        view = pygame.Rect(camera_x, camera_y, constants.GAME_WIDTH, constants.GAME_HEIGHT)
+        for key in visible_chunk_keys(camera_x, camera_y, self.columns, self.rows, self.chunk_size):
+            for rect, surface in self.spans_for_chunk(key):
+                if rect.colliderect(view):
+                    renderer.draw_surface(surface, (rect.x - camera_x, rect.y - camera_y))
+
+    def _compile_chunk(self, key: ChunkKey) -> list[Span]:
+        origin_x = key[0] * self.chunk_size
+        origin_y = key[1] * self.chunk_size
+        width = min(self.chunk_size, self.width_px - origin_x)
+        height = min(self.chunk_size, self.height_px - origin_y)
+
+        # Temporary scratch surface; only the occupied strips are kept
+        scratch = pygame.Surface((width, height), pygame.SRCALPHA)
+        for gid, px, py in self.tiles_by_chunk[key]:
+            tile = self.get_tile_image(gid)
+            if tile:
+                scratch.blit(tile, (px - origin_x, py - origin_y))
+
+        spans = []
+        for local_rect in self._occupied_rects(scratch):
+            strip = scratch.subsurface(local_rect).copy()
+            world_rect = local_rect.move(origin_x, origin_y)
+            spans.append((world_rect, self._optimize_strip(strip)))
+        return spans
+
+    def _occupied_rects(self, scratch: pygame.Surface) -> list[pygame.Rect]:
+        width, height = scratch.get_size()
+        cell = self.cell_size
+        closed: list[pygame.Rect] = []
+        open_runs: dict[tuple[int, int], pygame.Rect] = {}
+
+        for cell_y in range(0, height, cell):
+            cell_h = min(cell, height - cell_y)
+            runs = []
+            run_start = None
+            for cell_x in range(0, width, cell):
+                cell_w = min(cell, width - cell_x)
+                bounds = scratch.subsurface((cell_x, cell_y, cell_w, cell_h)).get_bounding_rect()
+                occupied = bounds.width > 0 and bounds.height > 0
+                if occupied and run_start is None:
+                    run_start = cell_x
+                elif not occupied and run_start is not None:
+                    runs.append((run_start, cell_x - run_start))
+                    run_start = None
+            if run_start is not None:
+                runs.append((run_start, width - run_start))
+
+            # Extend rectangles whose horizontal extent repeats on this row
+            next_open: dict[tuple[int, int], pygame.Rect] = {}
+            for run in runs:
+                rect = open_runs.pop(run, None)
+                if rect is not None:
+                    rect.height += cell_h
+                else:
+                    rect = pygame.Rect(run[0], cell_y, run[1], cell_h)
+                next_open[run] = rect
+            closed.extend(open_runs.values())
+            open_runs = next_open
+
+        closed.extend(open_runs.values())
+        return sorted(closed, key=lambda rect: (rect.y, rect.x))
+
+    def _optimize_strip(self, strip: pygame.Surface) -> pygame.Surface:
+        """Convert a strip to an RLE colorkey surface when its alpha is binary."""
+        visible = pygame.mask.from_surface(strip, 0).count()
+        opaque = pygame.mask.from_surface(strip, 254).count()
+        if visible != opaque:
+            return strip
+
+        keyed = pygame.Surface(strip.get_size())
+        keyed.fill(FRINGE_COLORKEY)
+        keyed.blit(strip, (0, 0))
+        keyed.set_colorkey(FRINGE_COLORKEY, pygame.RLEACCEL)
+        if pygame.mask.from_surface(keyed).count() != opaque:
+            # An opaque pixel matched the key color; keep per-pixel alpha
+            return strip
+        return keyed
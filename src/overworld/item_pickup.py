@@ -15,7 +15,8 @@ class ItemPickup:
         self.tile_x = tile_x
         self.tile_y = tile_y
 
-    def render(self, renderer, camera_x: int, camera_y: int) -> None:
+    def render(self, renderer, camera_x: int, camera_y: int, alpha: float = 1.0) -> None:
+        # Pickups never move, so alpha (tick interpolation) has no effect
         x = self.tile_x * constants.METATILE_SIZE - camera_x
         y = self.tile_y * constants.METATILE_SIZE - camera_y
         size = constants.METATILE_SIZE // 2
@@ -1,4 +1,4 @@
-# ABOUTME: Map manager for TMX maps with cached rendering surfaces
+# ABOUTME: Map manager for TMX maps with chunked, lazily rendered surfaces
 # ABOUTME: Handles collisions, grass detection, and object-driven spawns
 
 from __future__ import annotations
@@ -11,12 +11,15 @@ import pytmx
 
 from src.engine import constants
 from src.overworld.dialog_loader import DialogLoader
+from src.overworld.fringe_spans import FringeSpans
 from src.overworld.item_pickup import ItemPickup
+from src.overworld.map_chunks import MapChunkCache, bucket_tiles, visible_chunk_keys
 from src.overworld.npc import NPC
+from src.overworld.tile_animation import TileAnimator
 
 
 class MapManager:
-    """Loads TMX maps, caches render surfaces, and exposes map helpers."""
+    """Loads TMX maps, renders layer chunks on demand, and exposes map helpers."""
 
     def __init__(self, map_filepath: str):
         self.map_filepath = map_filepath
@@ -47,9 +50,10 @@ class MapManager:
         self._grass_grid = [[False for _ in range(self.metatile_width)] for _ in range(self.metatile_height)]
         self._build_collision_and_grass()
 
-        self.lower_surface: pygame.Surface
-        self.fringe_surface: pygame.Surface
-        self._build_cached_surfaces()
+        self.tile_animator: TileAnimator
+        self.lower_chunks: MapChunkCache
+        self.fringe_spans: FringeSpans
+        self._build_chunk_caches()
 
         self.npcs: list[NPC] = []
         self.warps: list[dict[str, Any]] = []
@@ -58,6 +62,10 @@ class MapManager:
         self.dialog_loader = DialogLoader()
         self._parse_objects()
         self._build_tile_warps()
+        self._compile_fringe_spans()
+
+        self.connections: dict[str, dict[str, Any]] = {}
+        self._parse_connections()
 
     def _collect_layers(self) -> None:
         for layer in self.tmx_data.layers:
@@ -112,20 +120,52 @@ class MapManager:
                             if "is_grass" in properties:
                                 self._grass_grid[metatile_y][metatile_x] = True
 
-    def _build_cached_surfaces(self) -> None:
-        width_px = self.width * self.tile_width
-        height_px = self.height * self.tile_height
-        self.lower_surface = pygame.Surface((width_px, height_px))
-        self.fringe_surface = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
+    def _build_chunk_caches(self) -> None:
+        # Lower chunks are rendered lazily when they intersect the viewport;
+        # sparse fringe spans are compiled at load time (_compile_fringe_spans)
+        width_px = self.get_width_pixels()
+        height_px = self.get_height_pixels()
+        lower_tiles = bucket_tiles(self._tile_placements(self.lower_layers))
+        self.tile_animator = TileAnimator(self.tmx_data, lower_tiles)
+        self.lower_chunks = MapChunkCache(
+            lower_tiles,
+            width_px,
+            height_px,
+            self._get_tile_image
+        )
+        # Fringe tiles are sparse, so they compile to culled spans rather
+        # than mostly transparent alpha chunks
+        self.fringe_spans = FringeSpans(
+            bucket_tiles(self._tile_placements(self.fringe_layers)),
+            width_px,
+            height_px,
+            self.tmx_data.get_tile_image_by_gid
+        )
+
+    def _compile_fringe_spans(self) -> None:
+        # Compile while loading, nearest the player's start first, so the
+        # first frame on the map draws fringe tiles without compiling any
+        focus = None
+        if self.player_start is not None:
+            focus = (
+                self.player_start[0] * constants.METATILE_SIZE + constants.METATILE_SIZE // 2,
+                self.player_start[1] * constants.METATILE_SIZE + constants.METATILE_SIZE // 2
+            )
+        self.fringe_spans.compile(focus)
 
-        self._render_layers_to_surface(self.lower_layers, self.lower_surface)
-        self._render_layers_to_surface(self.fringe_layers, self.fringe_surface)
+    def _get_tile_image(self, gid: int) -> pygame.Surface | None:
+        """Resolve a gid to its image, using the current frame for animated tiles."""
+        image = self.tile_animator.get_image(gid)
+        if image is not None:
+            return image
+        return self.tmx_data.get_tile_image_by_gid(gid)
 
-    def _render_layers_to_surface(
+    def _tile_placements(
         self,
-        layers: list[pytmx.TiledTileLayer],
-        surface: pygame.Surface
-    ) -> None:
+        layers: list[pytmx.TiledTileLayer]
+    ) -> list[tuple[int, pygame.Rect]]:
+        """Return (gid, pixel rect) for every non-empty tile, in layer order."""
+        placements = []
         for layer in layers:
             for x, y, gid in layer:
                 if gid == 0:
@@ -138,7 +178,8 @@ class MapManager:
                     y_offset = tile_height - self.tile_height
                     px = x * self.tile_width
                     py = y * self.tile_height - y_offset
-                    surface.blit(tile, (px, py))
+                    placements.append((gid, pygame.Rect(px, py, tile.get_width(), tile_height)))
+        return placements
 
     def _parse_objects(self) -> None:
         for obj in self.tmx_data.objects:
@@ -208,6 +249,24 @@ class MapManager:
             "dest_y": dest_y
         })
 
+    def _parse_connections(self) -> None:
+        """
+        Read Gen 1-style edge connections from map properties.
+
+        A property ``connection_<direction>`` names the neighboring map and
+        ``connection_<direction>_offset`` shifts it along the shared edge in
+        metatiles (positive = right for north/south, down for west/east).
+        """
+        properties = self.tmx_data.properties or {}
+        for direction in ("north", "south", "west", "east"):
+            dest_map = properties.get(f"connection_{direction}")
+            if not dest_map:
+                continue
+            self.connections[direction] = {
+                "map": str(dest_map).strip(),
+                "offset": self._coerce_int(properties.get(f"connection_{direction}_offset"), 0)
+            }
+
     def _object_tile_position(self, obj: pytmx.TiledObject) -> tuple[int, int]:
         """Convert pixel position to metatile position."""
         metatile_x = int(obj.x // constants.METATILE_SIZE)
@@ -274,11 +333,81 @@ class MapManager:
                     self.player_start = (x // 2, y // 2)
 
 
+    def update(self, dt: float) -> None:
+        """
+        Advance animated tiles.
+
+        Only tiles whose frame changed are queued for re-blitting, and the
+        re-blit happens when their chunk is next drawn on screen.
+
+        Args:
+            dt: Delta time in seconds
+        """
+        for gid in self.tile_animator.update(dt * 1000.0):
+            for key, placements in self.tile_animator.placements[gid].items():
+                self.lower_chunks.mark_dirty(key, placements)
+
+    def prepare_view(self, metatile_x: int, metatile_y: int) -> None:
+        """
+        Pre-render the chunks and fringe spans visible around a metatile.
+
+        Used when loading ahead of time so the first frame on the map
+        doesn't pay for chunk rendering.
+        """
+        max_x = max(0, self.get_width_pixels() - constants.GAME_WIDTH)
+        max_y = max(0, self.get_height_pixels() - constants.GAME_HEIGHT)
+        center_x = metatile_x * constants.METATILE_SIZE + constants.METATILE_SIZE // 2
+        center_y = metatile_y * constants.METATILE_SIZE + constants.METATILE_SIZE // 2
+        camera_x = min(max(0, center_x - constants.GAME_WIDTH // 2), max_x)
+        camera_y = min(max(0, center_y - constants.GAME_HEIGHT // 2), max_y)
+
+        for key in visible_chunk_keys(camera_x, camera_y, self.lower_chunks.columns, self.lower_chunks.rows):
+            self.lower_chunks.get_chunk(key)
+        for key in visible_chunk_keys(camera_x, camera_y, self.fringe_spans.columns, self.fringe_spans.rows):
+            self.fringe_spans.spans_for_chunk(key)
+
+    def capture_state(self) -> dict[str, Any]:
+        """
+        Snapshot what changes while the map is played.
+
+        NPCs and item pickups are returned as the live objects so a caller
+        can pickle them alongside states that share them; animation frames
+        are plain (index, elapsed) pairs.
+        """
+        return {
+            "npcs": self.npcs,
+            "item_pickups": self.item_pickups,
+            "animations": {
+                gid: (animation.index, animation.elapsed_ms)
+                for gid, animation in self.tile_animator.animations.items()
+            }
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """
+        Put back a snapshot from capture_state().
+
+        Args:
+            state: Snapshot, usually unpickled from a savestate
+        """
+        self.npcs = state["npcs"]
+        self.item_pickups = state["item_pickups"]
+        for gid, (index, elapsed_ms) in state["animations"].items():
+            animation = self.tile_animator.animations.get(gid)
+            if animation is None:
+                continue
+            animation.index = index
+            animation.elapsed_ms = elapsed_ms
+        # Cached chunks may show other animation frames
+        for by_chunk in self.tile_animator.placements.values():
+            for key, placements in by_chunk.items():
+                self.lower_chunks.mark_dirty(key, placements)
+
     def draw_base(self, renderer, camera_x: int, camera_y: int) -> None:
-        renderer.draw_surface(self.lower_surface, (-camera_x, -camera_y))
+        self.lower_chunks.draw(renderer, camera_x, camera_y)
 
     def draw_fringe(self, renderer, camera_x: int, camera_y: int) -> None:
-        renderer.draw_surface(self.fringe_surface, (-camera_x, -camera_y))
+        self.fringe_spans.draw(renderer, camera_x, camera_y)
 
     def is_walkable(self, metatile_x: int, metatile_y: int) -> bool:
         """Check if metatile position is walkable."""
@@ -0,0 +1,214 @@
+# ABOUTME: Chunked, lazily rendered map layer surfaces with LRU eviction
+# ABOUTME: Renders fixed-size map regions on demand as they enter the viewport
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator
+
+import pygame
+
+from src.engine import constants
+
+
+ChunkKey = tuple[int, int]
+TilePlacement = tuple[int, int, int]  # (gid, pixel_x, pixel_y)
+
+
+def visible_chunk_keys(
+    camera_x: int,
+    camera_y: int,
+    columns: int,
+    rows: int,
+    chunk_size: int = constants.MAP_CHUNK_SIZE,
+    view_width: int = constants.GAME_WIDTH,
+    view_height: int = constants.GAME_HEIGHT
+) -> Iterator[ChunkKey]:
+    """Yield chunk coordinates intersecting a viewport, clamped to the chunk grid."""
+    start_x = max(0, camera_x // chunk_size)
+    start_y = max(0, camera_y // chunk_size)
+    end_x = min(columns - 1, (camera_x + view_width - 1) // chunk_size)
+    end_y = min(rows - 1, (camera_y + view_height - 1) // chunk_size)
+    for chunk_y in range(start_y, end_y + 1):
+        for chunk_x in range(start_x, end_x + 1):
+            yield chunk_x, chunk_y
+
+
+def bucket_tiles(
+    placements: Iterable[tuple[int, pygame.Rect]],
+    chunk_size: int = constants.MAP_CHUNK_SIZE
+) -> dict[ChunkKey, list[TilePlacement]]:
+    """
+    Group tile placements by every chunk their pixel rect overlaps.
+
+    Tiles taller than the base tile size can straddle chunk borders, so a
+    single placement may appear in more than one bucket. Input order (layer
+    order) is preserved within each bucket.
+    """
+    buckets: dict[ChunkKey, list[TilePlacement]] = {}
+    for gid, rect in placements:
+        start_x = max(0, rect.left // chunk_size)
+        start_y = max(0, rect.top // chunk_size)
+        end_x = (rect.right - 1) // chunk_size
+        end_y = (rect.bottom - 1) // chunk_size
+        for chunk_y in range(start_y, end_y + 1):
+            for chunk_x in range(start_x, end_x + 1):
+                buckets.setdefault((chunk_x, chunk_y), []).append((gid, rect.x, rect.y))
+    return buckets
+
+
+class MapChunkCache:
+    """Renders tile buckets into chunk surfaces on demand and evicts by LRU."""
+
+    def __init__(
+        self,
+        tiles_by_chunk: dict[ChunkKey, list[TilePlacement]],
+        width_px: int,
+        height_px: int,
+        get_tile_image: Callable[[int], pygame.Surface | None],
+        chunk_size: int = constants.MAP_CHUNK_SIZE,
+        max_chunks: int = constants.MAP_CHUNK_CACHE_LIMIT,
+        flags: int = 0
+    ):
+        """
+        Initialize an empty chunk cache.
+
+        Args:
+            tiles_by_chunk: Tile placements grouped by chunk (see bucket_tiles)
+            width_px, height_px: Map size in pixels
+            get_tile_image: Resolves a tile gid to its image
+            chunk_size: Chunk edge length in pixels
+            max_chunks: Maximum number of chunk surfaces kept alive
+            flags: Surface flags for chunk surfaces (e.g. pygame.SRCALPHA)
+        """
+        self.tiles_by_chunk = tiles_by_chunk
+        self.width_px = width_px
+        self.height_px = height_px
+        self.get_tile_image = get_tile_image
+        self.chunk_size = chunk_size
+        self.max_chunks = max(1, max_chunks)
+        self.flags = flags
+        self.columns = (width_px + chunk_size - 1) // chunk_size
+        self.rows = (height_px + chunk_size - 1) // chunk_size
+        self.render_count = 0
+        self.redraw_count = 0
+        self._chunks: OrderedDict[ChunkKey, pygame.Surface] = OrderedDict()
+        # Tiles to re-blit before a cached chunk is next shown
+        self._dirty: dict[ChunkKey, set[TilePlacement]] = {}
+        self._overlaps: dict[tuple[ChunkKey, TilePlacement], list[TilePlacement]] = {}
+
+    def get_chunk(self, key: ChunkKey) -> pygame.Surface | None:
+        """Return the surface for a chunk, rendering it if needed. None if empty."""
+        surface = self._chunks.get(key)
+        if surface is not None:
+            self._chunks.move_to_end(key)
+            dirty = self._dirty.pop(key, None)
+            if dirty:
+                self._redraw_tiles(key, surface, dirty)
+            return surface
+
+        if key not in self.tiles_by_chunk:
+            return None
+
+        surface = self._render_chunk(key)
+        self._chunks[key] = surface
+        if len(self._chunks) > self.max_chunks:
+            evicted, _ = self._chunks.popitem(last=False)
+            self._dirty.pop(evicted, None)
+        return surface
+
+    def mark_dirty(self, key: ChunkKey, placements: Iterable[TilePlacement]) -> None:
+        """
+        Queue tiles for re-blitting in a cached chunk.
+
+        The redraw happens lazily the next time the chunk is fetched, which
+        only occurs while it is visible. Uncached chunks are ignored because
+        they will render with current tile images when first needed.
+        """
+        if key in self._chunks:
+            self._dirty.setdefault(key, set()).update(placements)
+
+    def cached_keys(self) -> list[ChunkKey]:
+        """Return keys of chunks currently held, least recently used first."""
+        return list(self._chunks.keys())
+
+    def clear(self) -> None:
+        """Drop every cached chunk surface."""
+        self._chunks.clear()
+        self._dirty.clear()
+
+    def draw(self, renderer, camera_x: int, camera_y: int) -> None:
+        """Draw all chunks intersecting the viewport at the camera offset."""
+        for key in visible_chunk_keys(camera_x, camera_y, self.columns, self.rows, self.chunk_size):
+            surface = self.get_chunk(key)
+            if surface is None:
+                continue
+            renderer.draw_surface(
+                surface,
+                (key[0] * self.chunk_size - camera_x, key[1] * self.chunk_size - camera_y)
+            )
+
+    def chunk_origin(self, key: ChunkKey) -> tuple[int, int]:
+        """Return the world pixel position of a chunk's top-left corner."""
+        return key[0] * self.chunk_size, key[1] * self.chunk_size
+
+    def _render_chunk(self, key: ChunkKey) -> pygame.Surface:
+        origin_x, origin_y = self.chunk_origin(key)
+        width = min(self.chunk_size, self.width_px - origin_x)
+        height = min(self.chunk_size, self.height_px - origin_y)
+        surface = pygame.Surface((width, height), self.flags)
+
+        for gid, px, py in self.tiles_by_chunk[key]:
+            tile = self.get_tile_image(gid)
+            if tile:
+                surface.blit(tile, (px - origin_x, py - origin_y))
+
+        self.render_count += 1
+        return surface
+
+    def _redraw_tiles(
+        self,
+        key: ChunkKey,
+        surface: pygame.Surface,
+        placements: set[TilePlacement]
+    ) -> None:
+        origin_x, origin_y = self.chunk_origin(key)
+        for placement in placements:
+            rect = self._placement_rect(placement)
+            if rect is None:
+                continue
+            local = rect.move(-origin_x, -origin_y)
+            # Repaint the tile's footprint in layer order so lower layers
+            # under a transparent animated tile are restored too
+            surface.set_clip(local)
+            surface.fill((0, 0, 0, 0))
+            for gid, px, py in self._overlapping(key, placement, rect):
+                tile = self.get_tile_image(gid)
+                if tile:
+                    surface.blit(tile, (px - origin_x, py - origin_y))
+            surface.set_clip(None)
+            self.redraw_count += 1
+
+    def _overlapping(
+        self,
+        key: ChunkKey,
+        placement: TilePlacement,
+        rect: pygame.Rect
+    ) -> list[TilePlacement]:
+        cache_key = (key, placement)
+        overlaps = self._overlaps.get(cache_key)
+        if overlaps is None:
+            overlaps = []
+            for other in self.tiles_by_chunk[key]:
+                other_rect = self._placement_rect(other)
+                if other_rect is not None and other_rect.colliderect(rect):
+                    overlaps.append(other)
+            self._overlaps[cache_key] = overlaps
+        return overlaps
+
+    def _placement_rect(self, placement: TilePlacement) -> pygame.Rect | None:
+        gid, px, py = placement
+        tile = self.get_tile_image(gid)
+        if tile is None:
+            return None
+        return pygame.Rect(px, py, tile.get_width(), tile.get_height())
@@ -0,0 +1,255 @@
+# ABOUTME: Streams connected neighbor maps around the current overworld map
+# ABOUTME: Loads neighbors in the background near edges and answers cross-border queries
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from src.engine import constants
+from src.overworld.background_loader import BackgroundMapLoader
+from src.overworld.map import MapManager
+
+
+CONNECTION_DIRECTIONS = ("north", "south", "west", "east")
+OPPOSITE_DIRECTION = {
+    "north": "south",
+    "south": "north",
+    "west": "east",
+    "east": "west"
+}
+
+
+def connection_origin(
+    current_map: MapManager,
+    direction: str,
+    neighbor: MapManager,
+    offset: int
+) -> tuple[int, int]:
+    """
+    Return the neighbor's top-left corner in the current map's metatile space.
+
+    Args:
+        current_map: Map that declares the connection
+        direction: Edge the neighbor is attached to
+        neighbor: Connected map
+        offset: Shift along the shared edge in metatiles
+    """
+    if direction == "north":
+        return offset, -neighbor.metatile_height
+    if direction == "south":
+        return offset, current_map.metatile_height
+    if direction == "west":
+        return -neighbor.metatile_width, offset
+    if direction == "east":
+        return current_map.metatile_width, offset
+    raise ValueError(f"Unknown connection direction: {direction}")
+
+
+@dataclass
+class NeighborMap:
+    """A resident connected map placed relative to the current map."""
+    direction: str
+    map: MapManager
+    origin_x: int  # Metatiles, in the current map's coordinate space
+    origin_y: int
+
+    def contains(self, metatile_x: int, metatile_y: int) -> bool:
+        return (self.origin_x <= metatile_x < self.origin_x + self.map.metatile_width and
+                self.origin_y <= metatile_y < self.origin_y + self.map.metatile_height)
+
+    def pixel_origin(self) -> tuple[int, int]:
+        return self.origin_x * constants.METATILE_SIZE, self.origin_y * constants.METATILE_SIZE
+
+
+class MapStreamer:
+    """
+    Keeps the current map and its connected neighbors resident.
+
+    Neighbors are requested from a background loader once the player is
+    within MAP_PRELOAD_DISTANCE of the shared edge and dropped again beyond
+    MAP_UNLOAD_DISTANCE, so at most the current map plus one map per edge
+    is held at a time. All coordinates are in the current map's metatile
+    space; neighbors simply sit at negative or past-the-end positions.
+    """
+
+    def __init__(
+        self,
+        current_map: MapManager,
+        resolve_path: Callable[[str], str],
+        loader: BackgroundMapLoader | None = None,
+        preload_distance: int = constants.MAP_PRELOAD_DISTANCE,
+        unload_distance: int = constants.MAP_UNLOAD_DISTANCE
+    ):
+        """
+        Initialize the streamer.
+
+        Args:
+            current_map: Map the player is on
+            resolve_path: Converts a map name from TMX properties to a file path
+            loader: Background loader (one is created if omitted)
+            preload_distance: Edge distance at which neighbors start loading
+            unload_distance: Edge distance past which neighbors are dropped
+        """
+        self.resolve_path = resolve_path
+        self.loader = loader if loader is not None else BackgroundMapLoader()
+        self.preload_distance = preload_distance
+        self.unload_distance = max(unload_distance, preload_distance)
+        self.current_map = current_map
+        self.neighbors: dict[str, NeighborMap] = {}
+
+    def reset(self, current_map: MapManager) -> None:
+        """Replace the current map (e.g. after a warp), dropping all neighbors."""
+        self._discard_pending()
+        self.neighbors.clear()
+        self.current_map = current_map
+
+    def open_edges(self) -> set[str]:
+        """Edges of the current map that continue into a connected map."""
+        return set(self.current_map.connections)
+
+    def update(self, metatile_x: int, metatile_y: int, dt: float = 0.0) -> None:
+        """
+        Request, attach, or drop neighbors based on the player's position.
+
+        Args:
+            metatile_x, metatile_y: Player position in current map metatiles
+            dt: Delta time in seconds, forwarded to resident neighbors' animations
+        """
+        for direction, connection in self.current_map.connections.items():
+            distance = self._edge_distance(direction, metatile_x, metatile_y)
+            path = self.resolve_path(connection["map"])
+            if direction in self.neighbors:
+                if distance > self.unload_distance:
+                    del self.neighbors[direction]
+                continue
+            if distance <= self.preload_distance:
+                self.loader.request(path)
+                loaded = self.loader.take(path)
+                if loaded is not None:
+                    self._attach(direction, loaded)
+            elif distance > self.unload_distance:
+                self.loader.discard(path)
+
+        if dt:
+            for neighbor in self.neighbors.values():
+                neighbor.map.update(dt)
+
+    def neighbor_at(self, metatile_x: int, metatile_y: int) -> NeighborMap | None:
+        """
+        Return the connected map covering an out-of-bounds position.
+
+        If the position lies past a connected edge whose map hasn't finished
+        loading, the load is requested and None is returned, so the edge acts
+        as a wall for this tick instead of stalling the frame; the map is
+        attached once the loader has it ready.
+        """
+        direction = self._direction_of(metatile_x, metatile_y)
+        if direction is None or direction not in self.current_map.connections:
+            return None
+        neighbor = self.neighbors.get(direction)
+        if neighbor is None:
+            path = self.resolve_path(self.current_map.connections[direction]["map"])
+            self.loader.request(path)
+            loaded = self.loader.take(path)
+            if loaded is None:
+                return None
+            neighbor = self._attach(direction, loaded)
+        if not neighbor.contains(metatile_x, metatile_y):
+            return None
+        return neighbor
+
+    def is_walkable(self, metatile_x: int, metatile_y: int) -> bool:
+        """Check walkability, continuing across connected edges."""
+        if self._in_current_bounds(metatile_x, metatile_y):
+            return self.current_map.is_walkable(metatile_x, metatile_y)
+        neighbor = self.neighbor_at(metatile_x, metatile_y)
+        if neighbor is None:
+            return False
+        return neighbor.map.is_walkable(
+            metatile_x - neighbor.origin_x,
+            metatile_y - neighbor.origin_y
+        )
+
+    def cross(self, metatile_x: int, metatile_y: int) -> tuple[int, int] | None:
+        """
+        Make the neighbor under a position the current map.
+
+        The map being left stays resident as the new map's neighbor when the
+        connection is mutual, so stepping back doesn't reload anything.
+
+        Returns:
+            The new map's origin in the old map's metatile space (subtract it
+            from old coordinates to translate them), or None if the position
+            isn't on a connected map.
+        """
+        if self._in_current_bounds(metatile_x, metatile_y):
+            return None
+        neighbor = self.neighbor_at(metatile_x, metatile_y)
+        if neighbor is None:
+            return None
+
+        previous_map = self.current_map
+        self._discard_pending()
+        self.neighbors.clear()
+        self.current_map = neighbor.map
+
+        back = OPPOSITE_DIRECTION[neighbor.direction]
+        connection = self.current_map.connections.get(back)
+        if connection and self._names_map(connection["map"], previous_map):
+            self._attach(back, previous_map)
+        return neighbor.origin_x, neighbor.origin_y
+
+    def draw_base(self, renderer, camera_x: int, camera_y: int) -> None:
+        """Draw resident neighbors' lower layers in current-map camera space."""
+        for neighbor in self.neighbors.values():
+            origin_x, origin_y = neighbor.pixel_origin()
+            neighbor.map.draw_base(renderer, camera_x - origin_x, camera_y - origin_y)
+
+    def draw_fringe(self, renderer, camera_x: int, camera_y: int) -> None:
+        """Draw resident neighbors' fringe layers in current-map camera space."""
+        for neighbor in self.neighbors.values():
+            origin_x, origin_y = neighbor.pixel_origin()
+            neighbor.map.draw_fringe(renderer, camera_x - origin_x, camera_y - origin_y)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop background loading."""
+        self.loader.shutdown(wait)
+
+    def _attach(self, direction: str, neighbor_map: MapManager) -> NeighborMap:
+        offset = self.current_map.connections[direction]["offset"]
+        origin_x, origin_y = connection_origin(self.current_map, direction, neighbor_map, offset)
+        neighbor = NeighborMap(direction, neighbor_map, origin_x, origin_y)
+        self.neighbors[direction] = neighbor
+        return neighbor
+
+    def _discard_pending(self) -> None:
+        for path in self.loader.pending_paths():
+            self.loader.discard(path)
+
+    def _names_map(self, map_name: str, map_manager: MapManager) -> bool:
+        return self.resolve_path(map_name) == self.resolve_path(map_manager.map_name)
+
+    def _in_current_bounds(self, metatile_x: int, metatile_y: int) -> bool:
+        return (0 <= metatile_x < self.current_map.metatile_width and
+                0 <= metatile_y < self.current_map.metatile_height)
+
+    def _direction_of(self, metatile_x: int, metatile_y: int) -> str | None:
+        if metatile_y < 0:
+            return "north"
+        if metatile_y >= self.current_map.metatile_height:
+            return "south"
+        if metatile_x < 0:
+            return "west"
+        if metatile_x >= self.current_map.metatile_width:
+            return "east"
+        return None
+
+    def _edge_distance(self, direction: str, metatile_x: int, metatile_y: int) -> int:
+        if direction == "north":
+            return metatile_y
+        if direction == "south":
+            return self.current_map.metatile_height - 1 - metatile_y
+        if direction == "west":
+            return metatile_x
+        return self.current_map.metatile_width - 1 - metatile_x
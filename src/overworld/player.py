@@ -25,11 +25,12 @@ class Player(Entity):
         self.sprite_sheet = SpriteSheet(PLAYER_SPRITE_PATH)
         self.sprite_sheet.set_orientation(self.direction)
 
-    def render(self, renderer, camera_x, camera_y):
+    def render(self, renderer, camera_x, camera_y, alpha=1.0):
         """Render the player using the current sprite frame."""
         frame = self.sprite_sheet.get_current_frame()
-        screen_x = self.pixel_x - camera_x
-        screen_y = self.pixel_y - camera_y
+        pixel_x, pixel_y = self.get_render_position(alpha)
+        screen_x = pixel_x - camera_x
+        screen_y = pixel_y - camera_y
         renderer.draw_surface(frame, (screen_x, screen_y))
 
     def handle_input(self, input_handler, current_map, npcs=None, item_pickups=None):
@@ -0,0 +1,112 @@
+# ABOUTME: Animated tile playback driven by Tiled tile-animation data
+# ABOUTME: Tracks frame timelines and indexes where animated tiles sit on the map
+
+from __future__ import annotations
+
+import pygame
+import pytmx
+
+from src.overworld.map_chunks import ChunkKey, TilePlacement
+
+
+class TileAnimation:
+    """Frame timeline for a single animated tile gid."""
+
+    def __init__(self, frames: list[tuple[pygame.Surface, int]]):
+        """
+        Initialize the animation.
+
+        Args:
+            frames: List of (image, duration_ms) in playback order
+        """
+        self.frames = frames
+        self.index = 0
+        self.elapsed_ms = 0.0
+        self.cycle_ms = sum(duration for _, duration in frames)
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Image for the current frame."""
+        return self.frames[self.index][0]
+
+    def advance(self, dt_ms: float) -> bool:
+        """
+        Advance playback time.
+
+        Returns:
+            True if the visible frame changed
+        """
+        if self.cycle_ms <= 0 or len(self.frames) < 2:
+            return False
+
+        previous = self.index
+        # Skip whole cycles so long pauses don't spin through every frame
+        self.elapsed_ms = (self.elapsed_ms + dt_ms) % self.cycle_ms
+        remaining = self.elapsed_ms
+        for index, (_, duration) in enumerate(self.frames):
+            if remaining < duration:
+                self.index = index
+                break
+            remaining -= duration
+        return self.index != previous
+
+
+class TileAnimator:
+    """Per-map index of animated tiles and their frame timelines."""
+
+    def __init__(
+        self,
+        tmx_data: pytmx.TiledMap,
+        tiles_by_chunk: dict[ChunkKey, list[TilePlacement]]
+    ):
+        """
+        Build animations from Tiled data and index their placements.
+
+        Args:
+            tmx_data: Loaded TMX map
+            tiles_by_chunk: Tile placements grouped by chunk
+        """
+        self.animations: dict[int, TileAnimation] = {}
+        for gid, properties in tmx_data.tile_properties.items():
+            frames = properties.get("frames") if properties else None
+            if not frames:
+                continue
+            images = []
+            for frame in frames:
+                image = tmx_data.get_tile_image_by_gid(frame.gid)
+                if image is not None:
+                    images.append((image, frame.duration))
+            if images:
+                self.animations[gid] = TileAnimation(images)
+
+        # gid -> chunk -> placements, so a frame change touches only its own tiles
+        self.placements: dict[int, dict[ChunkKey, list[TilePlacement]]] = {}
+        for key, placements in tiles_by_chunk.items():
+            for placement in placements:
+                if placement[0] in self.animations:
+                    by_chunk = self.placements.setdefault(placement[0], {})
+                    by_chunk.setdefault(key, []).append(placement)
+
+    def has_animations(self) -> bool:
+        """Return True if any placed tile is animated."""
+        return bool(self.placements)
+
+    def get_image(self, gid: int) -> pygame.Surface | None:
+        """Current frame for an animated gid, or None if the gid is static."""
+        animation = self.animations.get(gid)
+        if animation is None:
+            return None
+        return animation.image
+
+    def update(self, dt_ms: float) -> list[int]:
+        """
+        Advance every placed animation.
+
+        Returns:
+            Gids whose visible frame changed
+        """
+        changed = []
+        for gid in self.placements:
+            if self.animations[gid].advance(dt_ms):
+                changed.append(gid)
+        return changed
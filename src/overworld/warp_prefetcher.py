@@ -0,0 +1,99 @@
+# ABOUTME: Prepares warp destination maps on a worker thread ahead of time
+# ABOUTME: Turns a warp into a pointer swap instead of a synchronous TMX load
+
+from __future__ import annotations
+
+from typing import Callable
+
+from src.engine import constants
+from src.overworld.background_loader import BackgroundMapLoader
+from src.overworld.map import MapManager
+
+
+def prepare_map(map_path: str, spawns: list[tuple[int, int]]) -> MapManager:
+    """
+    Load a map and pre-render the views around its likely spawn points.
+
+    Args:
+        map_path: TMX path
+        spawns: Metatile spawn positions; (-1, -1) means the map's playerStart
+    """
+    map_manager = MapManager(map_path)
+    for spawn_x, spawn_y in spawns:
+        if spawn_x < 0 or spawn_y < 0:
+            if map_manager.player_start is None:
+                continue
+            spawn_x, spawn_y = map_manager.player_start
+        map_manager.prepare_view(spawn_x, spawn_y)
+    return map_manager
+
+
+class WarpPrefetcher:
+    """Keeps the maps reachable through the current map's warps loading in the background."""
+
+    def __init__(
+        self,
+        resolve_path: Callable[[str], str],
+        loader: BackgroundMapLoader | None = None,
+        max_maps: int = constants.WARP_PREFETCH_LIMIT
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            resolve_path: Converts a warp's dest_map to a file path
+            loader: Background loader (one using prepare_map is created if omitted)
+            max_maps: Maximum number of destinations prepared at once
+        """
+        self.resolve_path = resolve_path
+        self.loader = loader if loader is not None else BackgroundMapLoader(prepare_map)
+        self.max_maps = max_maps
+
+    def prefetch_from(self, map_manager: MapManager) -> list[str]:
+        """
+        Start preparing the destinations of a freshly loaded map's warps.
+
+        Destinations no longer reachable are dropped; ones already in flight
+        are kept.
+
+        Returns:
+            Paths being prepared, in warp order
+        """
+        spawns_by_path: dict[str, list[tuple[int, int]]] = {}
+        for warp in map_manager.warps:
+            path = self.resolve_path(warp["dest_map"])
+            if path == map_manager.map_filepath:
+                continue
+            if path not in spawns_by_path and len(spawns_by_path) >= self.max_maps:
+                continue
+            spawns = spawns_by_path.setdefault(path, [])
+            spawn = (warp["dest_x"], warp["dest_y"])
+            if spawn not in spawns:
+                spawns.append(spawn)
+
+        for path in self.loader.pending_paths():
+            if path not in spawns_by_path:
+                self.loader.discard(path)
+        for path, spawns in spawns_by_path.items():
+            self.loader.request(path, spawns)
+        return list(spawns_by_path)
+
+    def take(self, map_path: str) -> MapManager | None:
+        """
+        Hand over a prefetched map if it is ready.
+
+        A destination still being prepared is dropped rather than waited on,
+        so the warp frame never blocks on the worker; the caller loads it
+        itself instead.
+
+        Returns:
+            The prepared map, or None if it was never prefetched or isn't ready
+        """
+        map_manager = self.loader.take(map_path)
+        if map_manager is None:
+            self.loader.discard(map_path)
+        return map_manager
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop background preparation."""
+        self.loader.shutdown(wait)
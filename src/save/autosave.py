@@ -0,0 +1,214 @@
+# ABOUTME: Rolling autosave ring that stores structural deltas against full base snapshots
+# ABOUTME: Keeps the last N autosaves cheap to write and reconstructs any of them on restore
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.save.binary_format import decode_save, encode_save
+from src.save.save_data import SaveData
+from src.save.save_storage import DEFAULT_SAVE_DIR, write_bytes_atomic
+
+
+DEFAULT_AUTOSAVE_DIR = DEFAULT_SAVE_DIR / "autosave"
+DEFAULT_AUTOSAVE_SLOTS = 8
+
+
+def slot_autosave_dir(slot: int) -> Path:
+    """
+    Return the autosave directory for a save slot.
+
+    Slot 0 keeps the original autosave directory, matching slot_save_path().
+    """
+    if slot == 0:
+        return DEFAULT_AUTOSAVE_DIR
+    return DEFAULT_SAVE_DIR / f"autosave{slot + 1}"
+
+
+def diff_save_dicts(base: Any, current: Any, path: tuple = ()) -> list[list]:
+    """
+    Structural delta between two SaveData.to_dict() trees.
+
+    Dicts are compared key by key and equal-length lists item by item; any
+    other difference replaces the whole value.
+
+    Returns:
+        Operations: ["set", path, value] or ["del", path]
+    """
+    if isinstance(base, dict) and isinstance(current, dict):
+        operations = [["del", [*path, key]] for key in base if key not in current]
+        for key, value in current.items():
+            if key in base:
+                operations += diff_save_dicts(base[key], value, (*path, key))
+            else:
+                operations.append(["set", [*path, key], value])
+        return operations
+    if isinstance(base, list) and isinstance(current, list) and len(base) == len(current):
+        operations = []
+        for index, (old, new) in enumerate(zip(base, current)):
+            operations += diff_save_dicts(old, new, (*path, index))
+        return operations
+    if base != current:
+        return [["set", list(path), current]]
+    return []
+
+
+def apply_save_delta(base: Any, operations: list[list]) -> Any:
+    """Return a copy of base with diff_save_dicts() operations applied."""
+    result = copy.deepcopy(base)
+    for operation in operations:
+        action, path = operation[0], operation[1]
+        if not path:
+            result = copy.deepcopy(operation[2])
+            continue
+        parent = result
+        for key in path[:-1]:
+            parent = parent[key]
+        if action == "del":
+            del parent[path[-1]]
+        else:
+            parent[path[-1]] = copy.deepcopy(operation[2])
+    return result
+
+
+class AutosaveRing:
+    """
+    Ring of the last `slots` autosaves.
+
+    Every `slots` autosaves a full binary base is written; each ring entry
+    is a small JSON delta against its generation's base. A ring of N
+    consecutive entries spans at most two generations, so two base files
+    (alternating by generation) keep every entry in the ring restorable.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_AUTOSAVE_DIR,
+        slots: int = DEFAULT_AUTOSAVE_SLOTS,
+        write: Optional[Callable[[Path, bytes], Any]] = None
+    ):
+        """
+        Initialize the ring, resuming after any autosaves already on disk.
+
+        Args:
+            directory: Where base and delta files live
+            slots: Number of autosaves kept
+            write: Called as write(path, data) to store a file; defaults to
+                an atomic synchronous write (pass SaveWriter.submit_write to
+                move I/O off the main thread)
+        """
+        if slots < 1:
+            raise ValueError("Autosave ring needs at least one slot")
+        self.directory = Path(directory)
+        self.slots = slots
+        self._write = write or write_bytes_atomic
+        self._base: Optional[dict] = None
+        self._base_generation = -1
+        existing = self._stored_sequences()
+        self.next_sequence = existing[-1] + 1 if existing else 0
+        self._resume_generation()
+
+    def _resume_generation(self) -> None:
+        # Continuing mid-generation must diff against that generation's
+        # existing base rather than replacing it under older entries
+        generation = self.next_sequence // self.slots
+        if self.next_sequence % self.slots == 0:
+            return
+        try:
+            self._base = decode_save(self._base_path(generation).read_bytes())
+        except (OSError, ValueError):
+            # Without a usable base, start the next generation cleanly
+            self.next_sequence = (generation + 1) * self.slots
+            return
+        self._base_generation = generation
+
+    def _base_path(self, generation: int) -> Path:
+        return self.directory / f"base{generation % 2}.sav"
+
+    def _entry_path(self, sequence: int) -> Path:
+        return self.directory / f"entry{sequence % self.slots}.json"
+
+    def record(self, save_data: SaveData) -> int:
+        """
+        Store an autosave.
+
+        Returns:
+            The autosave's sequence number
+        """
+        sequence = self.next_sequence
+        generation = sequence // self.slots
+        data = save_data.to_dict()
+        if generation != self._base_generation:
+            encoded = encode_save(data)
+            self._write(self._base_path(generation), encoded)
+            # Diff against exactly what a restore will decode
+            self._base = decode_save(encoded)
+            self._base_generation = generation
+        entry = {
+            "sequence": sequence,
+            "generation": generation,
+            "delta": diff_save_dicts(self._base, data)
+        }
+        self._write(
+            self._entry_path(sequence),
+            json.dumps(entry, separators=(",", ":")).encode("utf-8")
+        )
+        self.next_sequence = sequence + 1
+        return sequence
+
+    def _read_entry(self, sequence: int) -> Optional[dict]:
+        path = self._entry_path(sequence)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return entry if entry.get("sequence") == sequence else None
+
+    def _stored_sequences(self) -> list[int]:
+        found = []
+        for path in self.directory.glob("entry*.json"):
+            try:
+                sequence = json.loads(path.read_text(encoding="utf-8")).get("sequence")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(sequence, int):
+                found.append(sequence)
+        return sorted(found)
+
+    def sequences(self) -> list[int]:
+        """Return the sequence numbers of restorable autosaves, oldest first."""
+        oldest = self.next_sequence - self.slots
+        return [sequence for sequence in self._stored_sequences() if sequence >= oldest]
+
+    def load_dict(self, sequence: Optional[int] = None) -> dict:
+        """
+        Reconstruct an autosave as a SaveData.to_dict() dictionary.
+
+        Args:
+            sequence: Autosave to restore (defaults to the newest)
+
+        Raises:
+            KeyError: If the autosave is no longer in the ring
+            ValueError: If its base file is corrupted
+        """
+        if sequence is None:
+            stored = self.sequences()
+            if not stored:
+                raise KeyError("No autosaves stored")
+            sequence = stored[-1]
+        entry = self._read_entry(sequence)
+        if entry is None or sequence < self.next_sequence - self.slots:
+            raise KeyError(f"Autosave {sequence} is not in the ring")
+        generation = entry["generation"]
+        if generation == self._base_generation:
+            base = self._base
+        else:
+            base = decode_save(self._base_path(generation).read_bytes())
+        return apply_save_delta(base, entry["delta"])
+
+    def restore(self, species_loader, sequence: Optional[int] = None) -> SaveData:
+        """Reconstruct an autosave (the newest by default) as SaveData."""
+        return SaveData.from_dict(self.load_dict(sequence), species_loader)
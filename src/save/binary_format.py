@@ -0,0 +1,357 @@
+# ABOUTME: Compact versioned binary encoding for save data with a CRC32 checksum
+# ABOUTME: Packs SaveData.to_dict() into struct records over an interned string table
+
+import json
+import struct
+import zlib
+from pathlib import PurePosixPath
+from typing import Any, Optional
+
+
+MAGIC = b"PKYS"
+FORMAT_VERSION = 3
+# Version 1 files have no summary block and versions 1-2 never compress
+# their payload; they still decode
+_SUPPORTED_VERSIONS = (1, 2, 3)
+
+# magic, format version, flags, stored payload length, stored payload CRC32
+_HEADER = struct.Struct("<4sBBII")
+# Header flag: the stored payload is zlib-compressed
+_FLAG_COMPRESSED = 0x01
+SUMMARY_PARTY_SLOTS = 6
+# Fixed-size summary between header and payload, so a slot picker can
+# read it without decoding the body: player name, map name, play time in
+# seconds, badge count, party count, party species, then its own CRC32
+_SUMMARY = struct.Struct("<10s24sIBB" + "10s" * SUMMARY_PARTY_SLOTS)
+_SUMMARY_CRC = struct.Struct("<I")
+# Bytes to read from the start of a file to get its summary
+SUMMARY_PREFIX_SIZE = _HEADER.size + _SUMMARY.size + _SUMMARY_CRC.size
+_COUNT = struct.Struct("<H")
+_BLOB_LENGTH = struct.Struct("<I")
+# save version, player name, player direction, map path, x, y
+_PLAYER = struct.Struct("<BHHHii")
+# species, level, IVs (attack, defense, speed, special, hp), current HP,
+# status (0 = none, else string index + 1), status turns,
+# stat stages (attack, defense, speed, special, accuracy, evasion),
+# experience, exp to next level, move count
+_POKEMON = struct.Struct("<HB5BHHh6bIiB")
+# move, current PP, max PP
+_MOVE_PP = struct.Struct("<HBB")
+# item, quantity
+_BAG_ENTRY = struct.Struct("<HH")
+
+_IV_KEYS = ("attack", "defense", "speed", "special", "hp")
+_STAGE_KEYS = ("attack", "defense", "speed", "special", "accuracy", "evasion")
+# Reserved flags stored as string lists; the rest of "reserved" is a JSON blob
+_RESERVED_LISTS = ("pokedex_seen", "pokedex_caught")
+
+
+def is_binary_save(data: bytes) -> bool:
+    """Return True if the bytes start like a binary save."""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def summarize(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the slot summary for a SaveData.to_dict() dictionary.
+
+    Returns:
+        player_name, map_name, play_time, badge_count and party_species
+    """
+    reserved = data.get("flags", {}).get("reserved", {})
+    return {
+        "player_name": data.get("player", {}).get("name", "PLAYER"),
+        "map_name": PurePosixPath(data.get("overworld", {}).get("map_path", "")).stem,
+        "play_time": data.get("play_time", 0),
+        "badge_count": len(reserved.get("badges", [])),
+        "party_species": [pokemon["species_id"] for pokemon in data.get("party", [])]
+    }
+
+
+def _fixed(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _unfixed(value: bytes) -> str:
+    # struct NUL-pads and truncates fixed fields; drop any character cut short
+    return value.rstrip(b"\0").decode("utf-8", errors="ignore")
+
+
+def _encode_summary(data: dict[str, Any]) -> bytes:
+    summary = summarize(data)
+    species = summary["party_species"][:SUMMARY_PARTY_SLOTS]
+    block = _SUMMARY.pack(
+        _fixed(summary["player_name"]),
+        _fixed(summary["map_name"]),
+        min(int(summary["play_time"]), 0xFFFFFFFF),
+        min(summary["badge_count"], 0xFF),
+        len(species),
+        *(_fixed(species_id) for species_id in species),
+        *(b"" for _ in range(SUMMARY_PARTY_SLOTS - len(species)))
+    )
+    return block + _SUMMARY_CRC.pack(zlib.crc32(block))
+
+
+def decode_summary(prefix: bytes) -> Optional[dict[str, Any]]:
+    """
+    Decode the summary block from the first SUMMARY_PREFIX_SIZE bytes.
+
+    Returns:
+        The summarize() layout, or None for version 1 files, which have no
+        summary and must be decoded in full
+
+    Raises:
+        ValueError: If the prefix is not a binary save, is truncated, or
+            fails the summary checksum
+    """
+    version = _read_version(prefix)
+    if version == 1:
+        return None
+    if len(prefix) < SUMMARY_PREFIX_SIZE:
+        raise ValueError("Truncated save file")
+    block = prefix[_HEADER.size:_HEADER.size + _SUMMARY.size]
+    (checksum,) = _SUMMARY_CRC.unpack_from(prefix, _HEADER.size + _SUMMARY.size)
+    if zlib.crc32(block) != checksum:
+        raise ValueError("Save summary checksum mismatch")
+    name, map_name, play_time, badge_count, party_count, *species = _SUMMARY.unpack(block)
+    return {
+        "player_name": _unfixed(name),
+        "map_name": _unfixed(map_name),
+        "play_time": play_time,
+        "badge_count": badge_count,
+        "party_species": [_unfixed(species_id) for species_id in species[:party_count]]
+    }
+
+
+def _read_version(data: bytes) -> int:
+    if len(data) < _HEADER.size or not is_binary_save(data):
+        raise ValueError("Not a binary save file")
+    version = data[len(MAGIC)]
+    if version not in _SUPPORTED_VERSIONS:
+        raise ValueError(f"Unsupported save format version {version}")
+    return version
+
+
+class _StringTable:
+    """Interns strings so each is stored once and referenced by index."""
+
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _pack_string_list(buffer: bytearray, strings: _StringTable, values) -> None:
+    buffer += _COUNT.pack(len(values))
+    for value in values:
+        buffer += _COUNT.pack(strings.add(value))
+
+
+def encode_save(data: dict[str, Any]) -> bytes:
+    """
+    Encode a SaveData.to_dict() dictionary.
+
+    Returns:
+        Header, summary block, then payload (string table, then records),
+        zlib-compressed when that makes it smaller
+    """
+    strings = _StringTable()
+    body = bytearray()
+
+    player = data.get("player", {})
+    overworld = data.get("overworld", {})
+    body += _PLAYER.pack(
+        data.get("version", 1),
+        strings.add(player.get("name", "PLAYER")),
+        strings.add(player.get("direction", "down")),
+        strings.add(overworld.get("map_path", "")),
+        overworld.get("x", 0),
+        overworld.get("y", 0)
+    )
+
+    party = data.get("party", [])
+    body.append(len(party))
+    for pokemon in party:
+        ivs = pokemon.get("ivs", {})
+        stages = pokemon.get("stat_stages", {})
+        status = pokemon.get("status")
+        moves = pokemon.get("moves", [])
+        body += _POKEMON.pack(
+            strings.add(pokemon["species_id"]),
+            pokemon.get("level", 1),
+            *(ivs.get(key, 0) for key in _IV_KEYS),
+            pokemon.get("current_hp", 0),
+            strings.add(status) + 1 if status else 0,
+            pokemon.get("status_turns", 0),
+            *(stages.get(key, 0) for key in _STAGE_KEYS),
+            pokemon.get("experience", 0),
+            pokemon.get("exp_to_next_level", 0),
+            len(moves)
+        )
+        for move_id in moves:
+            body += _COUNT.pack(strings.add(move_id))
+        move_pp = pokemon.get("move_pp", {})
+        body.append(len(move_pp))
+        for move_id, pp in move_pp.items():
+            body += _MOVE_PP.pack(strings.add(move_id), pp.get("current", 0), pp.get("max", 0))
+
+    bag = data.get("bag", [])
+    body += _COUNT.pack(len(bag))
+    for entry in bag:
+        body += _BAG_ENTRY.pack(strings.add(entry["item_id"]), entry.get("quantity", 1))
+
+    flags = data.get("flags", {})
+    reserved = dict(flags.get("reserved", {}))
+    _pack_string_list(body, strings, flags.get("defeated_trainers", []))
+    _pack_string_list(body, strings, flags.get("collected_items", []))
+    for key in _RESERVED_LISTS:
+        _pack_string_list(body, strings, reserved.pop(key, []))
+    blob = json.dumps(reserved, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    body += _BLOB_LENGTH.pack(len(blob))
+    body += blob
+
+    payload = bytearray(_COUNT.pack(len(strings.strings)))
+    for value in strings.strings:
+        encoded = value.encode("utf-8")
+        payload += _COUNT.pack(len(encoded))
+        payload += encoded
+    payload += body
+
+    flags = 0
+    stored = bytes(payload)
+    compressed = zlib.compress(stored)
+    if len(compressed) < len(stored):
+        flags |= _FLAG_COMPRESSED
+        stored = compressed
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(stored), zlib.crc32(stored))
+    return header + _encode_summary(data) + stored
+
+
+class _Reader:
+    """Sequential struct reader over a payload."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, record: struct.Struct) -> tuple:
+        if self.offset + record.size > len(self.data):
+            raise ValueError("Truncated save file")
+        values = record.unpack_from(self.data, self.offset)
+        self.offset += record.size
+        return values
+
+    def byte(self) -> int:
+        if self.offset >= len(self.data):
+            raise ValueError("Truncated save file")
+        value = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def raw(self, length: int) -> bytes:
+        if self.offset + length > len(self.data):
+            raise ValueError("Truncated save file")
+        value = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return value
+
+
+def decode_save(data: bytes) -> dict[str, Any]:
+    """
+    Decode a binary save into the SaveData.to_dict() layout.
+
+    Raises:
+        ValueError: If the file is not a binary save, is truncated, uses an
+            unknown format version, or fails its checksum
+    """
+    version = _read_version(data)
+    _, _, flags, length, checksum = _HEADER.unpack_from(data)
+    play_time = 0
+    payload_start = _HEADER.size
+    if version >= 2:
+        play_time = decode_summary(data)["play_time"]
+        payload_start = SUMMARY_PREFIX_SIZE
+    payload = data[payload_start:]
+    if len(payload) != length:
+        raise ValueError("Truncated save file")
+    if zlib.crc32(payload) != checksum:
+        raise ValueError("Save file checksum mismatch")
+    if flags & _FLAG_COMPRESSED:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as error:
+            raise ValueError("Save file payload is corrupt") from error
+
+    reader = _Reader(payload)
+    (string_count,) = reader.unpack(_COUNT)
+    strings = []
+    for _ in range(string_count):
+        (string_length,) = reader.unpack(_COUNT)
+        strings.append(reader.raw(string_length).decode("utf-8"))
+
+    def string_list():
+        (count,) = reader.unpack(_COUNT)
+        return [strings[reader.unpack(_COUNT)[0]] for _ in range(count)]
+
+    save_version, name, direction, map_path, x, y = reader.unpack(_PLAYER)
+
+    party = []
+    for _ in range(reader.byte()):
+        values = reader.unpack(_POKEMON)
+        species, level = values[0], values[1]
+        ivs = values[2:7]
+        current_hp, status, status_turns = values[7:10]
+        stages = values[10:16]
+        experience, exp_to_next_level, move_count = values[16:19]
+        moves = [strings[reader.unpack(_COUNT)[0]] for _ in range(move_count)]
+        move_pp = {}
+        for _ in range(reader.byte()):
+            move, current_pp, max_pp = reader.unpack(_MOVE_PP)
+            move_pp[strings[move]] = {"current": current_pp, "max": max_pp}
+        party.append({
+            "species_id": strings[species],
+            "level": level,
+            "ivs": dict(zip(_IV_KEYS, ivs)),
+            "current_hp": current_hp,
+            "moves": moves,
+            "move_pp": move_pp,
+            "status": strings[status - 1] if status else None,
+            "status_turns": status_turns,
+            "stat_stages": dict(zip(_STAGE_KEYS, stages)),
+            "experience": experience,
+            "exp_to_next_level": exp_to_next_level
+        })
+
+    (bag_count,) = reader.unpack(_COUNT)
+    bag = []
+    for _ in range(bag_count):
+        item, quantity = reader.unpack(_BAG_ENTRY)
+        bag.append({"item_id": strings[item], "quantity": quantity})
+
+    defeated_trainers = string_list()
+    collected_items = string_list()
+    reserved_lists = {key: string_list() for key in _RESERVED_LISTS}
+    (blob_length,) = reader.unpack(_BLOB_LENGTH)
+    reserved = json.loads(reader.raw(blob_length).decode("utf-8"))
+    reserved.update(reserved_lists)
+
+    return {
+        "version": save_version,
+        "play_time": play_time,
+        "player": {"name": strings[name], "direction": strings[direction]},
+        "overworld": {"map_path": strings[map_path], "x": x, "y": y},
+        "party": party,
+        "bag": bag,
+        "flags": {
+            "defeated_trainers": defeated_trainers,
+            "collected_items": collected_items,
+            "reserved": reserved
+        }
+    }
@@ -1,6 +1,7 @@
 # ABOUTME: Save data definitions for persistence of game state
 # ABOUTME: Handles serialization to and from dictionaries
 
+from dataclasses import dataclass, field
 from typing import Any, Iterable
 
 from src.items.bag import Bag
@@ -41,6 +42,21 @@ def _normalize_reserved_flags(reserved_flags: dict[str, Any] | None) -> dict[str
     return normalized
 
 
+@dataclass
+class SaveSummary:
+    """What a slot picker shows for a save, readable without decoding it."""
+    player_name: str
+    map_name: str
+    play_time: int = 0  # seconds
+    badge_count: int = 0
+    party_species: list[str] = field(default_factory=list)
+
+    def format_play_time(self) -> str:
+        """Return play time as H:MM."""
+        minutes = self.play_time // 60
+        return f"{minutes // 60}:{minutes % 60:02d}"
+
+
 class SaveData:
     """Represents a full save snapshot for the game."""
 
@@ -56,9 +72,11 @@ class SaveData:
         defeated_trainers: Iterable[str],
         collected_items: Iterable[str],
         reserved_flags: dict[str, Any] | None = None,
-        version: int = SAVE_DATA_VERSION
+        version: int = SAVE_DATA_VERSION,
+        play_time: int = 0
     ):
         self.version = version
+        self.play_time = play_time
         self.player_name = player_name
         self.player_direction = player_direction
         self.map_path = map_path
@@ -74,6 +92,7 @@ class SaveData:
         """Serialize save data to a dictionary."""
         return {
             "version": self.version,
+            "play_time": self.play_time,
             "player": {
                 "name": self.player_name,
                 "direction": self.player_direction
@@ -115,7 +134,39 @@ class SaveData:
             defeated_trainers=set(flags_data.get("defeated_trainers", [])),
             collected_items=set(flags_data.get("collected_items", [])),
             reserved_flags=reserved_flags,
-            version=data.get("version", SAVE_DATA_VERSION)
+            version=data.get("version", SAVE_DATA_VERSION),
+            play_time=data.get("play_time", 0)
+        )
+
+    @classmethod
+    def from_overworld(cls, overworld, play_time: float = 0) -> "SaveData":
+        """
+        Capture the savable parts of an overworld state.
+
+        Args:
+            overworld: OverworldState (or anything with player, map_path,
+                party and bag)
+            play_time: Seconds played
+        """
+        player_data = overworld.player.to_dict()
+        reserved_flags = {
+            "badges": [],
+            "story": {},
+            "pokedex_seen": sorted(getattr(overworld, "pokedex_seen", set())),
+            "pokedex_caught": sorted(getattr(overworld, "pokedex_caught", set()))
+        }
+        return cls(
+            player_name="PLAYER",
+            player_direction=player_data["direction"],
+            map_path=overworld.map_path,
+            player_x=player_data["tile_x"],
+            player_y=player_data["tile_y"],
+            party=overworld.party,
+            bag=overworld.bag,
+            defeated_trainers=getattr(overworld, "defeated_trainers", set()),
+            collected_items=getattr(overworld, "collected_items", set()),
+            reserved_flags=reserved_flags,
+            play_time=int(play_time)
         )
 
     def get_pokedex_seen(self) -> set[str]:
@@ -1,20 +1,48 @@
-# ABOUTME: Save file storage utilities for JSON persistence
-# ABOUTME: Handles reading and writing save data to disk
+# ABOUTME: Save file storage utilities for binary persistence with atomic writes
+# ABOUTME: Manages save slots, reads slot summaries cheaply, and reads legacy JSON saves
 
 import json
+import os
 from pathlib import Path
+from typing import Optional
 
-from src.save.save_data import SaveData
+from src.save.binary_format import (
+    SUMMARY_PREFIX_SIZE,
+    decode_save,
+    decode_summary,
+    encode_save,
+    is_binary_save,
+    summarize
+)
+from src.save.save_data import SaveData, SaveSummary
 
 
 DEFAULT_SAVE_DIR = Path("saves")
-DEFAULT_SAVE_PATH = DEFAULT_SAVE_DIR / "save.json"
+DEFAULT_SAVE_PATH = DEFAULT_SAVE_DIR / "save.sav"
+# Saves written before the binary format; still read when no binary save exists
+LEGACY_SAVE_PATH = DEFAULT_SAVE_DIR / "save.json"
+SAVE_SLOT_COUNT = 3
 
 
 def _resolve_save_path(save_path: Path | str | None) -> Path:
-    if save_path is None:
+    path = DEFAULT_SAVE_PATH if save_path is None else Path(save_path)
+    if path == DEFAULT_SAVE_PATH and not path.exists() and LEGACY_SAVE_PATH.exists():
+        return LEGACY_SAVE_PATH
+    return path
+
+
+def slot_save_path(slot: int) -> Path:
+    """
+    Return the file for a save slot.
+
+    Slot 0 is the original single save file, so existing saves show up as
+    the first slot.
+    """
+    if not 0 <= slot < SAVE_SLOT_COUNT:
+        raise ValueError(f"Invalid save slot: {slot}")
+    if slot == 0:
         return DEFAULT_SAVE_PATH
-    return Path(save_path)
+    return DEFAULT_SAVE_DIR / f"save{slot + 1}.sav"
 
 
 def save_exists(save_path: Path | str | None = None) -> bool:
@@ -23,17 +51,123 @@ def save_exists(save_path: Path | str | None = None) -> bool:
     return path.exists()
 
 
+def _fsync_directory(directory: Path) -> None:
+    # Persist the rename itself; not every platform can open a directory
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace a file so readers see either the old or the new contents.
+
+    The data goes to a temp file in the same directory, is fsynced, and is
+    renamed over the target, so a crash mid-write leaves the old file intact.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(path.parent)
+
+
+def encode_save_data(save_data: SaveData) -> bytes:
+    """Snapshot save data into its immutable on-disk bytes."""
+    return encode_save(save_data.to_dict())
+
+
+def write_encoded_save(encoded: bytes, save_path: Path | str | None = None) -> None:
+    """Atomically write bytes from encode_save_data."""
+    path = DEFAULT_SAVE_PATH if save_path is None else Path(save_path)
+    write_bytes_atomic(path, encoded)
+
+
 def write_save_data(save_data: SaveData, save_path: Path | str | None = None) -> None:
-    """Write save data to disk."""
+    """Write save data to disk in the binary format."""
+    write_encoded_save(encode_save_data(save_data), save_path)
+
+
+def _read_save_dict(path: Path) -> dict:
+    raw = path.read_bytes()
+    if is_binary_save(raw):
+        return decode_save(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def read_save_summary(save_path: Path | str | None = None) -> Optional[SaveSummary]:
+    """
+    Read a save's summary without building its party or bag.
+
+    Current binary saves only read their fixed-size prefix; older binary and
+    legacy JSON saves are decoded to a dictionary (still no SpeciesLoader).
+
+    Returns:
+        The summary, or None if the save does not exist
+
+    Raises:
+        ValueError: If the save is corrupted
+    """
     path = _resolve_save_path(save_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(save_data.to_dict(), handle, indent=2)
+    if not path.exists():
+        return None
+    with open(path, "rb") as handle:
+        prefix = handle.read(SUMMARY_PREFIX_SIZE)
+    summary = decode_summary(prefix) if is_binary_save(prefix) else None
+    if summary is None:
+        try:
+            summary = summarize(_read_save_dict(path))
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as error:
+            raise ValueError(f"Unreadable save file: {error}") from error
+    return SaveSummary(**summary)
+
+
+def list_save_slots() -> list[Optional[SaveSummary]]:
+    """
+    Summarize every save slot, in slot order.
+
+    Returns:
+        One entry per slot: its summary, or None if the slot is empty or
+        unreadable
+    """
+    summaries = []
+    for slot in range(SAVE_SLOT_COUNT):
+        try:
+            summaries.append(read_save_summary(slot_save_path(slot)))
+        except ValueError as error:
+            print(f"Skipping save slot {slot + 1}: {error}")
+            summaries.append(None)
+    return summaries
+
+
+def any_save_exists() -> bool:
+    """Return True if any save slot holds a save."""
+    return any(save_exists(slot_save_path(slot)) for slot in range(SAVE_SLOT_COUNT))
+
+
+def first_empty_slot() -> Optional[int]:
+    """Return the first slot without a save, or None when all are taken."""
+    for slot in range(SAVE_SLOT_COUNT):
+        if not save_exists(slot_save_path(slot)):
+            return slot
+    return None
 
 
 def load_save_data(save_path: Path | str | None, species_loader) -> SaveData:
-    """Load save data from disk."""
-    path = _resolve_save_path(save_path)
-    with open(path, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return SaveData.from_dict(data, species_loader)
+    """
+    Load save data from disk.
+
+    Binary saves are verified against their checksum (ValueError on
+    corruption); anything else is read as a legacy JSON save.
+    """
+    return SaveData.from_dict(_read_save_dict(_resolve_save_path(save_path)), species_loader)
@@ -0,0 +1,114 @@
+# ABOUTME: Background save writer that keeps disk I/O off the main thread
+# ABOUTME: Snapshots saves on submit, encodes them on the worker, and reports from the game loop
+
+from __future__ import annotations
+
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.save import save_storage
+from src.save.binary_format import encode_save
+from src.save.save_data import SaveData
+
+
+class SaveWriter:
+    """
+    Writes saves on a single worker thread, in submission order.
+
+    submit() only copies the save into a plain dictionary on the calling
+    (main) thread, since the party and bag are live objects the game keeps
+    changing. The worker then encodes and compresses that snapshot and does
+    the fsynced atomic write. Completion callbacks run on the main thread
+    from poll(), which the game loop calls every tick.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+        # (future, on_complete) in submission order
+        self._pending: list[tuple[Future, Optional[Callable]]] = []
+
+    @property
+    def busy(self) -> bool:
+        """Return True while any save is waiting to be written or reported."""
+        return bool(self._pending)
+
+    def submit(
+        self,
+        save_data: SaveData,
+        save_path: Path | str | None = None,
+        on_complete: Optional[Callable[[Optional[BaseException]], None]] = None
+    ) -> Future:
+        """
+        Snapshot save data and queue it for writing.
+
+        Args:
+            save_data: Save to write
+            save_path: Target file (defaults to the standard save path)
+            on_complete: Called from poll() with None on success or the
+                exception that stopped the write
+
+        Returns:
+            Future for the write
+        """
+        snapshot = copy.deepcopy(save_data.to_dict())
+        if save_path is None:
+            save_path = save_storage.DEFAULT_SAVE_PATH
+        future = self._executor.submit(self._encode_and_write, Path(save_path), snapshot)
+        self._pending.append((future, on_complete))
+        return future
+
+    @staticmethod
+    def _encode_and_write(path: Path, snapshot: dict) -> None:
+        save_storage.write_bytes_atomic(path, encode_save(snapshot))
+
+    def submit_write(
+        self,
+        path: Path,
+        data: bytes,
+        on_complete: Optional[Callable[[Optional[BaseException]], None]] = None
+    ) -> Future:
+        """
+        Queue already-encoded bytes for an atomic write.
+
+        Args:
+            path: Target file
+            data: File contents
+            on_complete: Called from poll() like submit()'s callback
+
+        Returns:
+            Future for the write
+        """
+        future = self._executor.submit(save_storage.write_bytes_atomic, path, data)
+        self._pending.append((future, on_complete))
+        return future
+
+    def poll(self) -> int:
+        """
+        Run callbacks for finished writes, stopping at the first unfinished one.
+
+        Returns:
+            Number of writes reported
+        """
+        reported = 0
+        while self._pending and self._pending[0][0].done():
+            future, on_complete = self._pending.pop(0)
+            error = future.exception()
+            if error is not None:
+                print(f"Save failed: {error}")
+            if on_complete is not None:
+                on_complete(error)
+            reported += 1
+        return reported
+
+    def flush(self) -> None:
+        """Wait for every queued write and run its callback."""
+        for future, _ in list(self._pending):
+            future.exception()
+        self.poll()
+
+    def shutdown(self) -> None:
+        """Finish queued writes, then stop the worker thread."""
+        self.flush()
+        self._executor.shutdown(wait=True)
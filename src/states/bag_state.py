@@ -1,6 +1,7 @@
 # ABOUTME: Bag state for using items in overworld or battle
 # ABOUTME: Handles item selection, usage, and target selection
 
+from functools import partial
 from typing import Callable, Optional
 from src.states.base_state import BaseState
 from src.ui.bag_screen import BagScreen
@@ -11,6 +12,10 @@ from src.party.party import Party
 from src.battle.pokemon import Pokemon
 
 
+def _usable_in_battle(item) -> bool:
+    return item.usable_in_battle
+
+
 class BagState(BaseState):
     """State for item bag usage."""
 
@@ -39,7 +44,7 @@ class BagState(BaseState):
 
         entry_filter = None
         if self.mode == "battle":
-            entry_filter = lambda item: item.usable_in_battle
+            entry_filter = _usable_in_battle
 
         self.screen = BagScreen(self.bag, self.item_loader, entry_filter=entry_filter)
 
@@ -67,8 +72,9 @@ class BagState(BaseState):
                 self.game,
                 self.party,
                 mode="item",
-                item_use=lambda pokemon: self._apply_item(item_id, pokemon),
-                on_item_used=lambda result: self._handle_item_result(item_id, result),
+                # partials of bound methods keep the stack picklable for savestates
+                item_use=partial(self._apply_item, item_id),
+                on_item_used=partial(self._handle_item_result, item_id),
                 on_cancel=self._handle_target_cancelled,
                 active_pokemon=self.active_pokemon if self.mode == "battle" else None
             )
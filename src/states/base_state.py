@@ -48,3 +48,7 @@ class BaseState(ABC):
     def exit(self):
         """Called when exiting this state. Override if needed."""
         pass
+
+    def dispose(self):
+        """Called when the state leaves the stack for good (pop, change, or savestate restore). Override if needed."""
+        pass
@@ -1,6 +1,7 @@
 # ABOUTME: Battle state for Pokemon battles
 # ABOUTME: Manages battle flow, UI, and damage calculation
 
+import os
 from dataclasses import dataclass
 
 import pygame
@@ -10,6 +11,7 @@ from src.battle.pokemon import Pokemon
 from src.battle.damage_calculator import DamageCalculator
 from src.battle.move_loader import MoveLoader
 from src.battle.move import Move
+from src.battle.enemy_ai import DEFAULT_ENEMY_AI_TIER, EnemyAI, FirstMoveAI, create_enemy_ai
 from src.ui.battle_menu import BattleMenu
 from src.ui.move_menu import MoveMenu
 from src.ui.yes_no_menu import YesNoMenu
@@ -49,7 +51,8 @@ class BattleState(BaseState):
         enemy_pokemon: Pokemon,
         is_trainer_battle: bool = False,
         trainer=None,
-        trainer_pokemon_remaining: list[Pokemon] | None = None
+        trainer_pokemon_remaining: list[Pokemon] | None = None,
+        enemy_ai: EnemyAI | None = None
     ):
         """
         Initialize battle state.
@@ -58,6 +61,10 @@ class BattleState(BaseState):
             game: Reference to Game instance
             player_pokemon: Player's Pokemon
             enemy_pokemon: Wild/enemy Pokemon
+            enemy_ai: Picks the enemy's moves; defaults to the tier named by
+                POKEMON_YELLOW_ENEMY_AI (capped by the game's
+                enemy_ai_budget_ms) for trainer battles and the first move
+                for wild ones
         """
         super().__init__(game)
         self.player_pokemon = player_pokemon
@@ -65,9 +72,18 @@ class BattleState(BaseState):
         self.is_trainer_battle = is_trainer_battle
         self.trainer = trainer
         self.trainer_pokemon_remaining = trainer_pokemon_remaining or []
+        if enemy_ai is None:
+            if is_trainer_battle:
+                enemy_ai = create_enemy_ai(
+                    os.environ.get(constants.ENEMY_AI_ENV_VAR) or DEFAULT_ENEMY_AI_TIER,
+                    getattr(game, "enemy_ai_budget_ms", None)
+                )
+            else:
+                enemy_ai = FirstMoveAI()
+        self.enemy_ai = enemy_ai
 
         # Battle flow state
-        self.phase = "intro"  # intro, showing_message, battle_menu, move_selection, move_learn_choice, forget_move, enemy_turn, throwing_ball, catch_result, end
+        self.phase = "intro"  # intro, showing_message, battle_menu, move_selection, enemy_thinking, move_learn_choice, forget_move, enemy_turn, throwing_ball, catch_result, end
         if self.is_trainer_battle and self.trainer:
             self.message = f"{self.trainer.trainer_class}\n{self.trainer.name} wants to fight!"
         else:
@@ -99,6 +115,10 @@ class BattleState(BaseState):
         self.attack_animation_tick = 0.0
         self.hp_tick_target = None
         self.pending_after_tick = None
+        # Set while the enemy AI needs more ticks to pick its move; the
+        # player's chosen move waits with it (None for an enemy attack alone)
+        self.enemy_move_pending = False
+        self.pending_player_move: Move | None = None
         self.escape_attempts = 0
         self.ball_sprite_path = None
         self.ball_position = (0.0, 0.0)
@@ -374,6 +394,21 @@ class BattleState(BaseState):
         self.player_hp_display.update(self.player_pokemon.current_hp, dt)
         self.enemy_hp_display.update(self.enemy_pokemon.current_hp, dt)
 
+        if self.enemy_move_pending:
+            move_id = self.enemy_ai.request_move(self)
+            if move_id is not None:
+                self.enemy_move_pending = False
+                self._use_enemy_move(move_id)
+            return
+        if (
+            self.awaiting_input
+            and self.phase in ("battle_menu", "move_selection")
+            and not self.player_pokemon.is_fainted()
+            and not self.enemy_pokemon.is_fainted()
+        ):
+            # Let a searching AI work ahead while the player picks a command
+            self.enemy_ai.think(self)
+
         if self.sequence_active:
             if self.phase == "attack_animation":
                 self.attack_animation_timer -= dt
@@ -525,8 +560,9 @@ class BattleState(BaseState):
         if self.ball_active and self.ball_sprite_path:
             ball_sprite = renderer.load_sprite(self.ball_sprite_path)
             if ball_sprite:
-                ball_sprite = pygame.transform.scale(
-                    ball_sprite,
+                # Scaled copy is cached by the renderer, not rebuilt per frame
+                ball_sprite = renderer.load_scaled_sprite(
+                    self.ball_sprite_path,
                     (
                         ball_sprite.get_width() * constants.UI_SCALE,
                         ball_sprite.get_height() * constants.UI_SCALE
@@ -1558,13 +1594,41 @@ class BattleState(BaseState):
             )
             return
 
-        enemy_move_id = self.enemy_pokemon.moves[0]
-        enemy_move = self.move_loader.get_move(enemy_move_id)
-        attack = AttackData(self.enemy_pokemon, self.player_pokemon, enemy_move, False)
-        steps = self._build_attack_steps(attack, False)
-        steps.append({"type": "end_status"})
+        self.pending_player_move = None
+        self._request_enemy_move()
+
+    def _request_enemy_move(self) -> None:
+        """Ask the enemy AI for its move, waiting in update() if it needs more ticks."""
+        move_id = self.enemy_ai.request_move(self)
+        if move_id is None:
+            self.awaiting_input = False
+            self.enemy_move_pending = True
+            self.phase = "enemy_thinking"
+            return
+        self._use_enemy_move(move_id)
+
+    def _use_enemy_move(self, move_id: str) -> None:
+        """Play the turn once the enemy's move is known."""
+        enemy_move = self.move_loader.get_move(move_id)
+        move = self.pending_player_move
+        self.pending_player_move = None
+        if move is None:
+            attack = AttackData(self.enemy_pokemon, self.player_pokemon, enemy_move, False)
+            steps = self._build_attack_steps(attack, False)
+            steps.append({"type": "end_status"})
+            self._start_sequence(steps, "battle_menu")
+            return
+
+        self._spend_player_pp(move)
+        turn_order = self._determine_turn_order(move, enemy_move)
+        steps = self._build_turn_steps(turn_order, move, enemy_move)
         self._start_sequence(steps, "battle_menu")
 
+    def _spend_player_pp(self, move: Move) -> None:
+        self.player_pokemon.use_move_pp(move.move_id)
+        if move.move_id in self.player_move_pp:
+            self.player_move_pp[move.move_id] -= 1
+
     def _mark_seen(self) -> None:
         if hasattr(self, "pokedex_seen"):
             self.pokedex_seen.add(self.enemy_pokemon.species.species_id)
@@ -1841,28 +1905,25 @@ class BattleState(BaseState):
         if self.move_menu:
             self.move_menu.deactivate()
 
-        if not self.player_pokemon.use_move_pp(move.move_id):
+        if self.player_pokemon.get_move_pp(move.move_id)[0] == 0:
             self._start_sequence(
                 [{"type": "message", "text": "No PP left!"}],
                 "battle_menu"
             )
             return
 
-        if move.move_id in self.player_move_pp:
-            self.player_move_pp[move.move_id] -= 1
-
         if not self.enemy_pokemon.moves:
+            self._spend_player_pp(move)
             self._start_sequence(
                 [{"type": "message", "text": "Enemy has no moves!"}],
                 "battle_menu"
             )
             return
 
-        enemy_move_id = self.enemy_pokemon.moves[0]
-        enemy_move = self.move_loader.get_move(enemy_move_id)
-        turn_order = self._determine_turn_order(move, enemy_move)
-        steps = self._build_turn_steps(turn_order, move, enemy_move)
-        self._start_sequence(steps, "battle_menu")
+        # PP is spent once the enemy has chosen, so the AI searches the
+        # same position it was thinking about while the player picked
+        self.pending_player_move = move
+        self._request_enemy_move()
 
     def _execute_enemy_attack(self):
         """
@@ -1879,3 +1940,4 @@ class BattleState(BaseState):
     def _end_battle(self):
         """End the battle and return to overworld."""
         self.game.pop_state()
+        self.game.get_current_state().autosave()
@@ -1,23 +1,48 @@
 # ABOUTME: Overworld state for exploring towns and routes
 # ABOUTME: Manages map rendering, player control, and camera following
 
+import importlib
+
 from src.states.base_state import BaseState
 from src.overworld.map import MapManager
+from src.overworld.map_streamer import MapStreamer
+from src.overworld.warp_prefetcher import WarpPrefetcher
 from src.overworld.camera import Camera
 from src.overworld.player import Player
 from src.overworld.npc import NPC
 from src.ui.dialog_box import DialogBox
 from src.engine import constants
 from src.overworld import encounter_zones
-from src.states.battle_state import BattleState
 from src.battle.pokemon import Pokemon
 from src.battle.species_loader import SpeciesLoader
-from src.battle.trainer import Trainer
 from src.items.bag import Bag
 from src.items.item_loader import ItemLoader
 from src.overworld.item_pickup import ItemPickup
 
 
+# Battle code loads on the first battle rather than with the overworld. The
+# names still resolve as attributes of this module (and can be patched there).
+_LAZY_IMPORTS = {
+    "BattleState": "src.states.battle_state",
+    "Trainer": "src.battle.trainer",
+}
+
+
+def _lazy_import(name):
+    """Return a lazily imported name, importing and caching it on first use."""
+    if name in globals():
+        return globals()[name]
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+__getattr__ = _lazy_import
+
+
 class OverworldState(BaseState):
     """State for overworld exploration (towns, routes, etc)."""
 
@@ -47,6 +72,8 @@ class OverworldState(BaseState):
         super().__init__(game)
         self.map_path = map_path
         self.current_map = None
+        self.map_streamer = None
+        self.warp_prefetcher = None
         self.camera = None
         self.player = None
         self.npcs = []
@@ -90,8 +117,12 @@ class OverworldState(BaseState):
         if self.current_map is not None:
             return
 
-        # Load the map
+        # Load the map; connected neighbors stream in around it
         self.current_map = MapManager(self.map_path)
+        self.map_streamer = MapStreamer(self.current_map, self._map_path_from_name)
+        # Warp destinations are prepared in the background so warping is a swap
+        self.warp_prefetcher = WarpPrefetcher(self._map_path_from_name)
+        self.warp_prefetcher.prefetch_from(self.current_map)
 
         # Use map's player_start if no explicit start position provided
         start_x = self.player_start_x
@@ -124,6 +155,7 @@ class OverworldState(BaseState):
         map_width = self.current_map.get_width_pixels()
         map_height = self.current_map.get_height_pixels()
         self.camera = Camera(map_width, map_height)
+        self.camera.open_edges = self.map_streamer.open_edges()
 
         # Center camera on player
         player_pixel_x, player_pixel_y = self.player.get_pixel_position()
@@ -140,6 +172,13 @@ class OverworldState(BaseState):
         """Called when exiting this state."""
         pass
 
+    def dispose(self):
+        """Stop background map loading when the state is discarded."""
+        if self.map_streamer is not None:
+            self.map_streamer.shutdown()
+        if self.warp_prefetcher is not None:
+            self.warp_prefetcher.shutdown()
+
     def switch_map(self, map_name, spawn_x, spawn_y):
         """
         Switch to a different map and reposition player.
@@ -152,9 +191,12 @@ class OverworldState(BaseState):
         # Build path to new map
         map_path = self._map_path_from_name(map_name)
 
-        # Load new map
-        self.current_map = MapManager(map_path)
+        # Use the prefetched map when available, otherwise load it now
+        prepared = self.warp_prefetcher.take(map_path)
+        self.current_map = prepared if prepared is not None else MapManager(map_path)
         self.map_path = map_path
+        self.map_streamer.reset(self.current_map)
+        self.warp_prefetcher.prefetch_from(self.current_map)
 
         # Load NPCs from new map
         self.npcs = list(self.current_map.npcs)
@@ -186,6 +228,7 @@ class OverworldState(BaseState):
         map_height = self.current_map.get_height_pixels()
         self.camera.map_width = map_width
         self.camera.map_height = map_height
+        self.camera.open_edges = self.map_streamer.open_edges()
 
         # Center camera on player's new position
         player_pixel_x, player_pixel_y = self.player.get_pixel_position()
@@ -194,6 +237,20 @@ class OverworldState(BaseState):
             player_pixel_y + constants.METATILE_SIZE // 2
         )
 
+        # Don't interpolate across the warp
+        self.player.store_previous_position()
+        self.camera.store_previous_position()
+
+        self.autosave()
+
+    def autosave(self):
+        """Record an autosave if the game keeps an autosave ring."""
+        autosave = getattr(self.game, "autosave", None)
+        if autosave is None:
+            return
+        from src.save.save_data import SaveData
+        autosave.record(SaveData.from_overworld(self, getattr(self.game, "play_time", 0)))
+
     def handle_input(self, input_handler):
         """
         Handle player input.
@@ -230,8 +287,8 @@ class OverworldState(BaseState):
                     self.active_dialog = DialogBox(dialog_text, npc.npc_id)
                 return
 
-        # Normal player movement
-        self.player.handle_input(input_handler, self.current_map, self.npcs, self.item_pickups)
+        # Normal player movement (the streamer resolves collisions across map edges)
+        self.player.handle_input(input_handler, self.map_streamer, self.npcs, self.item_pickups)
 
     def _get_npc_in_front(self):
         """Get NPC in tile player is facing."""
@@ -280,6 +337,40 @@ class OverworldState(BaseState):
                 continue
             self.item_pickups.append(pickup)
 
+    def _cross_connection(self):
+        """Hand the player over to a connected map once they step past an edge."""
+        origin = self.map_streamer.cross(self.player.tile_x, self.player.tile_y)
+        if origin is None:
+            return
+        offset_x, offset_y = origin
+        pixel_dx = offset_x * constants.METATILE_SIZE
+        pixel_dy = offset_y * constants.METATILE_SIZE
+
+        self.current_map = self.map_streamer.current_map
+        self.map_path = self.current_map.map_filepath
+        self.warp_prefetcher.prefetch_from(self.current_map)
+        self.npcs = list(self.current_map.npcs)
+        self._apply_defeated_trainers()
+        self._load_item_pickups()
+
+        # Translate into the new map's coordinates; nothing moves on screen
+        self.player.tile_x -= offset_x
+        self.player.tile_y -= offset_y
+        self.player.target_tile_x -= offset_x
+        self.player.target_tile_y -= offset_y
+        self.player.pixel_x -= pixel_dx
+        self.player.pixel_y -= pixel_dy
+        self.player.prev_pixel_x -= pixel_dx
+        self.player.prev_pixel_y -= pixel_dy
+
+        self.camera.map_width = self.current_map.get_width_pixels()
+        self.camera.map_height = self.current_map.get_height_pixels()
+        self.camera.open_edges = self.map_streamer.open_edges()
+        self.camera.x -= pixel_dx
+        self.camera.y -= pixel_dy
+        self.camera.prev_x -= pixel_dx
+        self.camera.prev_y -= pixel_dy
+
     def _map_path_from_name(self, map_name: str) -> str:
         if map_name.lower().endswith(".tmx"):
             filename = map_name
@@ -327,6 +418,15 @@ class OverworldState(BaseState):
         Args:
             dt: Delta time in seconds
         """
+        # Snapshot positions so rendering can interpolate within this tick
+        self.player.store_previous_position()
+        for npc in self.npcs:
+            npc.store_previous_position()
+        self.camera.store_previous_position()
+
+        # Advance animated map tiles (water, flowers)
+        self.current_map.update(dt)
+
         # Update player
         self.player.update()
 
@@ -334,6 +434,10 @@ class OverworldState(BaseState):
         for npc in self.npcs:
             npc.update()
 
+        # Step onto a connected map, then keep neighbors near the player loaded
+        if not self.player.is_moving and self.player_was_moving:
+            self._cross_connection()
+        self.map_streamer.update(self.player.tile_x, self.player.tile_y, dt)
 
         # Check for warps after player finishes moving
         if not self.player.is_moving and self.player_was_moving:
@@ -389,7 +493,7 @@ class OverworldState(BaseState):
             player_pokemon = Pokemon(player_species, 5)
 
         # Push battle state
-        battle_state = BattleState(self.game, player_pokemon, wild_pokemon)
+        battle_state = _lazy_import("BattleState")(self.game, player_pokemon, wild_pokemon)
         battle_state.party = self.party
         battle_state.bag = self.bag
         battle_state.pokedex_seen = self.pokedex_seen
@@ -400,7 +504,7 @@ class OverworldState(BaseState):
         """Start a trainer battle when interacting with a trainer NPC."""
         trainer_info = npc.trainer_data or {}
 
-        trainer = Trainer(
+        trainer = _lazy_import("Trainer")(
             name=trainer_info.get("name", "Trainer"),
             trainer_class=trainer_info.get("class", "Trainer"),
             team=trainer_info.get("team", []),
@@ -417,7 +521,7 @@ class OverworldState(BaseState):
             player_species = species_loader.get_species("pikachu")
             player_pokemon = Pokemon(player_species, 5)
 
-        battle_state = BattleState(
+        battle_state = _lazy_import("BattleState")(
             self.game,
             player_pokemon,
             trainer_party[0],
@@ -445,10 +549,12 @@ class OverworldState(BaseState):
         # Clear screen
         renderer.clear(constants.COLOR_BLACK)
 
-        # Get camera offset
-        camera_x, camera_y = self.camera.get_offset()
+        # Get camera offset, blended between logic ticks when interpolating
+        alpha = getattr(self.game, "render_alpha", 1.0)
+        camera_x, camera_y = self.camera.get_offset(alpha)
 
-        # Render the map with camera offset
+        # Render connected neighbors, then the map itself, with camera offset
+        self.map_streamer.draw_base(renderer, camera_x, camera_y)
         self.current_map.draw_base(renderer, camera_x, camera_y)
 
 
@@ -458,8 +564,9 @@ class OverworldState(BaseState):
         renderables.append(self.player)
 
         for entity in sorted(renderables, key=lambda item: item.get_rect().bottom):
-            entity.render(renderer, camera_x, camera_y)
+            entity.render(renderer, camera_x, camera_y, alpha)
 
+        self.map_streamer.draw_fringe(renderer, camera_x, camera_y)
         self.current_map.draw_fringe(renderer, camera_x, camera_y)
 
         # Render dialog on top of everything
@@ -0,0 +1,118 @@
+# ABOUTME: Save slot picker state shown after CONTINUE, or NEW GAME when every slot is taken
+# ABOUTME: Lists slot summaries, decodes only the picked save, and confirms before overwriting
+
+from src.engine import constants
+from src.save.save_storage import list_save_slots, load_save_data, save_exists, slot_save_path
+from src.states.base_state import BaseState
+from src.ui.save_slot_menu import SaveSlotMenu
+from src.ui.yes_no_menu import YesNoMenu
+
+
+class SaveSlotState(BaseState):
+    """State for choosing which save to continue, or which slot a new game uses."""
+
+    def __init__(self, game, new_game: bool = False):
+        """
+        Initialize the slot picker from slot summaries.
+
+        Args:
+            game: Game instance
+            new_game: Pick a slot for a new game instead of a save to continue
+        """
+        super().__init__(game)
+        self.new_game = new_game
+        # Summaries come from each file's fixed-size prefix; nothing is
+        # decoded in full until a slot is picked
+        self.menu = SaveSlotMenu(list_save_slots(), allow_empty=new_game)
+        self.message = None
+        self.confirm_menu = YesNoMenu()
+        self.pending_slot = None
+
+    def handle_input(self, input_handler):
+        """Handle menu input."""
+        if self.confirm_menu.is_active:
+            answer = self.confirm_menu.handle_input(input_handler)
+            if answer is not None:
+                self.confirm_menu.deactivate()
+                slot, self.pending_slot = self.pending_slot, None
+                self.message = None
+                if answer:
+                    self._start_new_game(slot)
+            return
+
+        if input_handler.is_just_pressed("down"):
+            self.menu.move_cursor(1)
+        elif input_handler.is_just_pressed("up"):
+            self.menu.move_cursor(-1)
+        elif input_handler.is_just_pressed("a"):
+            slot = self.menu.get_selection()
+            if slot is None:
+                return
+            if not self.new_game:
+                self._continue_from_slot(slot)
+            elif save_exists(slot_save_path(slot)):
+                self.pending_slot = slot
+                self.message = f"OVERWRITE SLOT {slot + 1}?"
+                self.confirm_menu.activate()
+            else:
+                self._start_new_game(slot)
+        elif input_handler.is_just_pressed("b"):
+            self.game.pop_state()
+
+    def _start_new_game(self, slot: int):
+        """Start a new game in the picked slot, replacing the title screen."""
+        from src.states.title_menu_state import start_new_game
+
+        self.game.pop_state()
+        start_new_game(self.game, slot)
+
+    def _continue_from_slot(self, slot: int):
+        """Load the picked slot and replace the title screen with the overworld."""
+        from src.battle.species_loader import SpeciesLoader
+        from src.states.overworld_state import OverworldState
+
+        try:
+            save_data = load_save_data(slot_save_path(slot), SpeciesLoader())
+        except ValueError as error:
+            # Bad checksum or body; the summary alone was readable
+            print(f"Could not load save slot {slot + 1}: {error}")
+            self.menu.mark_corrupt(slot)
+            self.message = f"SLOT {slot + 1} IS CORRUPTED"
+            return
+
+        self.game.save_slot = slot
+        self.game.play_time = float(save_data.play_time)
+        overworld = OverworldState(
+            self.game,
+            save_data.map_path,
+            player_start_x=save_data.player_x,
+            player_start_y=save_data.player_y,
+            party=save_data.party,
+            bag=save_data.bag,
+            collected_items=save_data.collected_items,
+            defeated_trainers=save_data.defeated_trainers,
+            player_direction=save_data.player_direction,
+            pokedex_seen=save_data.get_pokedex_seen(),
+            pokedex_caught=save_data.get_pokedex_caught()
+        )
+        self.game.pop_state()
+        self.game.change_state(overworld)
+
+    def update(self, dt: float):
+        """Update slot picker state."""
+        pass
+
+    def render(self, renderer):
+        """Render slot picker, plus any message or overwrite prompt."""
+        renderer.clear(constants.COLOR_BLACK)
+        self.menu.render(renderer)
+        if self.message is None:
+            return
+        font_size = 10 * constants.UI_SCALE
+        message_y = constants.GAME_HEIGHT - (16 * constants.UI_SCALE)
+        renderer.draw_text(self.message, 8 * constants.UI_SCALE, message_y, constants.COLOR_WHITE, font_size)
+        self.confirm_menu.render(
+            renderer,
+            constants.GAME_WIDTH - (48 * constants.UI_SCALE),
+            message_y - (36 * constants.UI_SCALE)
+        )
@@ -77,29 +77,27 @@ class StartMenuState(BaseState):
             if not all(hasattr(self.previous_state, name) for name in required):
                 return
             from src.save.save_data import SaveData
-            from src.save.save_storage import write_save_data
+            from src.save.save_storage import slot_save_path, write_save_data
             from src.ui.dialog_box import DialogBox
-            player_data = self.previous_state.player.to_dict()
-            reserved_flags = {
-                "badges": [],
-                "story": {},
-                "pokedex_seen": sorted(getattr(self.previous_state, "pokedex_seen", set())),
-                "pokedex_caught": sorted(getattr(self.previous_state, "pokedex_caught", set()))
-            }
-            save_data = SaveData(
-                player_name="PLAYER",
-                player_direction=player_data["direction"],
-                map_path=self.previous_state.map_path,
-                player_x=player_data["tile_x"],
-                player_y=player_data["tile_y"],
-                party=self.previous_state.party,
-                bag=self.previous_state.bag,
-                defeated_trainers=getattr(self.previous_state, "defeated_trainers", set()),
-                collected_items=getattr(self.previous_state, "collected_items", set()),
-                reserved_flags=reserved_flags
+            save_data = SaveData.from_overworld(
+                self.previous_state,
+                getattr(self.game, "play_time", 0)
             )
-            write_save_data(save_data)
-            self.previous_state.active_dialog = DialogBox("PLAYER saved the game.")
+            save_path = slot_save_path(getattr(self.game, "save_slot", 0))
+            previous_state = self.previous_state
+
+            def show_result(error=None):
+                message = "PLAYER saved the game." if error is None else "Save failed!"
+                previous_state.active_dialog = DialogBox(message)
+
+            # Write on the game's background writer when it has one; the
+            # dialog appears once the file is safely on disk
+            save_writer = getattr(self.game, "save_writer", None)
+            if save_writer is not None:
+                save_writer.submit(save_data, save_path, on_complete=show_result)
+            else:
+                write_save_data(save_data, save_path)
+                show_result()
             self.game.pop_state()
 
         elif selection == "OPTION":
@@ -3,10 +3,33 @@
 
 from src.engine import constants
 from src.states.base_state import BaseState
-from src.states.overworld_state import OverworldState
 from src.ui.title_menu import TitleMenu
-from src.save.save_storage import load_save_data, save_exists
-from src.battle.species_loader import SpeciesLoader
+from src.save.save_storage import any_save_exists, first_empty_slot
+
+
+def start_new_game(game, slot: int):
+    """
+    Replace the current state with a fresh game that saves to a slot.
+
+    Args:
+        game: Game instance
+        slot: Save slot the new game writes to
+    """
+    # The overworld (and everything it pulls in) loads on first use so
+    # the title screen only imports what it renders
+    from src.states.overworld_state import OverworldState
+
+    game.save_slot = slot
+    game.play_time = 0.0
+    overworld = OverworldState(
+        game,
+        "assets/maps/pallet_town.tmx",
+        player_start_x=-1,
+        player_start_y=-1,
+        pokedex_seen={"pikachu"},
+        pokedex_caught={"pikachu"}
+    )
+    game.change_state(overworld)
 
 
 class TitleMenuState(BaseState):
@@ -20,7 +43,7 @@ class TitleMenuState(BaseState):
             game: Game instance
         """
         super().__init__(game)
-        self.menu = TitleMenu(has_save=save_exists())
+        self.menu = TitleMenu(has_save=any_save_exists())
 
     def handle_input(self, input_handler):
         """Handle menu input."""
@@ -35,35 +58,19 @@ class TitleMenuState(BaseState):
     def _handle_selection(self, selection: str):
         """Handle menu selection."""
         if selection == "CONTINUE":
-            if not save_exists():
+            if not any_save_exists():
                 return
-            species_loader = SpeciesLoader()
-            save_data = load_save_data(None, species_loader)
-            overworld = OverworldState(
-                self.game,
-                save_data.map_path,
-                player_start_x=save_data.player_x,
-                player_start_y=save_data.player_y,
-                party=save_data.party,
-                bag=save_data.bag,
-                collected_items=save_data.collected_items,
-                defeated_trainers=save_data.defeated_trainers,
-                player_direction=save_data.player_direction,
-                pokedex_seen=save_data.get_pokedex_seen(),
-                pokedex_caught=save_data.get_pokedex_caught()
-            )
-            self.game.change_state(overworld)
+            from src.states.save_slot_state import SaveSlotState
+            self.game.push_state(SaveSlotState(self.game))
 
         elif selection == "NEW GAME":
-            overworld = OverworldState(
-                self.game,
-                "assets/maps/pallet_town.tmx",
-                player_start_x=-1,
-                player_start_y=-1,
-                pokedex_seen={"pikachu"},
-                pokedex_caught={"pikachu"}
-            )
-            self.game.change_state(overworld)
+            slot = first_empty_slot()
+            if slot is not None:
+                start_new_game(self.game, slot)
+                return
+            # Every slot is taken: pick one, and confirm before it is overwritten
+            from src.states.save_slot_state import SaveSlotState
+            self.game.push_state(SaveSlotState(self.game, new_game=True))
 
         elif selection == "OPTION":
             pass
@@ -1,7 +1,6 @@
 # ABOUTME: Party screen UI component for Pokemon list view
 # ABOUTME: Renders party Pokemon with sprites, names, levels, and HP
 
-import pygame
 from typing import Optional
 
 from src.battle.hp_bar_display import HpBarDisplay
@@ -123,9 +122,11 @@ class PartyScreen:
             sprite = renderer.load_sprite(pokemon.species.sprites.front)
             if sprite:
                 sprite_size = 16 * constants.UI_SCALE
-                scaled_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
-                if pokemon.is_fainted():
-                    scaled_sprite.set_alpha(100)
+                scaled_sprite = renderer.load_scaled_sprite(
+                    pokemon.species.sprites.front,
+                    (sprite_size, sprite_size),
+                    alpha=100 if pokemon.is_fainted() else None
+                )
                 renderer.game_surface.blit(scaled_sprite, (16 * constants.UI_SCALE, y))
 
         # Draw Pokemon name at x=36
@@ -305,7 +305,9 @@ class PokedexScreen:
             sprite = renderer.load_sprite(species.sprites.front)
             if sprite and pygame:
                 sprite_size = 48 * constants.UI_SCALE
-                scaled_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
+                scaled_sprite = renderer.load_scaled_sprite(
+                    species.sprites.front, (sprite_size, sprite_size)
+                )
                 renderer.game_surface.blit(
                     scaled_sprite,
                     (8 * constants.UI_SCALE, 24 * constants.UI_SCALE)
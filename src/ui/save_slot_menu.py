@@ -0,0 +1,129 @@
+# ABOUTME: Save slot picker UI component for CONTINUE and NEW GAME
+# ABOUTME: Renders each slot's summary and moves the cursor between pickable slots
+
+from typing import Optional
+
+import pygame
+
+from src.engine import constants
+from src.save.save_data import SaveSummary
+
+
+class SaveSlotMenu:
+    """Lists save slots by their summaries; empty and corrupt slots can't be continued."""
+
+    def __init__(self, summaries: list[Optional[SaveSummary]], allow_empty: bool = False):
+        """
+        Initialize the slot menu.
+
+        Args:
+            summaries: One entry per slot, None for an empty slot
+            allow_empty: Let the cursor land on empty slots too (picking a
+                slot for a new game)
+        """
+        self.summaries = summaries
+        self.allow_empty = allow_empty
+        self.corrupt_slots: set[int] = set()
+        self.cursor_index = self._first_filled_index()
+
+    def _is_pickable(self, index: int) -> bool:
+        if self.allow_empty:
+            return True
+        return self.summaries[index] is not None and index not in self.corrupt_slots
+
+    def _first_filled_index(self) -> int:
+        for index in range(len(self.summaries)):
+            if self._is_pickable(index):
+                return index
+        return 0
+
+    def mark_corrupt(self, slot: int):
+        """
+        Show a slot as corrupted and stop the cursor landing on it.
+
+        Args:
+            slot: Slot whose save failed to load
+        """
+        self.corrupt_slots.add(slot)
+        if not self._is_pickable(self.cursor_index):
+            self.move_cursor(1)
+
+    def move_cursor(self, direction: int):
+        """
+        Move cursor up (-1) or down (1), skipping empty slots.
+
+        Args:
+            direction: -1 for up, 1 for down
+        """
+        if not self.summaries:
+            return
+
+        index = self.cursor_index
+        for _ in range(len(self.summaries)):
+            index = (index + direction) % len(self.summaries)
+            if self._is_pickable(index):
+                self.cursor_index = index
+                break
+
+    def get_selection(self) -> Optional[int]:
+        """Get the selected slot, or None if no slot can be picked."""
+        if self.summaries and self._is_pickable(self.cursor_index):
+            return self.cursor_index
+        return None
+
+    def render(self, renderer):
+        """
+        Render the slot list.
+
+        Args:
+            renderer: Renderer instance for drawing
+        """
+        line_height = 10 * constants.UI_SCALE
+        slot_height = 3 * line_height + (4 * constants.UI_SCALE)
+        menu_x = 4 * constants.UI_SCALE
+        menu_y = 4 * constants.UI_SCALE
+        menu_width = constants.GAME_WIDTH - (8 * constants.UI_SCALE)
+        menu_height = len(self.summaries) * slot_height + (8 * constants.UI_SCALE)
+
+        text_color = (0, 0, 0)
+        empty_color = (96, 96, 96)
+
+        border_width = 2 * constants.UI_SCALE
+        inner_offset = 2 * constants.UI_SCALE
+        renderer.draw_rect(text_color, (menu_x, menu_y, menu_width, menu_height), border_width)
+        renderer.draw_rect(
+            (248, 248, 248),
+            (menu_x + inner_offset, menu_y + inner_offset,
+             menu_width - (inner_offset * 2), menu_height - (inner_offset * 2)),
+            0
+        )
+
+        text_x = menu_x + (12 * constants.UI_SCALE)
+        font_size = 10 * constants.UI_SCALE
+        for i, summary in enumerate(self.summaries):
+            y = menu_y + (4 * constants.UI_SCALE) + i * slot_height
+            if i == self.cursor_index and self._is_pickable(i):
+                points = [
+                    (text_x - (9 * constants.UI_SCALE), y + (1 * constants.UI_SCALE)),
+                    (text_x - (9 * constants.UI_SCALE), y + (9 * constants.UI_SCALE)),
+                    (text_x - (3 * constants.UI_SCALE), y + (5 * constants.UI_SCALE))
+                ]
+                pygame.draw.polygon(renderer.game_surface, text_color, points)
+
+            if i in self.corrupt_slots:
+                renderer.draw_text(f"{i + 1} CORRUPTED", text_x, y, empty_color, font_size)
+                continue
+            if summary is None:
+                renderer.draw_text(f"{i + 1} EMPTY", text_x, y, empty_color, font_size)
+                continue
+
+            map_name = summary.map_name.replace("_", " ").upper()
+            renderer.draw_text(f"{i + 1} {summary.player_name}  {map_name}", text_x, y, text_color, font_size)
+            renderer.draw_text(
+                f"TIME {summary.format_play_time()}  BADGES {summary.badge_count}",
+                text_x, y + line_height, text_color, font_size
+            )
+            party = " ".join(species_id.upper() for species_id in summary.party_species[:3])
+            if len(summary.party_species) > 3:
+                party += f" +{len(summary.party_species) - 3}"
+            renderer.draw_text(party, text_x, y + 2 * line_height, text_color, font_size)
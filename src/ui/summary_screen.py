@@ -81,7 +81,9 @@ class SummaryScreen:
             sprite = renderer.load_sprite(self.pokemon.species.sprites.front)
             if sprite and isinstance(sprite, pygame.Surface):
                 sprite_size = 56 * constants.UI_SCALE
-                scaled_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
+                scaled_sprite = renderer.load_scaled_sprite(
+                    self.pokemon.species.sprites.front, (sprite_size, sprite_size)
+                )
                 renderer.game_surface.blit(scaled_sprite, (8 * constants.UI_SCALE, 8 * constants.UI_SCALE))
 
         # Draw Pokedex number below sprite
@@ -238,7 +240,9 @@ class SummaryScreen:
             sprite = renderer.load_sprite(self.pokemon.species.sprites.front)
             if sprite and isinstance(sprite, pygame.Surface):
                 sprite_size = 32 * constants.UI_SCALE
-                scaled_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
+                scaled_sprite = renderer.load_scaled_sprite(
+                    self.pokemon.species.sprites.front, (sprite_size, sprite_size)
+                )
                 renderer.game_surface.blit(
                     scaled_sprite,
                     (8 * constants.UI_SCALE, 4 * constants.UI_SCALE)
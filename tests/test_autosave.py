@@ -0,0 +1,128 @@
+# ABOUTME: Tests for the rolling autosave ring and its structural deltas
+# ABOUTME: Verifies every autosave in the ring restores exactly, across wraps and restarts
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.battle.pokemon import Pokemon
+from src.battle.species_loader import SpeciesLoader
+from src.items.bag import Bag
+from src.party.party import Party
+from src.engine.game import Game
+from src.save import autosave
+from src.save.autosave import AutosaveRing, apply_save_delta, diff_save_dicts
+from src.save.save_data import SaveData
+from src.states.battle_state import BattleState
+
+
+def _save_data(species_loader: SpeciesLoader, step: int) -> SaveData:
+    party = Party()
+    pikachu = Pokemon(species_loader.get_species("pikachu"), 5 + step // 3)
+    pikachu.current_hp = max(1, pikachu.stats.hp - step)
+    party.add(pikachu)
+    if step % 2:
+        party.add(Pokemon(species_loader.get_species("rattata"), 3))
+    bag = Bag()
+    for _ in range(step):
+        bag.add_item("potion")
+    return SaveData(
+        player_name="PLAYER",
+        player_direction="left",
+        map_path="assets/maps/route_1.tmx" if step % 3 else "assets/maps/pallet_town.tmx",
+        player_x=step,
+        player_y=2 * step,
+        party=party,
+        bag=bag,
+        defeated_trainers={f"route_1:trainer_{index}" for index in range(step // 4)},
+        collected_items=set(),
+        play_time=60 * step
+    )
+
+
+def test_diff_and_apply_round_trip():
+    base = {"a": 1, "gone": True, "party": [{"hp": 10}, {"hp": 4}], "bag": [1, 2]}
+    current = {"a": 1, "party": [{"hp": 7}, {"hp": 4}], "bag": [1, 2, 3], "new": {"x": 1}}
+
+    delta = diff_save_dicts(base, current)
+
+    assert apply_save_delta(base, delta) == current
+    assert ["set", ["party", 0, "hp"], 7] in delta
+    assert base["party"][0]["hp"] == 10  # base is left untouched
+
+
+def test_ring_restores_every_entry_across_generations(tmp_path: Path):
+    species_loader = SpeciesLoader()
+    ring = AutosaveRing(tmp_path, slots=4)
+    expected = {}
+    for step in range(11):
+        save_data = _save_data(species_loader, step)
+        expected[ring.record(save_data)] = save_data.to_dict()
+
+    assert ring.sequences() == [7, 8, 9, 10]
+    for sequence in ring.sequences():
+        assert ring.load_dict(sequence) == expected[sequence]
+    assert ring.restore(species_loader).to_dict() == expected[10]
+    with pytest.raises(KeyError):
+        ring.load_dict(6)
+    # Two alternating bases plus one small delta per slot
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "base0.sav", "base1.sav", "entry0.json", "entry1.json", "entry2.json", "entry3.json"
+    ]
+
+
+def test_ring_resumes_mid_generation_after_restart(tmp_path: Path):
+    species_loader = SpeciesLoader()
+    ring = AutosaveRing(tmp_path, slots=4)
+    expected = {}
+    for step in range(6):
+        save_data = _save_data(species_loader, step)
+        expected[ring.record(save_data)] = save_data.to_dict()
+
+    resumed = AutosaveRing(tmp_path, slots=4)
+    save_data = _save_data(species_loader, 6)
+    expected[resumed.record(save_data)] = save_data.to_dict()
+
+    assert resumed.sequences() == [3, 4, 5, 6]
+    for sequence in resumed.sequences():
+        assert resumed.load_dict(sequence) == expected[sequence]
+
+
+def test_battle_end_autosaves_from_the_overworld():
+    recorded = []
+    overworld = SimpleNamespace(autosave=lambda: recorded.append("overworld"))
+    game = SimpleNamespace(
+        pop_state=lambda: recorded.append("pop"),
+        get_current_state=lambda: overworld
+    )
+
+    BattleState._end_battle(SimpleNamespace(game=game))
+
+    assert recorded == ["pop", "overworld"]
+
+
+def test_each_save_slot_keeps_its_own_ring(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(autosave, "DEFAULT_SAVE_DIR", tmp_path)
+    monkeypatch.setattr(autosave, "DEFAULT_AUTOSAVE_DIR", tmp_path / "autosave")
+    species_loader = SpeciesLoader()
+    game = SimpleNamespace(
+        autosave_slots=4,
+        save_slot=0,
+        _autosave_rings={},
+        save_writer=SimpleNamespace(submit_write=None)
+    )
+
+    first = Game.autosave.fget(game)
+    first.record(_save_data(species_loader, 1))
+    game.save_slot = 2
+    third = Game.autosave.fget(game)
+    third.record(_save_data(species_loader, 5))
+
+    assert first.directory == tmp_path / "autosave"
+    assert third.directory == tmp_path / "autosave3"
+    assert first.load_dict()["overworld"]["x"] == 1
+    assert third.load_dict()["overworld"]["x"] == 5
+    game.save_slot = 0
+    assert Game.autosave.fget(game) is first
+    assert Game.autosave.fget(SimpleNamespace(autosave_slots=0)) is None
@@ -0,0 +1,113 @@
+# ABOUTME: Tests for immutable battle positions used by search AI
+# ABOUTME: Verifies structural sharing, stable digests, and round trips with live battles
+
+import subprocess
+import sys
+
+import pytest
+
+from src.battle.battle_position import BattlePosition, PokemonPosition
+from src.battle.pokemon import Pokemon
+from src.battle.species_loader import SpeciesLoader
+from src.battle.status_effects import StatusCondition
+from src.party.party import Party
+from src.states.battle_state import BattleState
+from tests.battle_test_helpers import DummyGame
+
+
+def _battle() -> BattleState:
+    species_loader = SpeciesLoader()
+    party = Party()
+    party.add(Pokemon(species_loader.get_species("pikachu"), 12))
+    party.add(Pokemon(species_loader.get_species("rattata"), 8))
+    enemy = Pokemon(species_loader.get_species("pidgey"), 10)
+    bench = [Pokemon(species_loader.get_species("spearow"), 9)]
+    battle = BattleState(
+        DummyGame(), party.pokemon[0], enemy, is_trainer_battle=True, trainer_pokemon_remaining=bench
+    )
+    battle.party = party
+    return battle
+
+
+def test_updates_share_unchanged_members():
+    position = BattlePosition.from_battle(_battle())
+    enemy = position.enemy.active
+
+    hit = position.with_active("enemy", enemy.with_hp(enemy.current_hp - 5).with_stage_change("attack", -1))
+
+    assert hit.enemy.active.current_hp == enemy.current_hp - 5
+    assert hit.enemy.active.stage("attack") == -1
+    assert hit.player is position.player
+    assert hit.enemy.team[1] is position.enemy.team[1]
+    assert position.enemy.active.current_hp == enemy.current_hp  # original untouched
+    assert hit != position
+    assert hit.digest() != position.digest()
+
+
+def test_digest_is_stable_and_value_based():
+    position = BattlePosition.from_battle(_battle())
+    same = BattlePosition.from_battle(_battle())
+    # IVs are random, so align stats before comparing
+    same = BattlePosition(
+        position.player,
+        same.enemy.with_active(position.enemy.active).with_member(1, position.enemy.team[1])
+    )
+
+    assert same == position
+    assert same.digest() == position.digest()
+    assert hash(same) == hash(position)
+    assert len({position: 1, same: 2}) == 1
+
+    code = (
+        "from src.battle.battle_position import PokemonPosition\n"
+        "from src.battle.species_loader import SpeciesLoader\n"
+        "species = SpeciesLoader().get_species('pidgey')\n"
+        "member = PokemonPosition(species, 'pidgey', 10, (30, 15, 14, 13, 18), 21,"
+        " pp=(('tackle', 30, 35),))\n"
+        "print(member.digest().hex())\n"
+    )
+    runs = {
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        for _ in range(2)
+    }
+    assert len(runs) == 1
+
+
+def test_round_trip_through_live_battle():
+    battle = _battle()
+    position = BattlePosition.from_battle(battle)
+    player = position.player.active
+    changed = position.with_active(
+        "player",
+        player.with_status(StatusCondition.PARALYSIS).with_pp_used(player.moves[0]).with_hp(3)
+    )
+
+    changed.apply_to_battle(battle)
+
+    assert battle.player_pokemon.current_hp == 3
+    assert battle.player_pokemon.status == StatusCondition.PARALYSIS
+    used_pp, max_pp = battle.player_pokemon.get_move_pp(player.moves[0])
+    assert used_pp == max_pp - 1
+    assert BattlePosition.from_battle(battle) == changed
+
+    rebuilt = changed.enemy.team[1].to_pokemon()
+    assert PokemonPosition.from_pokemon(rebuilt) == changed.enemy.team[1]
+    assert rebuilt.stats.hp == changed.enemy.team[1].max_hp
+
+
+def test_apply_to_battle_rejects_a_switched_position():
+    battle = _battle()
+    position = BattlePosition.from_battle(battle)
+    active = battle.player_pokemon
+    hp = active.current_hp
+
+    hurt_player = position.player.with_active(position.player.active.with_hp(1))
+    for switched in (
+        position.with_side("player", hurt_player.switched_to(1)),
+        position.with_side("enemy", position.enemy.switched_to(1))
+    ):
+        with pytest.raises(ValueError, match="different active"):
+            switched.apply_to_battle(battle)
+
+    assert battle.player_pokemon is active
+    assert active.current_hp == hp
@@ -0,0 +1,78 @@
+# ABOUTME: Tests for the scripted bot driver
+# ABOUTME: Verifies stepping, walking, state queries, and fleeing wild battles headlessly
+
+import os
+
+from src.engine.bot import BotController, BotInputSource
+from src.engine.input_recording import decode_actions
+
+
+GROUND_TILESET = os.path.abspath("assets/maps/ground_compiled_8x8.png")
+
+
+def _write_grass_route(tmp_path) -> str:
+    """A 16x16-tile (8x8 metatile) map that is grass everywhere, named route_1."""
+    data = ",\n".join(",".join(["3"] * 16) for _ in range(16))
+    tmx = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="16" height="16" tilewidth="8" tileheight="8" infinite="0">
+ <tileset firstgid="1" name="ground" tilewidth="8" tileheight="8" tilecount="6" columns="6">
+  <image source="{GROUND_TILESET}" width="48" height="8"/>
+  <tile id="2">
+   <properties>
+    <property name="is_grass" type="bool" value="true"/>
+   </properties>
+  </tile>
+ </tileset>
+ <layer id="1" name="background" width="16" height="16">
+  <data encoding="csv">
+{data}
+  </data>
+ </layer>
+</map>
+"""
+    path = tmp_path / "route_1.tmx"
+    path.write_text(tmx)
+    return str(path)
+
+
+def test_input_source_holds_and_releases_buttons():
+    source = BotInputSource()
+    source.press("a", "left")
+    source.release("a")
+
+    assert decode_actions(source.read_mask())["left"]
+    assert not source.is_held("a")
+    source.release_all()
+    assert source.read_mask() == 0
+
+
+def test_bot_walks_and_reports_state(tmp_path):
+    bot = BotController(seed=1)
+    bot.start_overworld(_write_grass_route(tmp_path), 2, 2)
+
+    assert bot.state_type == "OverworldState"
+    assert bot.player_tile == ("route_1", 2, 2)
+    assert bot.party[0]["species"] == "pikachu"
+    assert bot.battle_phase is None
+
+    bot.step(3)
+    assert bot.frames == 3
+
+    # Seed 1 crosses both grass tiles without an encounter
+    walked = bot.walk("right", tiles=2)
+    assert bot.battle is None
+    assert walked == 2
+    assert bot.player_tile == ("route_1", 4, 2)
+
+
+def test_bot_farms_encounters_and_flees(tmp_path):
+    bot = BotController(seed=7)
+    bot.start_overworld(_write_grass_route(tmp_path), 3, 3)
+
+    encounters = bot.farm_encounters(2, max_frames=20000)
+
+    assert encounters == 2
+    assert bot.battles_started == 2
+    if bot.battle is not None:
+        assert bot.flee_battle()
+    assert bot.state_type == "OverworldState"
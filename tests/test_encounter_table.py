@@ -0,0 +1,72 @@
+# ABOUTME: Tests for compiled encounter tables (merged slots and Walker alias sampling)
+# ABOUTME: Verifies exact slot probabilities, batch sampling, and load-time merging
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.overworld.encounter_loader import EncounterLoader
+from src.overworld.encounter_zones import EncounterSlot, EncounterTable, EncounterZone, merge_encounter_slots
+
+
+SLOTS = [
+    EncounterSlot("pidgey", 3, 3, 20),
+    EncounterSlot("pidgey", 4, 4, 20),
+    EncounterSlot("pidgey", 2, 2, 10),
+    EncounterSlot("pidgey", 3, 3, 10),
+    EncounterSlot("rattata", 2, 4, 15),
+    EncounterSlot("mew", 5, 5, 0),
+    EncounterSlot("rattata", 3, 3, 1),
+]
+
+
+def test_merge_combines_duplicate_slots_in_order():
+    merged = merge_encounter_slots(SLOTS)
+
+    assert [(slot.species_id, slot.min_level, slot.weight) for slot in merged] == [
+        ("pidgey", 3, 30), ("pidgey", 4, 20), ("pidgey", 2, 10),
+        ("rattata", 2, 15), ("mew", 5, 0), ("rattata", 3, 1)
+    ]
+    assert SLOTS[0].weight == 20  # inputs are left untouched
+
+
+def test_alias_table_probabilities_are_exact():
+    table = EncounterTable(merge_encounter_slots(SLOTS))
+
+    assert len(table) == 5  # zero-weight mew is dropped
+    for index, slot in enumerate(table.slots):
+        assert table.probability(index) == pytest.approx(slot.weight / 76)
+
+
+def test_batch_sample_matches_weights_and_level_ranges():
+    zone = EncounterZone("route_1", [], merge_encounter_slots(SLOTS))
+
+    draws = zone.sample(40000, random.Random(7))
+
+    counts = Counter(species for species, _ in draws)
+    assert counts["pidgey"] / len(draws) == pytest.approx(60 / 76, abs=0.01)
+    assert "mew" not in counts
+    assert {level for species, level in draws if species == "rattata"} == {2, 3, 4}
+    assert zone.sample(5, random.Random(7)) == draws[:5]
+
+
+def test_global_draws_follow_the_seed():
+    zone = EncounterZone("route_1", [], SLOTS)
+
+    random.seed(3)
+    first = [zone.get_random_encounter() for _ in range(20)]
+    random.seed(3)
+    assert [zone.get_random_encounter() for _ in range(20)] == first
+    with pytest.raises(ValueError):
+        EncounterZone("empty", [], []).get_random_encounter()
+
+
+def test_loader_merges_duplicate_api_slots():
+    zone = EncounterLoader().get_encounter_zone("route_1")
+
+    keys = [(slot.species_id, slot.min_level, slot.max_level) for slot in zone.encounters]
+    assert len(keys) == len(set(keys))
+    pidgey_3 = next(slot for slot in zone.encounters if (slot.species_id, slot.min_level) == ("pidgey", 3))
+    assert pidgey_3.weight == 30
+    assert zone.table.total_weight == 100
@@ -0,0 +1,218 @@
+# ABOUTME: Tests for the headless turn resolver and the enemy AI tiers
+# ABOUTME: Verifies exact outcome probabilities, search move choice, tick slicing and battle wiring
+
+import pickle
+
+import pytest
+
+from src.battle.battle_position import BattlePosition, PokemonPosition, SidePosition
+from src.battle.enemy_ai import FirstMoveAI, RandomMoveAI, SearchAI, create_enemy_ai
+from src.battle.move import Move
+from src.battle.pokemon import Pokemon
+from src.battle.species_loader import SpeciesLoader
+from src.battle.turn_resolver import DeadlineExceeded, TurnResolver
+from src.party.party import Party
+from src.engine import constants
+from src.states.battle_state import BattleState
+from tests.battle_test_helpers import DummyGame, make_move, make_pokemon
+
+
+def _inaccurate(move_id: str, power: int, accuracy: int) -> Move:
+    move = make_move(move_id, power)
+    move.accuracy = accuracy
+    return move
+
+
+def _position(player_moves: list[str], enemy_moves: list[str], player_hp=None, enemy_hp=None) -> BattlePosition:
+    player = PokemonPosition.from_pokemon(make_pokemon("Player", moves=player_moves))
+    enemy = PokemonPosition.from_pokemon(make_pokemon("Enemy", moves=enemy_moves))
+    if player_hp is not None:
+        player = player.with_hp(player_hp)
+    if enemy_hp is not None:
+        enemy = enemy.with_hp(enemy_hp)
+    return BattlePosition(SidePosition((player,)), SidePosition((enemy,)))
+
+
+MOVES = {
+    "splash": make_move("splash", None),
+    "tackle": make_move("tackle", 40),
+    "wild-swing": _inaccurate("wild-swing", 120, 50),
+}
+
+
+def test_resolver_weights_outcomes_by_exact_probability():
+    position = _position(["splash"], ["wild-swing"], player_hp=1)
+
+    outcomes = TurnResolver(MOVES).resolve(position, "splash", "wild-swing")
+
+    assert sum(probability for probability, _ in outcomes) == pytest.approx(1.0)
+    fainted = sum(probability for probability, outcome in outcomes if outcome.player.active.is_fainted())
+    assert fainted == pytest.approx(0.5)
+    # Only the player's PP is spent, as in BattleState
+    for _, outcome in outcomes:
+        assert outcome.player.active.pp[0][1] == position.player.active.pp[0][1] - 1
+        assert outcome.enemy.active.pp == position.enemy.active.pp
+
+
+def test_resolver_buckets_only_non_lethal_rolls():
+    position = _position(["tackle"], ["splash"])
+    defender = position.enemy.active
+
+    exact = TurnResolver(MOVES).resolve(position, "tackle", "splash")
+    coarse = TurnResolver(MOVES, roll_buckets=2).resolve(position, "tackle", "splash")
+
+    assert len(coarse) <= 2 < len(exact)
+    expected_damage = [
+        sum(probability * (defender.current_hp - outcome.enemy.active.current_hp) for probability, outcome in outcomes)
+        for outcomes in (exact, coarse)
+    ]
+    assert expected_damage[1] == pytest.approx(expected_damage[0], abs=0.5)
+
+
+def test_search_prefers_the_sure_knockout():
+    position = _position(["tackle"], ["splash", "wild-swing", "tackle"], player_hp=1)
+    ai = SearchAI(max_depth=2)
+
+    assert ai.choose_from_position(position, MOVES) == "tackle"
+    assert ai.completed_depth == 2
+    assert ai.table
+
+
+def test_search_falls_back_to_greedy_when_out_of_time():
+    position = _position(["tackle"], ["splash", "tackle"])
+    ai = SearchAI(max_depth=4, budget_ms=0.0)
+
+    assert ai.choose_from_position(position, MOVES) == "tackle"
+    assert ai.completed_depth == 0
+
+
+def test_resolver_stops_at_its_deadline():
+    position = _position(["tackle"], ["wild-swing"])
+    resolver = TurnResolver(MOVES)
+    resolver.deadline = 0.0
+
+    with pytest.raises(DeadlineExceeded):
+        resolver.resolve(position, "tackle", "wild-swing")
+    resolver.deadline = None
+    assert resolver.resolve(position, "tackle", "wild-swing") is resolver.resolve(position, "tackle", "wild-swing")
+
+
+def _real_battle(enemy_ai=None) -> BattleState:
+    species_loader = SpeciesLoader()
+    party = Party()
+    for species_id, level in (("pikachu", 14), ("pidgey", 10), ("rattata", 9)):
+        party.add(Pokemon(species_loader.get_species(species_id), level))
+    bench = [Pokemon(species_loader.get_species("geodude"), 12)]
+    battle = BattleState(
+        DummyGame(), party.pokemon[0], Pokemon(species_loader.get_species("onix"), 14),
+        is_trainer_battle=True, trainer_pokemon_remaining=bench, enemy_ai=enemy_ai
+    )
+    battle.party = party
+    return battle
+
+
+def test_tiers_reach_their_depths_on_a_real_battle():
+    battle = _real_battle()
+
+    depths = {}
+    for tier in ("greedy", "smart", "strong"):
+        ai = create_enemy_ai(tier)
+        assert ai.choose_move(battle) in battle.enemy_pokemon.moves
+        depths[tier] = ai.completed_depth
+
+    assert depths == {"greedy": 1, "smart": 2, "strong": 2}
+    assert ai.roll_buckets is None  # strong searches every damage roll
+
+
+def test_search_is_spread_across_ticks_and_repeats_exactly():
+    def ticks_to_decide(ai, battle):
+        work = []
+        while True:
+            before = ai._work
+            move_id = ai.request_move(battle)
+            work.append(ai._work - before)
+            if move_id is not None:
+                return move_id, work
+
+    battle = _real_battle()
+    expected = SearchAI(max_depth=2, roll_buckets=2).choose_move(battle)
+    move_id, work = ticks_to_decide(SearchAI(max_depth=2, roll_buckets=2, branches_per_tick=64), battle)
+
+    assert move_id == expected
+    # A slice can overrun by the branches of one first-attack outcome
+    assert len(work) > 1 and max(work) < 2 * 64
+
+    # A savestate taken mid-search restores into the same remaining ticks
+    ai = SearchAI(max_depth=2, roll_buckets=2, branches_per_tick=64)
+    for _ in range(3):
+        assert ai.request_move(battle) is None
+    restored_move, restored_work = ticks_to_decide(pickle.loads(pickle.dumps(ai)), battle)
+    live_move, live_work = ticks_to_decide(ai, battle)
+    assert restored_move == live_move == expected
+    assert len(restored_work) == len(live_work) == len(work) - 3
+
+
+def test_battle_waits_for_a_search_and_uses_thinking_time():
+    ai = SearchAI(max_depth=2, roll_buckets=2, branches_per_tick=64)
+    battle = _real_battle(ai)
+    move = battle.move_loader.get_move(battle.player_pokemon.moves[0])
+    pp = battle.player_pokemon.get_move_pp(move.move_id)[0]
+
+    battle._execute_player_attack(move)
+
+    assert battle.phase == "enemy_thinking" and battle.enemy_move_pending
+    assert battle.player_pokemon.get_move_pp(move.move_id)[0] == pp
+    ticks = 1
+    while battle.enemy_move_pending:
+        battle.update(1 / 60)
+        ticks += 1
+    assert battle.sequence_active
+    assert battle.player_pokemon.get_move_pp(move.move_id)[0] == pp - 1
+
+    # Thinking while the player picks leaves less to wait for
+    thinking = _real_battle(SearchAI(max_depth=2, roll_buckets=2, branches_per_tick=64))
+    thinking.phase = "battle_menu"
+    thinking.awaiting_input = True
+    thinking.update(1 / 60)
+    thinking._execute_player_attack(move)
+    waited = 1
+    while thinking.enemy_move_pending:
+        thinking.update(1 / 60)
+        waited += 1
+    assert waited == ticks - 1
+
+
+def test_trainer_battles_pick_moves_through_the_configured_tier(monkeypatch):
+    player = make_pokemon("Player", moves=["tackle"])
+    enemy = make_pokemon("Enemy", moves=["splash", "tackle"])
+
+    monkeypatch.delenv(constants.ENEMY_AI_ENV_VAR, raising=False)
+    assert isinstance(BattleState(DummyGame(), player, enemy).enemy_ai, FirstMoveAI)
+    assert isinstance(BattleState(DummyGame(), player, enemy, is_trainer_battle=True).enemy_ai, FirstMoveAI)
+    monkeypatch.setenv(constants.ENEMY_AI_ENV_VAR, "strong")
+    assert isinstance(BattleState(DummyGame(), player, enemy, is_trainer_battle=True).enemy_ai, SearchAI)
+    assert BattleState(DummyGame(), player, enemy, is_trainer_battle=True).enemy_ai.budget_ms is None
+    assert create_enemy_ai("strong", budget_ms=20.0).budget_ms == 20.0
+    with pytest.raises(ValueError):
+        create_enemy_ai("impossible")
+
+    class ChoosesTackle(FirstMoveAI):
+        def choose_move(self, battle):
+            return "tackle"
+
+    class RecordingMoveLoader:
+        requested = []
+
+        def get_move(self, move_id):
+            self.requested.append(move_id)
+            return MOVES[move_id]
+
+    enemy.move_pp["splash"] = (0, 10)
+    faithful = BattleState(DummyGame(), player, enemy, is_trainer_battle=True, enemy_ai=RandomMoveAI())
+    assert {faithful.enemy_ai.choose_move(faithful) for _ in range(20)} == {"tackle"}
+
+    battle = BattleState(DummyGame(), player, enemy, is_trainer_battle=True, enemy_ai=ChoosesTackle())
+    battle.move_loader = RecordingMoveLoader()
+    battle._execute_player_attack(MOVES["tackle"])
+
+    assert battle.move_loader.requested == ["tackle"]
@@ -0,0 +1,113 @@
+# ABOUTME: Tests for renderer frame counters and per-frame draw/allocation budgets
+# ABOUTME: Guards against per-frame Surface allocations creeping back into render paths
+
+import pygame
+import pytest
+
+from src.battle.species_loader import SpeciesLoader
+from src.battle.pokemon import Pokemon
+from src.engine.renderer import SoftwareRenderer
+from src.states.battle_state import BattleState
+from src.states.overworld_state import OverworldState
+
+
+BALL_SPRITE = "assets/sprites/items/poke-ball.png"
+
+
+class FakeGame:
+    def __init__(self, renderer):
+        self.renderer = renderer
+
+    def pop_state(self):
+        pass
+
+
+def _render_frame(state, renderer):
+    with renderer.stats.allocation_scope():
+        state.render(renderer)
+    renderer.present()
+    return renderer.stats.summary()
+
+
+def test_frame_stats_roll_over_on_present_and_check_budgets():
+    renderer = SoftwareRenderer()
+    renderer.draw_surface(pygame.Surface((8, 8)), (0, 0))
+    renderer.draw_text("A", 0, 0)
+    renderer.present()
+
+    summary = renderer.stats.summary()
+    assert summary["blits"] == 2
+    assert summary["font_renders"] == 1
+    assert renderer.stats.current["blits"] == 0
+
+    renderer.stats.assert_within(blits=2, surface_allocs=0)
+    with pytest.raises(AssertionError, match="blits=2"):
+        renderer.stats.assert_within(blits=1)
+
+
+def test_allocation_scope_counts_surfaces_only_when_tracking():
+    renderer = SoftwareRenderer()
+    with renderer.stats.allocation_scope():
+        pygame.Surface((4, 4))
+    renderer.stats.track_allocations = True
+    with renderer.stats.allocation_scope():
+        pygame.Surface((4, 4))
+        pygame.transform.scale(pygame.Surface((4, 4)), (8, 8))
+    renderer.present()
+
+    assert renderer.stats.summary()["surface_allocs"] == 3
+    assert renderer.stats.summary()["transforms"] == 1
+    assert pygame.Surface.__name__ == "Surface"
+
+
+def test_allocation_scope_ignores_other_threads():
+    import threading
+
+    renderer = SoftwareRenderer()
+    renderer.stats.track_allocations = True
+    created = []
+    with renderer.stats.allocation_scope():
+        worker = threading.Thread(target=lambda: created.append(
+            pygame.transform.flip(pygame.Surface((4, 4)), True, False)
+        ))
+        worker.start()
+        worker.join()
+        local = pygame.Surface((2, 2))
+        assert isinstance(local, pygame.Surface)
+    renderer.present()
+
+    assert renderer.stats.summary()["surface_allocs"] == 1
+    assert renderer.stats.summary()["transforms"] == 0
+    assert type(created[0]) is pygame.Surface
+    assert type(local) is pygame.Surface
+
+
+def test_overworld_frame_budget():
+    renderer = SoftwareRenderer()
+    state = OverworldState(FakeGame(renderer), "assets/maps/pallet_town.tmx", -1, -1)
+    state.enter()
+    # First frame renders map chunks and sprite frames; later frames reuse them
+    _render_frame(state, renderer)
+
+    renderer.stats.track_allocations = True
+    _render_frame(state, renderer)
+
+    renderer.stats.assert_within(blits=40, transforms=0, surface_allocs=0, font_renders=0)
+
+
+def test_battle_ball_throw_frame_allocates_nothing():
+    renderer = SoftwareRenderer()
+    species_loader = SpeciesLoader()
+    player = Pokemon(species_loader.get_species("pikachu"), 5)
+    enemy = Pokemon(species_loader.get_species("pidgey"), 3)
+    state = BattleState(FakeGame(renderer), player, enemy)
+    state.enter()
+    state.ball_active = True
+    state.ball_sprite_path = BALL_SPRITE
+    state.ball_position = (40.0, 40.0)
+    _render_frame(state, renderer)
+
+    renderer.stats.track_allocations = True
+    _render_frame(state, renderer)
+
+    renderer.stats.assert_within(transforms=0, surface_allocs=0)
@@ -0,0 +1,92 @@
+# ABOUTME: Tests for framebuffer export (bytes, shade indices, shared-memory ring)
+# ABOUTME: Verifies frames round-trip through shared memory and map to Game Boy shades
+
+import pygame
+import pytest
+
+from src.engine import constants
+from src.engine.framebuffer import FrameRing, pixel_view, rgb_bytes, shade_bytes
+from src.engine.game import Game
+
+
+def _frame():
+    surface = pygame.Surface((constants.GAME_WIDTH, constants.GAME_HEIGHT))
+    surface.fill(constants.COLOR_WHITE)
+    surface.fill(constants.COLOR_DARKEST, (0, 0, 4, 4))
+    surface.fill(constants.COLOR_DARK, (4, 0, 4, 4))
+    surface.fill(constants.COLOR_LIGHT, (8, 0, 4, 4))
+    surface.fill(constants.COLOR_BLACK, (12, 0, 4, 4))
+    return surface
+
+
+def test_shade_bytes_maps_palette_to_two_bit_indices():
+    shades = shade_bytes(_frame())
+
+    assert len(shades) == constants.GAME_WIDTH * constants.GAME_HEIGHT
+    assert [shades[x] for x in (0, 4, 8, 12, 100)] == [3, 2, 1, 3, 0]
+    assert max(shades) <= 3
+
+
+def test_ring_round_trips_frames_to_an_attached_reader():
+    surface = _frame()
+    with FrameRing(slots=3) as ring:
+        reader = FrameRing(ring.name, create=False)
+        assert reader.latest() is None
+
+        for _ in range(5):
+            ring.write(surface)
+
+        frame_number, view = reader.latest()
+        assert frame_number == 4
+        assert bytes(view) == rgb_bytes(surface)
+        # Only slots - 1 frames back are guaranteed intact
+        assert reader.frame(3) is not None
+        assert reader.frame(2) is None
+        view.release()
+        reader.close()
+
+
+def test_shade_ring_rejects_wrong_size_and_stores_one_byte_per_pixel():
+    with FrameRing(slots=2, shades=True) as ring:
+        with pytest.raises(ValueError):
+            ring.write(pygame.Surface((8, 8)))
+
+        ring.write(_frame())
+        _, view = ring.latest()
+        assert len(view) == constants.GAME_WIDTH * constants.GAME_HEIGHT
+        assert view[0] == 3
+        view.release()
+
+
+def test_game_writes_presented_frames_to_ring():
+    game = Game(renderer_backend="software")
+    with FrameRing() as ring:
+        game.frame_ring = ring
+        game.renderer.clear(constants.COLOR_DARKEST)
+        game.step(game.fixed_dt)
+
+        assert ring.frames_written == 1
+        _, view = ring.latest()
+        assert tuple(view[:3]) == constants.COLOR_DARKEST
+        view.release()
+
+
+def test_null_backend_leaves_the_ring_empty():
+    game = Game(renderer_backend="null")
+    with FrameRing() as ring:
+        game.frame_ring = ring
+        game.step(game.fixed_dt)
+
+        assert game.renderer.frames_presented == 1
+        assert ring.frames_written == 0
+
+
+def test_pixel_view_is_zero_copy():
+    numpy = pytest.importorskip("numpy")
+    surface = _frame()
+    with pixel_view(surface) as pixels:
+        assert pixels.shape == (constants.GAME_HEIGHT, constants.GAME_WIDTH, 3)
+        assert tuple(pixels[0, 0]) == constants.COLOR_DARKEST
+        pixels[1, 1] = (1, 2, 3)
+    assert surface.get_at((1, 1))[:3] == (1, 2, 3)
+    assert numpy is not None
@@ -0,0 +1,100 @@
+# ABOUTME: Tests for sparse fringe layer spans
+# ABOUTME: Verifies span compilation, colorkey optimization, and camera culling
+
+import pygame
+
+from src.overworld.fringe_spans import FringeSpans
+
+
+class RecordingRenderer:
+    def __init__(self):
+        self.draws = []
+
+    def draw_surface(self, surface, position):
+        self.draws.append((surface, position))
+
+
+def _solid_tile(size=(16, 16), color=(200, 40, 40, 255)):
+    tile = pygame.Surface(size, pygame.SRCALPHA)
+    tile.fill(color)
+    return tile
+
+
+def test_roof_tiles_merge_into_one_rect_span():
+    tile = _solid_tile()
+    tiles = {(0, 0): [(1, x, y) for y in (16, 32) for x in (32, 48, 64)]}
+    spans = FringeSpans(tiles, 256, 256, lambda gid: tile)
+
+    compiled = spans.spans_for_chunk((0, 0))
+
+    assert [rect for rect, _ in compiled] == [pygame.Rect(32, 16, 48, 32)]
+
+
+def test_binary_alpha_strips_use_rle_colorkey():
+    tile = _solid_tile()
+    spans = FringeSpans({(0, 0): [(1, 0, 0)]}, 128, 128, lambda gid: tile)
+
+    (rect, surface), = spans.spans_for_chunk((0, 0))
+
+    assert surface.get_colorkey() is not None
+    assert not surface.get_flags() & pygame.SRCALPHA
+    assert surface.get_at((0, 0))[:3] == (200, 40, 40)
+
+
+def test_translucent_strips_keep_per_pixel_alpha():
+    tile = _solid_tile(color=(10, 10, 10, 128))
+    spans = FringeSpans({(0, 0): [(1, 0, 0)]}, 128, 128, lambda gid: tile)
+
+    (rect, surface), = spans.spans_for_chunk((0, 0))
+
+    assert surface.get_flags() & pygame.SRCALPHA
+
+
+def test_draw_culls_spans_outside_camera():
+    tile = _solid_tile()
+    tiles = {
+        (0, 0): [(1, 0, 0)],
+        (3, 3): [(1, 400, 400)],
+    }
+    spans = FringeSpans(tiles, 512, 512, lambda gid: tile)
+    renderer = RecordingRenderer()
+
+    spans.draw(renderer, 0, 0)
+    assert [position for _, position in renderer.draws] == [(0, 0)]
+
+    renderer.draws.clear()
+    spans.draw(renderer, 300, 300)
+    assert [position for _, position in renderer.draws] == [(100, 100)]
+
+
+def test_chunks_without_fringe_tiles_compile_to_nothing():
+    spans = FringeSpans({}, 256, 256, lambda gid: None)
+
+    assert spans.spans_for_chunk((1, 1)) == []
+
+
+def test_compile_builds_spans_up_front_and_evicts_least_recent():
+    tile = _solid_tile()
+    tiles = {(x, 0): [(1, x * 128, 0)] for x in range(4)}
+    spans = FringeSpans(tiles, 512, 128, lambda gid: tile, max_chunks=2)
+
+    spans.compile((0, 0))
+    assert spans.compile_count == 2
+    assert spans.cached_keys() == [(1, 0), (0, 0)]  # nearest most recently used
+
+    spans.draw(RecordingRenderer(), 0, 0)  # chunks (0, 0) and (1, 0) are visible
+    assert spans.compile_count == 2
+
+    spans.spans_for_chunk((3, 0))
+    assert spans.cached_keys() == [(1, 0), (3, 0)]
+    assert spans.compile_count == 3
+
+
+def test_compile_prefers_chunks_near_the_focus():
+    tile = _solid_tile()
+    tiles = {(x, y): [(1, x * 128, y * 128)] for x in range(4) for y in range(4)}
+    spans = FringeSpans(tiles, 512, 512, lambda gid: tile, max_chunks=4)
+
+    spans.compile((450, 450))
+
+    assert sorted(spans.cached_keys()) == [(2, 2), (2, 3), (3, 2), (3, 3)]
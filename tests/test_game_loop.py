@@ -0,0 +1,124 @@
+# ABOUTME: Tests for Game loop timing (fixed tick accumulator, turbo, interpolation)
+# ABOUTME: Runs the real loop headless with the null renderer backend
+
+import pytest
+
+from src.engine import constants
+from src.engine.game import Game
+from src.overworld.camera import Camera
+from src.overworld.entity import Entity
+
+
+class RecordingState:
+    """Records logical dt values and stops the game after N updates."""
+
+    def __init__(self, game, frames):
+        self.game = game
+        self.frames = frames
+        self.dts = []
+        self.rendered = 0
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_input(self, input_handler):
+        pass
+
+    def update(self, dt):
+        self.dts.append(dt)
+        if len(self.dts) >= self.frames:
+            self.game.running = False
+
+    def render(self, renderer):
+        self.rendered += 1
+
+
+def test_turbo_mode_uses_fixed_dt_and_decimates_rendering():
+    game = Game(renderer_backend="null", fixed_dt=1 / 60, sim_speed=0, render_every=4)
+    state = RecordingState(game, frames=120)
+    game.push_state(state)
+
+    game.run()
+
+    assert state.dts == [1 / 60] * 120
+    assert state.rendered == 30
+    assert game.renderer.frames_presented == 30
+
+
+def test_accumulator_runs_whole_ticks_and_carries_remainder():
+    game = Game(renderer_backend="null", interpolate=True)
+    state = RecordingState(game, frames=1000)
+    game.push_state(state)
+    game.running = True
+
+    assert game.advance(constants.LOGIC_DT * 2.5) == 2
+    assert state.dts == [constants.LOGIC_DT] * 2
+    assert game.render_alpha == pytest.approx(0.5)
+    assert state.rendered == 1
+
+    # A short frame runs no logic but still renders
+    assert game.advance(constants.LOGIC_DT * 0.25) == 0
+    assert state.rendered == 2
+    assert game.advance(constants.LOGIC_DT * 0.5) == 1
+
+
+def test_catch_up_limit_drops_backlog_after_stall():
+    game = Game(renderer_backend="null")
+    state = RecordingState(game, frames=1000)
+    game.push_state(state)
+    game.running = True
+
+    assert game.advance(2.0) == constants.MAX_CATCH_UP_TICKS
+    assert game.accumulator < constants.LOGIC_DT
+    assert game.render_alpha == 1.0
+
+
+def test_entity_and_camera_interpolate_between_ticks():
+    entity = Entity(0, 0)
+    entity.store_previous_position()
+    entity.start_move(constants.DIR_RIGHT)
+    entity.update_movement(speed=4)
+
+    assert entity.get_render_position(0.0) == (0, 0)
+    assert entity.get_render_position(0.5) == (2, 0)
+    assert entity.get_render_position() == (4, 0)
+
+    camera = Camera(1000, 1000)
+    camera.x, camera.y = 40, 20
+    camera.store_previous_position()
+    camera.x, camera.y = 50, 20
+
+    assert camera.get_offset(0.5) == (45, 20)
+    assert camera.get_offset() == (50, 20)
+
+
+def test_states_leaving_the_stack_are_disposed():
+    from src.states.base_state import BaseState
+
+    class DisposableState(BaseState):
+        disposed = 0
+
+        def handle_input(self, input_handler):
+            pass
+
+        def update(self, dt):
+            pass
+
+        def render(self, renderer):
+            pass
+
+        def dispose(self):
+            self.disposed += 1
+
+    game = Game(renderer_backend="null")
+    bottom, replaced, popped = DisposableState(game), DisposableState(game), DisposableState(game)
+    game.push_state(bottom)
+    game.push_state(replaced)
+    game.change_state(popped)
+    game.pop_state()
+
+    assert (bottom.disposed, replaced.disposed, popped.disposed) == (0, 1, 1)
+    assert game.state_stack == [bottom]
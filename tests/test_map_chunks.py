@@ -0,0 +1,100 @@
+# ABOUTME: Tests for chunked, lazily rendered map surfaces
+# ABOUTME: Verifies on-demand chunk rendering, LRU eviction, and pixel parity
+
+import pygame
+
+from src.engine import constants
+from src.overworld.map import MapManager
+from src.overworld.map_chunks import MapChunkCache, bucket_tiles, visible_chunk_keys
+
+
+PALLET_TOWN = "assets/maps/pallet_town.tmx"
+
+
+class RecordingRenderer:
+    def __init__(self):
+        self.draws = []
+
+    def draw_surface(self, surface, position):
+        self.draws.append((surface, position))
+
+
+def _render_full_lower(manager: MapManager) -> pygame.Surface:
+    surface = pygame.Surface((manager.get_width_pixels(), manager.get_height_pixels()))
+    for layer in manager.lower_layers:
+        for x, y, gid in layer:
+            if gid == 0:
+                continue
+            tile = manager.tmx_data.get_tile_image_by_gid(gid)
+            if tile:
+                y_offset = tile.get_height() - manager.tile_height
+                surface.blit(tile, (x * manager.tile_width, y * manager.tile_height - y_offset))
+    return surface
+
+
+def test_visible_chunk_keys_cover_viewport_and_clamp():
+    keys = list(visible_chunk_keys(0, 0, columns=3, rows=3, chunk_size=128))
+    assert keys == [(0, 0), (1, 0), (0, 1), (1, 1)]
+
+    keys = list(visible_chunk_keys(-200, -200, columns=3, rows=3, chunk_size=128))
+    assert keys == []
+
+
+def test_bucket_tiles_places_straddling_tile_in_each_chunk():
+    buckets = bucket_tiles([(7, pygame.Rect(120, 120, 16, 16))], chunk_size=128)
+
+    assert set(buckets) == {(0, 0), (1, 0), (0, 1), (1, 1)}
+    assert buckets[(1, 1)] == [(7, 120, 120)]
+
+
+def test_map_renders_no_chunks_until_drawn():
+    manager = MapManager(PALLET_TOWN)
+
+    assert manager.lower_chunks.render_count == 0
+    assert manager.lower_chunks.cached_keys() == []
+
+    renderer = RecordingRenderer()
+    manager.draw_base(renderer, 0, 0)
+
+    assert manager.lower_chunks.render_count == len(renderer.draws)
+    assert set(manager.lower_chunks.cached_keys()) <= {(0, 0), (1, 0), (0, 1), (1, 1)}
+
+
+def test_chunk_pixels_match_full_map_render():
+    manager = MapManager(PALLET_TOWN)
+    reference = _render_full_lower(manager)
+
+    for key in list(manager.lower_chunks.tiles_by_chunk):
+        chunk = manager.lower_chunks.get_chunk(key)
+        origin_x, origin_y = manager.lower_chunks.chunk_origin(key)
+        for sample_x, sample_y in ((0, 0), (chunk.get_width() - 1, chunk.get_height() - 1), (37, 53)):
+            if sample_x >= chunk.get_width() or sample_y >= chunk.get_height():
+                continue
+            assert chunk.get_at((sample_x, sample_y)) == reference.get_at(
+                (origin_x + sample_x, origin_y + sample_y)
+            )
+
+
+def test_chunk_cache_evicts_least_recently_used():
+    tile = pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE))
+    tiles = {(x, 0): [(1, x * 128, 0)] for x in range(3)}
+    cache = MapChunkCache(tiles, 384, 128, lambda gid: tile, chunk_size=128, max_chunks=2)
+
+    cache.get_chunk((0, 0))
+    cache.get_chunk((1, 0))
+    cache.get_chunk((0, 0))
+    cache.get_chunk((2, 0))
+
+    assert cache.cached_keys() == [(0, 0), (2, 0)]
+    assert cache.render_count == 3
+
+    cache.get_chunk((1, 0))
+    assert cache.render_count == 4
+
+
+def test_edge_chunks_are_clipped_to_map_size():
+    tile = pygame.Surface((constants.TILE_SIZE, constants.TILE_SIZE))
+    cache = MapChunkCache({(1, 1): [(1, 128, 128)]}, 200, 150, lambda gid: tile, chunk_size=128)
+
+    assert cache.get_chunk((1, 1)).get_size() == (72, 22)
+    assert cache.get_chunk((0, 0)) is None
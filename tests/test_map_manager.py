@@ -1,11 +1,16 @@
 # ABOUTME: Tests for TMX-based MapManager loading and properties
 # ABOUTME: Verifies collisions, grass detection, and object parsing
 
+import os
+
 import pygame
 
 from src.overworld.map import MapManager
 
 
+GROUND_TILESET = os.path.abspath("assets/maps/ground_compiled_8x8.png")
+
+
 def setup_module(_module):
     pygame.init()
     pygame.display.set_mode((1, 1))
@@ -47,7 +52,57 @@ def test_map_manager_parses_objects():
     assert warp["dest_y"] == 3
 
 
-def test_fringe_surface_uses_alpha():
-    manager = MapManager("assets/maps/test_map.tmx")
-
-    assert manager.fringe_surface.get_flags() & pygame.SRCALPHA
+def _write_roofed_map(tmp_path) -> str:
+    # 48x16 base tiles (3 chunks wide); a roof strip sits in every chunk and
+    # the player starts in the right-hand one
+    ground = ",\n".join(",".join(["3"] * 48) for _ in range(16))
+    roof_rows = []
+    for y in range(16):
+        row = ["0"] * 48
+        if y in (4, 5):
+            for x in (4, 5, 20, 21, 36, 37):
+                row[x] = "2"
+        if y == 8:
+            row[40] = "5"
+        roof_rows.append(",".join(row))
+    roof = ",\n".join(roof_rows)
+    tmx = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="48" height="16" tilewidth="8" tileheight="8" infinite="0">
+ <tileset firstgid="1" name="ground" tilewidth="8" tileheight="8" tilecount="6" columns="6">
+  <image source="{GROUND_TILESET}" width="48" height="8"/>
+  <tile id="4">
+   <properties>
+    <property name="playerStart" type="bool" value="true"/>
+   </properties>
+  </tile>
+ </tileset>
+ <layer id="1" name="background" width="48" height="16">
+  <data encoding="csv">
+{ground}
+  </data>
+ </layer>
+ <layer id="2" name="roof" width="48" height="16">
+  <data encoding="csv">
+{roof}
+  </data>
+ </layer>
+</map>
+"""
+    path = tmp_path / "roofed.tmx"
+    path.write_text(tmx)
+    return str(path)
+
+
+def test_fringe_layers_compile_to_sparse_spans(tmp_path):
+    manager = MapManager(_write_roofed_map(tmp_path))
+    fringe = manager.fringe_spans
+
+    assert manager.player_start == (20, 4)
+    # Compiled at load; the start chunk is kept longest under LRU pressure
+    assert fringe.compile_count == 3
+    assert fringe.cached_keys() == [(0, 0), (1, 0), (2, 0)]
+    for key in fringe.cached_keys():
+        for rect, surface in fringe.spans_for_chunk(key):
+            assert surface.get_size() == rect.size
+            assert surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None
+    assert fringe.compile_count == 3
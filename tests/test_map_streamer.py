@@ -0,0 +1,157 @@
+# ABOUTME: Tests for Gen 1-style map connections and neighbor streaming
+# ABOUTME: Verifies edge parsing, cross-border collision, crossing, and unloading
+
+import os
+import time
+
+from src.engine import constants
+from src.overworld.camera import Camera
+from src.overworld.map import MapManager
+from src.overworld.map_streamer import MapStreamer
+
+
+GROUND_TILESET = os.path.abspath("assets/maps/ground_compiled_8x8.png")
+
+
+def _write_map(tmp_path, name, width, height, properties) -> str:
+    rows = [",".join(["3"] * width) for _ in range(height)]
+    data = ",\n".join(rows)
+    props = "\n".join(
+        f'  <property name="{key}" value="{value}"/>' for key, value in properties.items()
+    )
+    tmx = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="{width}" height="{height}" tilewidth="8" tileheight="8" infinite="0">
+ <properties>
+{props}
+ </properties>
+ <tileset firstgid="1" name="ground" tilewidth="8" tileheight="8" tilecount="6" columns="6">
+  <image source="{GROUND_TILESET}" width="48" height="8"/>
+ </tileset>
+ <layer id="1" name="background" width="{width}" height="{height}">
+  <data encoding="csv">
+{data}
+  </data>
+ </layer>
+</map>
+"""
+    path = tmp_path / f"{name}.tmx"
+    path.write_text(tmx)
+    return str(path)
+
+
+def _connected_maps(tmp_path):
+    # Town is 4x4 metatiles; Route (3x2 metatiles) sits north, shifted right by one
+    town = _write_map(tmp_path, "town", 8, 8, {
+        "connection_north": "route",
+        "connection_north_offset": 1
+    })
+    _write_map(tmp_path, "route", 6, 4, {
+        "connection_south": "town",
+        "connection_south_offset": -1
+    })
+    return town, lambda name: str(tmp_path / f"{name}.tmx")
+
+
+def _wait_for_neighbor(streamer, direction, x, y):
+    deadline = time.time() + 5
+    while direction not in streamer.neighbors and time.time() < deadline:
+        streamer.update(x, y)
+        time.sleep(0.01)
+
+
+def test_map_connections_are_parsed_from_properties(tmp_path):
+    town_path, _ = _connected_maps(tmp_path)
+    town = MapManager(town_path)
+
+    assert town.connections == {"north": {"map": "route", "offset": 1}}
+
+
+def test_streamer_loads_neighbor_near_edge_and_walks_across(tmp_path):
+    town_path, resolve = _connected_maps(tmp_path)
+    streamer = MapStreamer(MapManager(town_path), resolve, preload_distance=1, unload_distance=2)
+
+    streamer.update(1, 3)
+    assert streamer.loader.pending_paths() == []
+    assert streamer.neighbors == {}
+
+    _wait_for_neighbor(streamer, "north", 1, 1)
+    route = streamer.neighbors["north"]
+    assert (route.origin_x, route.origin_y) == (1, -2)
+
+    assert streamer.is_walkable(1, -1) is True
+    assert streamer.is_walkable(3, -2) is True
+    # Outside the route's span along the shared edge
+    assert streamer.is_walkable(0, -1) is False
+    assert streamer.is_walkable(4, -1) is False
+    # Unconnected edges stay solid
+    assert streamer.is_walkable(1, 4) is False
+
+
+def test_crossing_swaps_maps_and_keeps_previous_resident(tmp_path):
+    town_path, resolve = _connected_maps(tmp_path)
+    town = MapManager(town_path)
+    streamer = MapStreamer(town, resolve, preload_distance=1, unload_distance=2)
+
+    assert streamer.cross(1, 0) is None
+    _wait_for_neighbor(streamer, "north", 1, 0)
+    assert streamer.cross(1, -1) == (1, -2)
+    assert streamer.current_map.map_name == "route"
+    assert streamer.open_edges() == {"south"}
+
+    back = streamer.neighbors["south"]
+    assert back.map is town
+    assert (back.origin_x, back.origin_y) == (-1, 2)
+    assert streamer.is_walkable(0, 2) is True
+
+
+def test_unloaded_edge_blocks_instead_of_waiting(tmp_path):
+    town_path, resolve = _connected_maps(tmp_path)
+    route = MapManager(resolve("route"))
+
+    class HeldLoader:
+        """Loader whose map only becomes ready when the test says so."""
+        ready = False
+        requested = []
+
+        def request(self, path):
+            self.requested.append(path)
+
+        def take(self, path, wait=False):
+            assert not wait
+            return route if self.ready else None
+
+        def pending_paths(self):
+            return []
+
+    loader = HeldLoader()
+    streamer = MapStreamer(MapManager(town_path), resolve, loader=loader, preload_distance=0)
+
+    assert streamer.is_walkable(1, -1) is False
+    assert streamer.cross(1, -1) is None
+    assert loader.requested == [resolve("route")] * 2
+
+    loader.ready = True
+    assert streamer.is_walkable(1, -1) is True
+    assert streamer.neighbors["north"].map is route
+
+
+def test_neighbors_unload_past_hysteresis(tmp_path):
+    town_path, resolve = _connected_maps(tmp_path)
+    streamer = MapStreamer(MapManager(town_path), resolve, preload_distance=1, unload_distance=2)
+
+    _wait_for_neighbor(streamer, "north", 1, 0)
+    streamer.update(1, 2)
+    assert "north" in streamer.neighbors
+
+    streamer.update(1, 3)
+    assert streamer.neighbors == {}
+
+
+def test_camera_scrolls_past_open_edges_only():
+    camera = Camera(constants.GAME_WIDTH * 2, constants.GAME_HEIGHT * 2)
+    camera.open_edges = {"north"}
+
+    camera.center_on(0, 0)
+
+    assert camera.x == 0
+    assert camera.y == -constants.GAME_HEIGHT // 2
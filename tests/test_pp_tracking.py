@@ -106,3 +106,56 @@ def test_pp_persists_between_uses(pikachu):
 
     # Should be decremented by 2 total
     assert pp_after_second == pp_after_first - 1
+
+
+def test_move_pp_is_a_live_view_aligned_with_moves(pikachu):
+    """move_pp should write through to the Pokemon and follow reassigned moves."""
+    pikachu.moves = ["thunder-shock", "growl"]
+    pikachu.move_pp = {"thunder-shock": (10, 30), "growl": (40, 40), "unknown": (1, 1)}
+
+    pikachu.move_pp["growl"] = (12, 40)
+    assert dict(pikachu.move_pp) == {"thunder-shock": (10, 30), "growl": (12, 40)}
+
+    # Reordering moves keeps each move's PP; new moves start without PP
+    pikachu.moves = ["growl", "thunder-shock", "tail-whip"]
+    assert pikachu.get_move_pp("growl") == (12, 40)
+    assert pikachu.get_move_pp("thunder-shock") == (10, 30)
+    assert "tail-whip" not in pikachu.move_pp
+
+    assert pikachu.replace_move("growl", "quick-attack")
+    assert pikachu.moves[0] == "quick-attack"
+    assert pikachu.get_move_pp("quick-attack")[0] == pikachu.get_move_pp("quick-attack")[1] > 0
+    assert "growl" not in pikachu.move_pp
+
+
+def test_pokemon_is_slotted_and_pickles(pikachu):
+    """Pokemon should have no per-instance dict and survive a pickle round trip."""
+    import pickle
+
+    assert not hasattr(pikachu, "__dict__")
+    pikachu.use_move_pp(pikachu.moves[0])
+
+    copy = pickle.loads(pickle.dumps(pikachu))
+
+    assert copy.to_dict() == pikachu.to_dict()
+
+
+def test_editing_moves_keeps_pp_aligned_and_byte_values_are_validated(pikachu):
+    """In-place edits to moves keep each move's PP, and out-of-range values fail clearly."""
+    pikachu.moves = ["thunder-shock", "growl"]
+    pikachu.move_pp = {"thunder-shock": (10, 30), "growl": (40, 40)}
+
+    pikachu.moves.insert(0, "tail-whip")
+    pikachu.moves[0] = "quick-attack"
+    pikachu.moves.append("tail-whip")
+
+    assert pikachu.moves == ["quick-attack", "thunder-shock", "growl", "tail-whip"]
+    assert dict(pikachu.move_pp) == {"thunder-shock": (10, 30), "growl": (40, 40)}
+    del pikachu.moves[1]
+    assert pikachu.moves == ["quick-attack", "growl", "tail-whip"]
+    assert dict(pikachu.move_pp) == {"growl": (40, 40)}
+
+    with pytest.raises(ValueError, match="PP for growl"):
+        pikachu.move_pp["growl"] = (256, 40)
+    with pytest.raises(ValueError, match="Attack IV"):
+        pikachu.iv_attack = 16
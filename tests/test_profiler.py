@@ -0,0 +1,76 @@
+# ABOUTME: Tests for the per-state frame-phase profiler
+# ABOUTME: Verifies percentile math, rolling windows, game loop wiring, and JSON dumps
+
+import json
+
+import pygame
+
+from src.engine import constants
+from src.engine.game import Game
+from src.engine.profiler import FrameProfiler, percentile
+
+
+class BattleLikeState:
+    """State that stops the game after a number of ticks."""
+
+    def __init__(self, game, frames):
+        self.game = game
+        self.frames = frames
+        self.updates = 0
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_input(self, input_handler):
+        pass
+
+    def update(self, dt):
+        self.updates += 1
+        if self.updates >= self.frames:
+            self.game.running = False
+
+    def render(self, renderer):
+        renderer.clear()
+
+
+def test_percentiles_use_nearest_rank():
+    samples = list(range(1, 101))
+
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.95) == 95
+    assert percentile(samples, 0.99) == 99
+    assert percentile([], 0.5) == 0.0
+
+
+def test_profiler_keeps_a_rolling_window_per_state_phase():
+    profiler = FrameProfiler(window=4)
+    for ms in (1, 2, 3, 4, 100, 100):
+        profiler.record("OverworldState", "render", ms / 1000.0)
+    profiler.record("BattleState", "render", 0.2)
+
+    stats = profiler.stats("OverworldState", "render")
+    assert stats["max"] == 100.0
+    assert stats["p50"] == 4.0
+    assert stats["samples"] == 6
+    assert profiler.worst_state("render", "p95") == ("BattleState", 200.0)
+    assert profiler.stats("OverworldState", "update") is None
+
+
+def test_game_loop_profiles_phases_and_dumps_json_on_quit(tmp_path):
+    profile_path = tmp_path / "profile.json"
+    game = Game(renderer_backend="null", sim_speed=0, profile_path=str(profile_path))
+    game.push_state(BattleLikeState(game, frames=5))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=constants.KEY_PROFILER_OVERLAY))
+
+    game.run()
+
+    assert game.profiler.overlay_enabled is True
+    report = json.loads(profile_path.read_text())
+    phases = report["BattleLikeState"]
+    assert set(phases) == {"handle_input", "update", "render", "present"}
+    assert phases["update"]["samples"] == 5
+    # Overlay text was drawn on top of the state's own frame
+    assert game.renderer.draw_calls["draw_text"] > 0
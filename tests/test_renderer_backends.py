@@ -0,0 +1,87 @@
+# ABOUTME: Tests for the display, software, and null renderer backends
+# ABOUTME: Verifies backend selection and that headless backends run the real game loop
+
+import pygame
+import pytest
+
+from src.engine import constants
+from src.engine.game import Game
+from src.engine.renderer import NullRenderer, SoftwareRenderer, create_renderer, resolve_backend
+
+
+class StopAfterFrames:
+    """Minimal state that draws a little and stops the game after N frames."""
+
+    def __init__(self, game, frames):
+        self.game = game
+        self.frames = frames
+        self.rendered = 0
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_input(self, input_handler):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def render(self, renderer):
+        renderer.clear(constants.COLOR_WHITE)
+        renderer.draw_rect(constants.COLOR_BLACK, (0, 0, 8, 8))
+        renderer.draw_text("HI", 10, 10)
+        self.rendered += 1
+        if self.rendered >= self.frames:
+            self.game.running = False
+
+
+def test_backend_resolution_prefers_argument_then_environment(monkeypatch):
+    monkeypatch.setenv(constants.RENDERER_ENV_VAR, "software")
+    assert resolve_backend() == "software"
+    assert resolve_backend("NULL") == "null"
+
+    monkeypatch.delenv(constants.RENDERER_ENV_VAR)
+    assert resolve_backend() == "display"
+
+    with pytest.raises(ValueError):
+        resolve_backend("opengl")
+
+
+def test_software_renderer_draws_pixels_off_screen():
+    renderer = create_renderer("software")
+    assert type(renderer) is SoftwareRenderer
+
+    renderer.clear(constants.COLOR_WHITE)
+    renderer.draw_rect(constants.COLOR_BLACK, (0, 0, 4, 4))
+    renderer.present()
+
+    assert renderer.game_surface.get_at((1, 1))[:3] == constants.COLOR_BLACK
+    assert renderer.game_surface.get_at((10, 10))[:3] == constants.COLOR_WHITE
+    assert renderer.frames_presented == 1
+
+
+def test_null_renderer_counts_calls_and_measures_text():
+    renderer = create_renderer("null")
+    assert isinstance(renderer, NullRenderer)
+
+    renderer.clear()
+    renderer.draw_surface(pygame.Surface((16, 16)), (0, 0))
+    width, height = renderer.draw_text("POKEMON", 0, 0)
+
+    assert renderer.draw_calls == {"clear": 1, "draw_surface": 1, "draw_text": 1}
+    assert width > 0 and height > 0
+
+
+def test_game_runs_real_loop_with_null_backend():
+    game = Game(renderer_backend="null")
+    state = StopAfterFrames(game, frames=3)
+    game.push_state(state)
+
+    game.run()
+
+    assert state.rendered == 3
+    assert game.renderer.frames_presented == 3
+    assert game.renderer.draw_calls["draw_rect"] == 3
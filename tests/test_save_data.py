@@ -1,8 +1,12 @@
 # ABOUTME: Tests for save data serialization and storage
 # ABOUTME: Validates round-trip persistence of game state
 
+import json
+import zlib
 from pathlib import Path
 
+import pytest
+
 from src.battle.pokemon import Pokemon
 from src.battle.species_loader import SpeciesLoader
 from src.battle.stat_stages import StatStages
@@ -10,6 +14,9 @@ from src.battle.status_effects import StatusCondition
 from src.items.bag import Bag
 from src.party.party import Party
 from src.save.save_data import SaveData
+from src.save import save_storage
+from src.save import binary_format
+from src.save.binary_format import decode_save, encode_save
 from src.save.save_storage import load_save_data, save_exists, write_save_data
 
 
@@ -68,6 +75,22 @@ def test_pokemon_to_dict_round_trip():
     assert loaded.exp_to_next_level == pokemon.exp_to_next_level
 
 
+def test_pokemon_from_dict_skips_rng_and_move_loader(monkeypatch):
+    """Loading a stored Pokemon should not roll IVs or build a MoveLoader."""
+    species_loader = SpeciesLoader()
+    data = _make_pokemon(species_loader).to_dict()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("load path should not call this")
+
+    monkeypatch.setattr("src.battle.pokemon.random.randint", fail)
+    monkeypatch.setattr("src.battle.move_loader.MoveLoader.__init__", fail)
+    monkeypatch.setattr(Pokemon, "_determine_moves", fail)
+    loaded = Pokemon.from_dict(data, species_loader)
+
+    assert loaded.to_dict() == data
+
+
 def test_party_to_dict_round_trip():
     """Party should serialize and deserialize with order preserved."""
     species_loader = SpeciesLoader()
@@ -185,3 +208,89 @@ def test_save_storage_round_trip(tmp_path: Path):
 
     loaded = load_save_data(save_path, species_loader)
     assert loaded.to_dict() == save_data.to_dict()
+
+
+def _full_save_data(species_loader: SpeciesLoader) -> SaveData:
+    party = Party()
+    party.add(_make_pokemon(species_loader))
+    bag = Bag()
+    for _ in range(3):
+        bag.add_item("potion")
+    bag.add_item("poke-ball")
+    return SaveData(
+        player_name="PLAYER",
+        player_direction="up",
+        map_path="assets/maps/pallet_town.tmx",
+        player_x=5,
+        player_y=-2,
+        party=party,
+        bag=bag,
+        defeated_trainers={"route_1:youngster"},
+        collected_items={"pallet_town:potion"},
+        reserved_flags={
+            "badges": ["boulder"],
+            "story": {"got_pikachu": True},
+            "pokedex_seen": ["pikachu", "rattata"],
+            "pokedex_caught": ["pikachu"]
+        }
+    )
+
+
+def test_binary_format_round_trips_and_is_smaller_than_json():
+    data = _full_save_data(SpeciesLoader()).to_dict()
+
+    encoded = encode_save(data)
+
+    assert decode_save(encoded) == data
+    assert len(encoded) < len(json.dumps(data, indent=2)) // 3
+
+
+def test_binary_payload_is_compressed_and_uncompressed_version_2_still_decodes():
+    data = _full_save_data(SpeciesLoader()).to_dict()
+    encoded = encode_save(data)
+    prefix = encoded[:binary_format.SUMMARY_PREFIX_SIZE]
+    payload = zlib.decompress(encoded[binary_format.SUMMARY_PREFIX_SIZE:])
+
+    assert len(encoded) < len(prefix) + len(payload)
+
+    header = binary_format._HEADER.pack(
+        binary_format.MAGIC, 2, 0, len(payload), zlib.crc32(payload)
+    )
+    version_2 = header + prefix[binary_format._HEADER.size:] + payload
+    assert decode_save(version_2) == data
+
+
+def test_binary_save_detects_corruption(tmp_path: Path):
+    save_path = tmp_path / "save.sav"
+    write_save_data(_full_save_data(SpeciesLoader()), save_path)
+    raw = bytearray(save_path.read_bytes())
+    raw[-5] ^= 0xFF
+    save_path.write_bytes(bytes(raw))
+
+    with pytest.raises(ValueError, match="checksum"):
+        load_save_data(save_path, SpeciesLoader())
+
+
+def test_write_replaces_atomically_without_leftover_temp_file(tmp_path: Path):
+    species_loader = SpeciesLoader()
+    save_path = tmp_path / "saves" / "save.sav"
+    write_save_data(_full_save_data(species_loader), save_path)
+    write_save_data(_full_save_data(species_loader), save_path)
+
+    assert [path.name for path in save_path.parent.iterdir()] == ["save.sav"]
+
+
+def test_legacy_json_save_is_read_when_no_binary_save_exists(tmp_path: Path, monkeypatch):
+    species_loader = SpeciesLoader()
+    save_data = _full_save_data(species_loader)
+    monkeypatch.setattr(save_storage, "DEFAULT_SAVE_PATH", tmp_path / "save.sav")
+    monkeypatch.setattr(save_storage, "LEGACY_SAVE_PATH", tmp_path / "save.json")
+    (tmp_path / "save.json").write_text(json.dumps(save_data.to_dict(), indent=2))
+
+    assert save_exists() is True
+    assert load_save_data(None, species_loader).to_dict() == save_data.to_dict()
+
+    # The next save is binary and takes precedence
+    write_save_data(save_data)
+    assert (tmp_path / "save.sav").read_bytes().startswith(b"PKYS")
+    assert load_save_data(None, species_loader).to_dict() == save_data.to_dict()
@@ -0,0 +1,199 @@
+# ABOUTME: Tests for save slots and their fixed-size summaries
+# ABOUTME: Verifies the picker reads only summaries and decodes the picked slot on demand
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.battle.pokemon import Pokemon
+from src.battle.species_loader import SpeciesLoader
+from src.items.bag import Bag
+from src.party.party import Party
+from src.save import binary_format, save_storage
+from src.save.save_data import SaveData, SaveSummary
+from src.save.save_storage import (
+    first_empty_slot,
+    list_save_slots,
+    read_save_summary,
+    slot_save_path,
+    write_save_data
+)
+from src.states.save_slot_state import SaveSlotState
+
+
+class FakeInput:
+    def __init__(self, pressed: set[str]):
+        self.pressed = pressed
+
+    def is_just_pressed(self, key: str) -> bool:
+        return key in self.pressed
+
+
+class FakeGame:
+    def __init__(self):
+        self.save_slot = 0
+        self.play_time = 0.0
+        self.pop_count = 0
+        self.changed_to = None
+
+    def pop_state(self):
+        self.pop_count += 1
+
+    def change_state(self, state):
+        self.changed_to = state
+
+
+@pytest.fixture
+def save_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(save_storage, "DEFAULT_SAVE_DIR", tmp_path)
+    monkeypatch.setattr(save_storage, "DEFAULT_SAVE_PATH", tmp_path / "save.sav")
+    monkeypatch.setattr(save_storage, "LEGACY_SAVE_PATH", tmp_path / "save.json")
+    return tmp_path
+
+
+def _save_data(species_loader: SpeciesLoader, name="ASH", party_species=("pikachu",)) -> SaveData:
+    party = Party()
+    for species_id in party_species:
+        party.add(Pokemon(species_loader.get_species(species_id), 5))
+    return SaveData(
+        player_name=name,
+        player_direction="up",
+        map_path="assets/maps/viridian_city.tmx",
+        player_x=4,
+        player_y=9,
+        party=party,
+        bag=Bag(),
+        defeated_trainers=set(),
+        collected_items=set(),
+        reserved_flags={"badges": ["boulder", "cascade"]},
+        play_time=3 * 3600 + 7 * 60 + 30
+    )
+
+
+def test_summary_is_read_from_the_prefix_without_species_data(save_dir: Path, monkeypatch):
+    species_loader = SpeciesLoader()
+    path = slot_save_path(1)
+    write_save_data(_save_data(species_loader, party_species=("pikachu", "rattata")), path)
+    # Only the fixed-size prefix is needed
+    path.write_bytes(path.read_bytes()[:binary_format.SUMMARY_PREFIX_SIZE])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("summaries must not build a SpeciesLoader")
+
+    monkeypatch.setattr(SpeciesLoader, "__init__", fail)
+    summary = read_save_summary(path)
+
+    assert summary == SaveSummary(
+        player_name="ASH",
+        map_name="viridian_city",
+        play_time=3 * 3600 + 7 * 60 + 30,
+        badge_count=2,
+        party_species=["pikachu", "rattata"]
+    )
+    assert summary.format_play_time() == "3:07"
+
+
+def test_list_save_slots_covers_empty_legacy_and_corrupt_slots(save_dir: Path):
+    species_loader = SpeciesLoader()
+    (save_dir / "save.json").write_text(json.dumps(_save_data(species_loader, name="OLD").to_dict()))
+    write_save_data(_save_data(species_loader), slot_save_path(2))
+    raw = bytearray(slot_save_path(2).read_bytes())
+    raw[20] ^= 0xFF  # inside the summary block
+    slot_save_path(2).write_bytes(bytes(raw))
+
+    summaries = list_save_slots()
+
+    assert [summary.player_name if summary else None for summary in summaries] == ["OLD", None, None]
+    assert first_empty_slot() == 1
+
+
+def test_version_1_saves_fall_back_to_a_full_decode(save_dir: Path):
+    encoded = binary_format.encode_save(_save_data(SpeciesLoader()).to_dict())
+    header = bytearray(encoded[:binary_format._HEADER.size])
+    header[len(binary_format.MAGIC)] = 1
+    payload = encoded[binary_format.SUMMARY_PREFIX_SIZE:]
+    slot_save_path(0).write_bytes(bytes(header) + payload)
+
+    summary = read_save_summary(slot_save_path(0))
+
+    assert summary.player_name == "ASH"
+    assert summary.play_time == 0  # version 1 files never stored it
+    assert binary_format.decode_save(bytes(header) + payload)["party"][0]["species_id"] == "pikachu"
+
+
+def test_slot_picker_skips_empty_slots_and_loads_the_pick(save_dir: Path, monkeypatch):
+    species_loader = SpeciesLoader()
+    write_save_data(_save_data(species_loader, name="RED"), slot_save_path(0))
+    write_save_data(_save_data(species_loader, name="BLUE"), slot_save_path(2))
+
+    created = {}
+
+    class FakeOverworld:
+        def __init__(self, game, map_path, **kwargs):
+            created["map_path"] = map_path
+            created.update(kwargs)
+
+    monkeypatch.setattr("src.states.overworld_state.OverworldState", FakeOverworld)
+    game = FakeGame()
+    state = SaveSlotState(game)
+
+    state.handle_input(FakeInput({"down"}))
+    assert state.menu.cursor_index == 2
+    state.handle_input(FakeInput({"a"}))
+
+    assert isinstance(game.changed_to, FakeOverworld)
+    assert game.pop_count == 1
+    assert game.save_slot == 2
+    assert game.play_time == 3 * 3600 + 7 * 60 + 30
+    assert created["map_path"] == "assets/maps/viridian_city.tmx"
+    assert created["party"].pokemon[0].species.species_id == "pikachu"
+
+
+def test_corrupt_save_body_marks_the_slot_instead_of_crashing(save_dir: Path):
+    species_loader = SpeciesLoader()
+    write_save_data(_save_data(species_loader, name="RED"), slot_save_path(0))
+    write_save_data(_save_data(species_loader, name="BLUE"), slot_save_path(1))
+    raw = bytearray(slot_save_path(0).read_bytes())
+    raw[-1] ^= 0xFF  # past the summary, so only the full decode fails
+    slot_save_path(0).write_bytes(bytes(raw))
+
+    game = FakeGame()
+    state = SaveSlotState(game)
+    assert state.menu.get_selection() == 0
+    state.handle_input(FakeInput({"a"}))
+
+    assert game.changed_to is None
+    assert game.pop_count == 0
+    assert state.message == "SLOT 1 IS CORRUPTED"
+    assert state.menu.get_selection() == 1
+
+
+def test_new_game_asks_before_overwriting_a_full_set_of_slots(save_dir: Path, monkeypatch):
+    species_loader = SpeciesLoader()
+    for slot in range(save_storage.SAVE_SLOT_COUNT):
+        write_save_data(_save_data(species_loader), slot_save_path(slot))
+    assert first_empty_slot() is None
+
+    class FakeOverworld:
+        def __init__(self, game, map_path, **kwargs):
+            self.map_path = map_path
+
+    monkeypatch.setattr("src.states.overworld_state.OverworldState", FakeOverworld)
+    game = FakeGame()
+    game.save_slot = None
+    state = SaveSlotState(game, new_game=True)
+
+    state.handle_input(FakeInput({"down"}))
+    state.handle_input(FakeInput({"a"}))
+    assert state.message == "OVERWRITE SLOT 2?"
+    state.handle_input(FakeInput({"b"}))
+    assert game.changed_to is None and state.message is None
+
+    state.handle_input(FakeInput({"a"}))
+    state.handle_input(FakeInput({"a"}))
+
+    assert isinstance(game.changed_to, FakeOverworld)
+    assert game.pop_count == 1
+    assert game.save_slot == 1
+    assert game.play_time == 0.0
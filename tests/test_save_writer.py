@@ -0,0 +1,71 @@
+# ABOUTME: Tests for the background save writer
+# ABOUTME: Verifies snapshots, ordered completion callbacks, and error reporting
+
+from pathlib import Path
+
+from src.battle.pokemon import Pokemon
+from src.battle.species_loader import SpeciesLoader
+from src.items.bag import Bag
+from src.party.party import Party
+from src.save.save_data import SaveData
+from src.save.save_storage import load_save_data
+from src.save.save_writer import SaveWriter
+
+
+def _save_data(species_loader, player_x=3) -> SaveData:
+    party = Party()
+    party.add(Pokemon(species_loader.get_species("pikachu"), 5))
+    return SaveData(
+        player_name="PLAYER",
+        player_direction="down",
+        map_path="assets/maps/pallet_town.tmx",
+        player_x=player_x,
+        player_y=4,
+        party=party,
+        bag=Bag(),
+        defeated_trainers=set(),
+        collected_items=set()
+    )
+
+
+def test_writer_snapshots_on_submit_and_reports_on_poll(tmp_path: Path):
+    species_loader = SpeciesLoader()
+    writer = SaveWriter()
+    results = []
+    save_data = _save_data(species_loader)
+
+    writer.submit(save_data, tmp_path / "save.sav", on_complete=results.append)
+    # Changes after submit don't leak into the queued save
+    save_data.player_x = 99
+    save_data.party.pokemon[0].level = 50
+    save_data.reserved_flags["badges"].append("boulder")
+
+    assert results == []  # callbacks only run from poll()
+    writer.flush()
+
+    assert results == [None]
+    assert not writer.busy
+    loaded = load_save_data(tmp_path / "save.sav", species_loader)
+    assert loaded.player_x == 3
+    assert loaded.party.pokemon[0].level == 5
+    assert loaded.reserved_flags["badges"] == []
+    writer.shutdown()
+
+
+def test_writer_reports_in_order_and_passes_errors(tmp_path: Path):
+    species_loader = SpeciesLoader()
+    writer = SaveWriter()
+    results = []
+    (tmp_path / "blocked").mkdir()
+    (tmp_path / "blocked" / "save.sav").mkdir()  # a directory can't be replaced by a file
+
+    writer.submit(_save_data(species_loader), tmp_path / "blocked" / "save.sav",
+                  on_complete=lambda error: results.append(("first", error)))
+    writer.submit(_save_data(species_loader, player_x=7), tmp_path / "save.sav",
+                  on_complete=lambda error: results.append(("second", error)))
+    writer.shutdown()
+
+    assert [name for name, _ in results] == ["first", "second"]
+    assert isinstance(results[0][1], OSError)
+    assert results[1][1] is None
+    assert load_save_data(tmp_path / "save.sav", species_loader).player_x == 7
@@ -8,6 +8,7 @@ from src.engine import constants
 from src.states.start_menu_state import StartMenuState
 from src.party.party import Party
 from src.items.bag import Bag
+from src.save.save_storage import slot_save_path
 
 
 class FakeInput:
@@ -340,8 +341,9 @@ def test_start_menu_state_handles_save_selection(monkeypatch):
 
     captured = {}
 
-    def fake_write_save_data(save_data):
+    def fake_write_save_data(save_data, save_path=None):
         captured["save_data"] = save_data
+        captured["save_path"] = save_path
 
     monkeypatch.setattr("src.save.save_storage.write_save_data", fake_write_save_data)
 
@@ -352,5 +354,6 @@ def test_start_menu_state_handles_save_selection(monkeypatch):
     state.handle_input(fake_input)
 
     assert "save_data" in captured
+    assert captured["save_path"] == slot_save_path(0)
     assert previous_state.active_dialog is not None
     assert getattr(previous_state.active_dialog, "text", None) == "PLAYER saved the game."
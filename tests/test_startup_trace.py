@@ -0,0 +1,56 @@
+# ABOUTME: Tests for startup tracing and lazy imports on the title screen path
+# ABOUTME: Verifies import timing, the JSON report, and that battle code loads on first use
+
+import json
+import subprocess
+import sys
+
+from src.engine.startup_trace import StartupTracer
+
+
+def test_tracer_times_imports_marks_and_spans(tmp_path, monkeypatch):
+    (tmp_path / "startup_probe_child.py").write_text("VALUE = 1\n")
+    (tmp_path / "startup_probe.py").write_text("import startup_probe_child\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    tracer = StartupTracer(report_path=str(tmp_path / "trace" / "startup.json")).install()
+    try:
+        import startup_probe  # noqa: F401
+        with tracer.span("work"):
+            pass
+    finally:
+        sys.modules.pop("startup_probe", None)
+        sys.modules.pop("startup_probe_child", None)
+    tracer.finish()
+
+    parent = tracer.imports["startup_probe"]
+    child = tracer.imports["startup_probe_child"]
+    assert parent["total_ms"] >= child["total_ms"]
+    assert abs(parent["self_ms"] - (parent["total_ms"] - child["total_ms"])) < 1e-6
+    assert tracer._finder is None
+
+    report = json.loads((tmp_path / "trace" / "startup.json").read_text())
+    assert report["time_to_first_frame_ms"] == tracer.marks["first_frame"]
+    assert "work" in report["spans"]
+    assert report["modules_imported"] >= 2
+
+
+def test_title_screen_import_skips_overworld_and_battle_modules():
+    code = (
+        "import sys\n"
+        "import src.states.title_menu_state\n"
+        "heavy = ['src.states.overworld_state', 'src.states.battle_state', 'src.ui.battle_menu']\n"
+        "print([name for name in heavy if name in sys.modules])\n"
+        "import src.battle.type_chart as type_chart\n"
+        "print(type_chart._type_chart is None)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines()[-2:] == ["[]", "True"]
+
+
+def test_overworld_loads_battle_state_on_first_use():
+    import src.states.overworld_state as overworld_state
+    from src.states.battle_state import BattleState
+
+    assert overworld_state.BattleState is BattleState
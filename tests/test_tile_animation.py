@@ -0,0 +1,94 @@
+# ABOUTME: Tests for Tiled-driven animated tiles and incremental chunk updates
+# ABOUTME: Verifies frame timing and that only animated tiles are re-blitted
+
+import os
+
+import pygame
+
+from src.overworld.map import MapManager
+from src.overworld.tile_animation import TileAnimation
+
+
+GROUND_TILESET = os.path.abspath("assets/maps/ground_compiled_8x8.png")
+
+
+class RecordingRenderer:
+    def draw_surface(self, surface, position):
+        pass
+
+
+def _write_animated_map(tmp_path) -> str:
+    # 4x4 base tiles; gid 1 animates between tile 0 and tile 1 every 100ms
+    data = ",\n".join(["1,3,3,3", "3,3,3,3", "3,3,3,3", "3,3,3,1"])
+    tmx = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="4" height="4" tilewidth="8" tileheight="8" infinite="0">
+ <tileset firstgid="1" name="ground" tilewidth="8" tileheight="8" tilecount="6" columns="6">
+  <image source="{GROUND_TILESET}" width="48" height="8"/>
+  <tile id="0">
+   <animation>
+    <frame tileid="0" duration="100"/>
+    <frame tileid="1" duration="100"/>
+   </animation>
+  </tile>
+ </tileset>
+ <layer id="1" name="background" width="4" height="4">
+  <data encoding="csv">
+{data}
+  </data>
+ </layer>
+</map>
+"""
+    path = tmp_path / "animated.tmx"
+    path.write_text(tmx)
+    return str(path)
+
+
+def test_tile_animation_advances_by_duration():
+    first = pygame.Surface((8, 8))
+    second = pygame.Surface((8, 8))
+    animation = TileAnimation([(first, 100), (second, 50)])
+
+    assert animation.advance(99) is False
+    assert animation.image is first
+    assert animation.advance(1) is True
+    assert animation.image is second
+    assert animation.advance(50) is True
+    assert animation.image is first
+    # Long pauses wrap around instead of replaying every frame
+    assert animation.advance(150 * 7 + 100) is True
+    assert animation.image is second
+
+
+def test_map_indexes_animated_tile_positions(tmp_path):
+    manager = MapManager(_write_animated_map(tmp_path))
+
+    assert manager.tile_animator.has_animations()
+    placements = manager.tile_animator.placements[1][(0, 0)]
+    assert sorted(placements) == [(1, 0, 0), (1, 24, 24)]
+
+
+def test_animation_tick_reblits_only_animated_tiles(tmp_path):
+    manager = MapManager(_write_animated_map(tmp_path))
+    renderer = RecordingRenderer()
+    manager.draw_base(renderer, 0, 0)
+    chunk = manager.lower_chunks.get_chunk((0, 0))
+    static_before = chunk.get_at((8, 0))
+
+    manager.update(0.1)
+    assert manager.lower_chunks.redraw_count == 0  # Deferred until drawn
+    manager.draw_base(renderer, 0, 0)
+
+    next_frame = manager.tile_animator.animations[1].frames[1][0]
+    assert manager.lower_chunks.render_count == 1
+    assert manager.lower_chunks.redraw_count == 2
+    assert chunk.get_at((0, 0)) == next_frame.get_at((0, 0))
+    assert chunk.get_at((24, 24)) == next_frame.get_at((0, 0))
+    assert chunk.get_at((8, 0)) == static_before
+
+
+def test_static_map_has_no_animations():
+    manager = MapManager("assets/maps/player_house.tmx")
+
+    assert not manager.tile_animator.has_animations()
+    manager.update(1.0)
+    assert manager.lower_chunks.redraw_count == 0
@@ -0,0 +1,97 @@
+# ABOUTME: Tests for background preparation of warp destination maps
+# ABOUTME: Verifies destinations are collected, pre-rendered, and handed over once
+
+import os
+import time
+
+from src.overworld.map import MapManager
+from src.overworld.warp_prefetcher import WarpPrefetcher
+
+
+GROUND_TILESET = os.path.abspath("assets/maps/ground_compiled_8x8.png")
+
+
+def _write_map(tmp_path, name, objects="") -> str:
+    data = ",\n".join(",".join(["3"] * 8) for _ in range(8))
+    tmx = f"""<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="8" height="8" tilewidth="8" tileheight="8" infinite="0">
+ <tileset firstgid="1" name="ground" tilewidth="8" tileheight="8" tilecount="6" columns="6">
+  <image source="{GROUND_TILESET}" width="48" height="8"/>
+ </tileset>
+ <layer id="1" name="background" width="8" height="8">
+  <data encoding="csv">
+{data}
+  </data>
+ </layer>
+ <objectgroup id="2" name="objects">
+{objects}
+ </objectgroup>
+</map>
+"""
+    path = tmp_path / f"{name}.tmx"
+    path.write_text(tmx)
+    return str(path)
+
+
+def _warp(object_id, dest_map, dest_x, dest_y) -> str:
+    return f"""  <object id="{object_id}" type="warp" x="0" y="{object_id * 16}" width="16" height="16">
+   <properties>
+    <property name="dest_map" value="{dest_map}"/>
+    <property name="dest_x" value="{dest_x}"/>
+    <property name="dest_y" value="{dest_y}"/>
+   </properties>
+  </object>"""
+
+
+def _wait_until_ready(prefetcher, path):
+    deadline = time.time() + 5
+    while not prefetcher.loader.is_ready(path) and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_prefetcher_prepares_each_destination_once(tmp_path):
+    town = _write_map(tmp_path, "town", _warp(1, "house", 1, 1) + _warp(2, "house", 2, 2))
+    house = _write_map(tmp_path, "house", _warp(1, "town", 0, 0))
+    prefetcher = WarpPrefetcher(lambda name: str(tmp_path / f"{name}.tmx"))
+
+    assert prefetcher.prefetch_from(MapManager(town)) == [house]
+
+    _wait_until_ready(prefetcher, house)
+    prepared = prefetcher.take(house)
+    assert isinstance(prepared, MapManager)
+    assert prepared.map_filepath == house
+    # The spawn view was rendered on the worker
+    assert prepared.lower_chunks.cached_keys() == [(0, 0)]
+    assert prefetcher.take(house) is None
+
+
+def test_prefetcher_drops_destinations_no_longer_reachable(tmp_path):
+    town = _write_map(tmp_path, "town", _warp(1, "house", 1, 1))
+    house = _write_map(tmp_path, "house")
+    cave = _write_map(tmp_path, "cave", _warp(1, "town", 0, 0))
+    prefetcher = WarpPrefetcher(lambda name: str(tmp_path / f"{name}.tmx"))
+
+    prefetcher.prefetch_from(MapManager(town))
+    prefetcher.prefetch_from(MapManager(cave))
+
+    assert prefetcher.loader.pending_paths() == [town]
+    assert prefetcher.take(house) is None
+
+
+def test_take_does_not_wait_for_an_unfinished_prefetch(tmp_path):
+    class HeldLoader:
+        """Loader whose map never finishes while the test runs."""
+        discarded = []
+
+        def take(self, path, wait=False):
+            assert not wait
+            return None
+
+        def discard(self, path):
+            self.discarded.append(path)
+
+    prefetcher = WarpPrefetcher(lambda name: str(tmp_path / f"{name}.tmx"), loader=HeldLoader())
+
+    assert prefetcher.take("house.tmx") is None
+    # Dropped, so the caller's synchronous load is the only copy
+    assert prefetcher.loader.discarded == ["house.tmx"]